@@ -3,18 +3,24 @@ from sqlalchemy.orm import Session
 
 from app.schemas.users import LoginResponse, UUIDLoginRequest
 from app.services.user import get_user_by_uuid
-from app.services.auth import create_access_token
+from app.services.auth import auth_rate_limit, create_access_token
 from app.core.database import get_db
 
 router = APIRouter()
 
 
-@router.post("/token", response_model=LoginResponse, tags=["Authentication"])
+@router.post(
+    "/token",
+    response_model=LoginResponse,
+    tags=["Authentication"],
+    dependencies=[Depends(auth_rate_limit)],
+)
 def login_for_access_token(
     login_request: UUIDLoginRequest, db: Session = Depends(get_db)
 ):
     """
     사용자 UUID를 받아 인증하고 JWT와 사용자 정보를 함께 발급합니다.
+    클라이언트 IP별로 요청 수가 제한되며, 초과하면 429를 반환합니다.
     """
     user = get_user_by_uuid(db, uuid=login_request.uuid)
 
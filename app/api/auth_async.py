@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.users import LoginResponse, UUIDLoginRequest
+from app.services.user_async import get_user_by_uuid
+from app.services.auth import auth_rate_limit, create_access_token
+from app.core.database import get_async_db
+
+router = APIRouter()
+
+
+@router.post(
+    "/token",
+    response_model=LoginResponse,
+    tags=["Authentication"],
+    dependencies=[Depends(auth_rate_limit)],
+)
+async def login_for_access_token(
+    login_request: UUIDLoginRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    사용자 UUID를 받아 인증하고 JWT와 사용자 정보를 함께 발급합니다.
+    클라이언트 IP별로 요청 수가 제한되며, 초과하면 429를 반환합니다.
+    """
+    user = await get_user_by_uuid(db, uuid=login_request.uuid)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 UUID를 가진 사용자가 없습니다.",
+        )
+
+    access_token = create_access_token(data={"sub": user.uuid})
+
+    return LoginResponse(
+        accessToken=access_token,
+        tokenType="bearer",
+        id=user.id,
+        nickname=user.nickname,
+    )
@@ -0,0 +1,27 @@
+from fastapi import Depends
+
+from app.core.database import open_async_read_session, open_read_session
+from app.models.models import User
+from app.services.auth import get_current_user, get_current_user_async
+
+
+def get_read_db(current_user: User = Depends(get_current_user)):
+    """
+    읽기 전용 엔드포인트용 세션입니다. 복제본이 설정되어 있으면 복제본으로 보내고,
+    방금 지원 내역을 수정한 사용자는 잠시 primary에서 읽습니다.
+    """
+    db = open_read_session(current_user.id)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_read_db_async(
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    get_read_db의 async 버전입니다. (DB_MODE=async)
+    """
+    async with await open_async_read_session(current_user.id) as db:
+        yield db
@@ -0,0 +1,43 @@
+import secrets
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security.utils import get_authorization_scheme_param
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY
+from app.services.auth import api_key_scheme
+
+router = APIRouter()
+
+
+def verify_metrics_token(authorization: str | None = Depends(api_key_scheme)) -> None:
+    """
+    METRICS_TOKEN이 없으면 엔드포인트가 없는 것처럼 404를, 토큰이 다르면 401을 반환합니다.
+    """
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    scheme, token = get_authorization_scheme_param(authorization)
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        token.encode(), settings.metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(verify_metrics_token)],
+)
+async def read_metrics():
+    """
+    모든 워커의 메트릭을 합쳐 Prometheus 텍스트 형식으로 반환합니다.
+    수집기는 METRICS_TOKEN을 Bearer 토큰으로 보냅니다.
+    """
+    content = await run_in_threadpool(REGISTRY.render)
+    return PlainTextResponse(content, media_type="text/plain; version=0.0.4")
@@ -1,19 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from typing import List
 
+from app.api.deps import get_read_db
 from app.core.database import get_db
+from app.core.responses import cached_json_response
 from app.models.models import User
 from app.schemas.universities import (
-    ApplicantDetail,
+    MyRankResponse,
     PartnerUniversityInfo,
     UniversityDetailResponse,
 )
+from app.services.applicant_stream import applicant_count_hub
 from app.services.auth import get_current_user
 import app.services.university as university_service
 
 router = APIRouter()
 
+# 상세 조회 시 한 번에 반환할 수 있는 최대 지원자 수
+MAX_APPLICANTS_PAGE_SIZE = 500
+
 
 @router.get(
     "",
@@ -21,25 +29,45 @@ router = APIRouter()
     tags=["Universities"],
 )
 def read_universities(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     인증된 사용자를 위해 모든 파트너 대학교 목록을
     (이름, 국가, 모집인원, 현재 지원자 수)와 함께 반환합니다.
+    미리 직렬화된 응답을 캐시하며, If-None-Match가 일치하면 304를 반환합니다.
+    """
+    payload = university_service.get_universities_payload(
+        db, user_id=current_user.id
+    )
+    return cached_json_response(request, payload)
+
+
+@router.get("/stream", tags=["Universities"])
+async def stream_applicant_counts(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
     """
-    universities_data = university_service.get_universities_with_applicant_count(db)
-
-    return [
-        PartnerUniversityInfo(
-            id=uni.id,
-            name=uni.name,
-            country=uni.country,
-            slot=uni.slot,
-            applicantCount=uni.applicant_count,
+    대학별 지원자 수 변화를 Server-Sent Events로 전달합니다.
+    연결 직후와 주기적으로 전체 값(event: snapshot)을,
+    그 사이에는 짧은 간격으로 합쳐진 증감량(event: delta)을 {대학ID: 값} 형태로 보냅니다.
+    """
+    # 인증에 사용한 커넥션을 스트림이 끝날 때까지 잡고 있지 않도록 반납합니다.
+    await run_in_threadpool(db.close)
+
+    if applicant_count_hub.is_full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="실시간 구독자가 너무 많습니다. 잠시 후 다시 시도해 주세요.",
         )
-        for uni in universities_data
-    ]
+
+    return StreamingResponse(
+        applicant_count_hub.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -47,16 +75,25 @@ def read_universities(
     response_model=UniversityDetailResponse,
 )
 def read_university_details(
+    request: Request,
     university_id: int,
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=MAX_APPLICANTS_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     특정 학교(university_id)의 상세 정보와
     지원자 목록을 함께 반환합니다.
+    limit/offset을 주면 지원자 목록을 페이지 단위로 반환하며,
+    rank와 totalApplicants는 페이지와 관계없이 전체 지원자 기준입니다.
+    미리 직렬화/압축된 응답을 잠시 캐시하며, If-None-Match가 일치하면 304를 반환합니다.
+    같은 학교/페이지를 동시에 조회하는 요청들은 DB 조회 하나를 함께 씁니다.
     """
-    university = university_service.get_university(db, university_id=university_id)
-    if not university:
+    payload = university_service.get_university_detail_payload(
+        db, university_id=university_id, limit=limit, offset=offset
+    )
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 대학교를 찾을 수 없습니다.",
@@ -72,27 +109,38 @@ def read_university_details(
     #         detail="해당 대학교에 지원하지 않은 사용자는 상세 정보를 조회할 수 없습니다.",
     #     )
 
-    applicants_data = university_service.get_applicants_for_university(
-        db, university_id=university_id
-    )
+    return cached_json_response(request, payload)
+
 
-    applicant_list = []
-    for rank, applicant in enumerate(applicants_data, 1):
-        applicant_list.append(
-            ApplicantDetail(
-                id=applicant.id,
-                rank=rank,
-                choice=applicant.choice,
-                nickname=applicant.nickname,
-                grade=applicant.grade,
-                lang=applicant.lang,
-            )
+@router.get(
+    "/{university_id}/me",
+    response_model=MyRankResponse,
+)
+def read_my_rank(
+    university_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    특정 학교에서 현재 사용자의 순위를 지원자 목록 전체를 받지 않고 조회합니다.
+    """
+    my_rank = university_service.get_user_rank_for_university(
+        db,
+        university_id=university_id,
+        user_id=current_user.id,
+        grade=current_user.grade,
+    )
+    if my_rank is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 대학교에 지원한 내역이 없습니다.",
         )
 
-    return UniversityDetailResponse(
-        name=university.name,
-        country=university.country,
-        slot=university.slot,
-        totalApplicants=len(applicant_list),
-        applicants=applicant_list,
+    return MyRankResponse(
+        universityId=university_id,
+        choice=my_rank.choice,
+        grade=my_rank.grade,
+        rank=my_rank.rank,
+        slot=my_rank.slot,
+        totalApplicants=my_rank.applicant_count,
     )
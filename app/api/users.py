@@ -1,68 +1,62 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.schemas.applications import ApplicationDetail
+from app.core.config import settings
+from app.core.group_commit import GroupCommitQueueFullError
+from app.core.responses import fast_json_response
 from app.schemas.base import BaseResponse
+from app.schemas.standings import StandingsResponse
 from app.schemas.users import (
     PublicUserResponse,
+    PublicUsersRequest,
     UpdateApplicationsRequest,
     UserResponse,
 )
 import app.services.user as user_service
 from app.models import models
+from app.api.deps import get_read_db
 from app.core.database import get_db
-from app.services.auth import get_current_user
+from app.services.auth import get_current_user, invalidate_cached_user
 import app.services.university as university_service
+import app.services.standings as standings_service
+import app.services.application_writes as application_writes
+
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
 def read_me(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     현재 로그인된 사용자의 상세 정보와 지원 목록을 함께 조회합니다.
     """
-    db_user = user_service.get_user_with_applications(db, user_id=current_user.id)
+    db_user = user_service.get_user_applications(
+        db, user_id=current_user.id, viewer_id=current_user.id
+    )
 
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="유저를 찾을 수 없습니다."
         )
 
-    university_ids = [app.university.id for app in db_user.applications]
+    return fast_json_response(user_service.user_content(db_user), UserResponse)
 
-    applicant_counts = {}
-    if university_ids:
-        applicant_counts = university_service.get_applicant_counts_for_universities(
-            db, university_ids=university_ids
-        )
 
-    applications_details = []
-    for app in db_user.applications:
-        university_id = app.university.id
-        applications_details.append(
-            ApplicationDetail(
-                choice=app.choice,
-                universityId=app.university.id,
-                universityName=app.university.name,
-                country=app.university.country,
-                slot=app.university.slot,
-                totalApplicants=applicant_counts.get(university_id, 0),
-            )
-        )
-
-    return UserResponse(
-        id=db_user.id,
-        email=db_user.email,
-        nickname=db_user.nickname,
-        grade=db_user.grade,
-        lang=db_user.lang,
-        modifyCount=db_user.modify_count,
-        applications=applications_details,
-    )
+@router.get("/me/standings", response_model=StandingsResponse)
+def read_my_standings(
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    내 지망별 순위와 커트라인, 1지망부터 차례로 배정했을 때의 예상 합격 학교를 조회합니다.
+    """
+    return standings_service.get_user_standings(db, current_user)
 
 
 @router.put("/me/applications", response_model=BaseResponse)
@@ -72,70 +66,108 @@ def update_my_applications(
     current_user: models.User = Depends(get_current_user),
 ):
     try:
-        user_service.update_user_applications(
-            db=db, user=current_user, new_applications=request.applications
+        if settings.application_write_pipeline:
+            pending = user_service.check_application_update(
+                db, current_user, request.applications
+            )
+            # 배치 반영을 기다리는 동안 요청의 커넥션을 잡고 있지 않도록 먼저 반납합니다.
+            db.close()
+            changes = application_writes.submit_application_update(pending)
+        else:
+            changes = user_service.update_user_applications(
+                db=db, user=current_user, new_applications=request.applications
+            )
+            db.commit()
+    except user_service.ApplicationConflictError:
+        # 롤백하면 current_user가 만료되므로 uuid를 먼저 읽어 둡니다.
+        user_uuid = current_user.uuid
+        db.rollback()
+        # 캐시된 modify_count가 오래된 값일 수 있으므로 다음 요청에서 다시 읽게 합니다.
+        invalidate_cached_user(user_uuid)
+        user_service.application_updates.labels("conflict").inc()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="다른 요청에서 지원 내역이 먼저 수정되었습니다. 다시 시도해 주세요.",
+        )
+    except GroupCommitQueueFullError:
+        user_service.application_updates.labels("rejected").inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.",
         )
-        db.commit()
-
-        return BaseResponse(status=True, detail="성공적으로 수정되었습니다.")
-
     except ValueError as e:
         db.rollback()
+        user_service.application_updates.labels("validation_error").inc()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
         db.rollback()
+        user_service.application_updates.labels("error").inc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while updating applications.",
         )
 
+    # 이미 커밋된 수정이므로 이후 작업이 실패해도 롤백하거나 응답을 바꾸지 않습니다.
+    # (커밋 이후에 무효화해야 다른 요청이 이전 modify_count를 다시 캐시하지 않습니다.)
+    try:
+        invalidate_cached_user(current_user.uuid)
+        university_service.invalidate_universities_payload()
+        user_service.publish_application_update(
+            current_user, request.applications, changes
+        )
+    except Exception:
+        logger.exception("post-commit work failed after updating applications")
+    user_service.application_updates.labels("success").inc()
+
+    return BaseResponse(status=True, detail="성공적으로 수정되었습니다.")
+
+
+@router.post("/batch", response_model=list[PublicUserResponse])
+def read_users_batch(
+    request: PublicUsersRequest,
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    여러 사용자의 공개 프로필과 지원 목록을 한 번에 조회합니다.
+    요청한 순서대로 반환하며, 존재하지 않는 사용자는 제외됩니다.
+    """
+    users = user_service.get_users_applications(
+        db, user_ids=request.userIds, viewer_id=current_user.id
+    )
+
+    return fast_json_response(
+        [
+            user_service.public_user_content(db_user)
+            for user_id in dict.fromkeys(request.userIds)
+            if (db_user := users.get(user_id)) is not None
+        ],
+        list[PublicUserResponse],
+    )
+
 
 @router.get("/{user_id}", response_model=PublicUserResponse)
 def read_user_by_id(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     특정 사용자(user_id)의 공개 프로필과 지원 목록을 조회합니다.
     (이메일, 수정횟수, 생성일 등 민감 정보는 제외됩니다.)
     """
-    db_user = user_service.get_user_with_applications(db, user_id=user_id)
+    db_user = user_service.get_user_applications(
+        db, user_id=user_id, viewer_id=current_user.id
+    )
 
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="유저를 찾을 수 없습니다."
         )
 
-    university_ids = [app.university.id for app in db_user.applications]
-
-    applicant_counts = {}
-    if university_ids:
-        applicant_counts = university_service.get_applicant_counts_for_universities(
-            db, university_ids=university_ids
-        )
-
-    applications_details = []
-    for app in db_user.applications:
-        university_id = app.university.id
-        applications_details.append(
-            ApplicationDetail(
-                choice=app.choice,
-                universityId=app.university.id,
-                universityName=app.university.name,
-                country=app.university.country,
-                slot=app.university.slot,
-                totalApplicants=applicant_counts.get(university_id, 0),
-            )
-        )
-
-    return PublicUserResponse(
-        id=db_user.id,
-        nickname=db_user.nickname,
-        grade=db_user.grade,
-        lang=db_user.lang,
-        applications=applications_details,
+    return fast_json_response(
+        user_service.public_user_content(db_user), PublicUserResponse
     )
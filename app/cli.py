@@ -0,0 +1,126 @@
+"""
+운영용 명령줄 도구입니다.
+
+    uv run python -m app.cli reconcile-counts [--dry-run]
+    uv run python -m app.cli import-universities universities.csv [--dry-run]
+    uv run python -m app.cli export-applications --format jsonl --output applications.jsonl
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from app.core.database import SessionLocal, init_engines
+import app.services.bulk as bulk_service
+import app.services.university as university_service
+
+
+def reconcile_counts(args: argparse.Namespace) -> int:
+    """
+    applicant_count 카운터를 application 테이블 기준으로 재계산합니다.
+    어긋난 값이 있으면 종료 코드 1을 반환하므로 주기적인 정합성 검사에 쓸 수 있습니다.
+    """
+    with SessionLocal() as db:
+        drift = university_service.reconcile_applicant_counts(db)
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+
+    for university_id, (stored, actual) in sorted(drift.items()):
+        print(f"university {university_id}: stored={stored} actual={actual}")
+    print(f"{len(drift)} universities drifted{' (dry run)' if args.dry_run else ''}")
+    return 1 if drift else 0
+
+
+def _format(args: argparse.Namespace, path: str | None) -> str:
+    if args.format:
+        return args.format
+    suffix = Path(path).suffix.lstrip(".") if path else ""
+    return suffix if suffix in bulk_service.FORMATS else "csv"
+
+
+def import_universities(args: argparse.Namespace) -> int:
+    """
+    CSV/JSONL 파일의 파트너 대학을 id 기준으로 추가하거나 갱신합니다.
+    전체가 한 트랜잭션이므로 잘못된 행이 있으면 아무것도 바뀌지 않습니다.
+    실행 중인 서버의 대학 카탈로그는 UNIVERSITY_CATALOG_CHECK_SECONDS 안에,
+    대학 목록 캐시는 UNIVERSITY_LIST_CACHE_TTL_SECONDS 안에 반영됩니다.
+    """
+    started = time.perf_counter()
+    with open(args.path, newline="", encoding="utf-8-sig") as file, SessionLocal() as db:
+        records = bulk_service.read_university_records(file, _format(args, args.path))
+        try:
+            count = bulk_service.upsert_universities(db, records, args.chunk_size)
+            university_service.bump_catalog_version(db)
+        except ValueError as e:
+            db.rollback()
+            print(e, file=sys.stderr)
+            return 1
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+
+    print(
+        f"{count} universities upserted in {time.perf_counter() - started:.2f}s"
+        f"{' (dry run)' if args.dry_run else ''}"
+    )
+    return 0
+
+
+def export_applications(args: argparse.Namespace) -> int:
+    """
+    지원 현황(대학, 지망, 사용자 학점)을 CSV/JSONL로 내보냅니다. --output이 없으면 표준 출력으로 씁니다.
+    """
+    fmt = _format(args, args.output)
+    output = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    started = time.perf_counter()
+    try:
+        with SessionLocal() as db:
+            for chunk in bulk_service.iter_applications_export(db, fmt, args.chunk_size):
+                output.write(chunk)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    # 데이터가 표준 출력으로 나갈 수 있으므로 진행 정보는 표준 에러로 씁니다.
+    print(f"exported in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = subparsers.add_parser(
+        "reconcile-counts", help="지원자 수 카운터 재계산 및 drift 리포트"
+    )
+    reconcile.add_argument("--dry-run", action="store_true", help="수정하지 않고 리포트만")
+    reconcile.set_defaults(func=reconcile_counts)
+
+    importer = subparsers.add_parser(
+        "import-universities", help="CSV/JSONL 파일로 파트너 대학 일괄 등록 (id 기준 upsert)"
+    )
+    importer.add_argument("path", help="id,name,country,slot,duration 열을 가진 파일")
+    importer.add_argument("--format", choices=bulk_service.FORMATS, help="생략 시 확장자로 판단")
+    importer.add_argument("--chunk-size", type=int, default=bulk_service.DEFAULT_CHUNK_SIZE)
+    importer.add_argument("--dry-run", action="store_true", help="검증과 upsert 후 롤백")
+    importer.set_defaults(func=import_universities)
+
+    exporter = subparsers.add_parser(
+        "export-applications", help="지원 현황을 CSV/JSONL로 내보내기 (심사용)"
+    )
+    exporter.add_argument("--output", help="출력 파일 (생략 시 표준 출력)")
+    exporter.add_argument("--format", choices=bulk_service.FORMATS, help="생략 시 확장자로 판단")
+    exporter.add_argument("--chunk-size", type=int, default=bulk_service.DEFAULT_CHUNK_SIZE)
+    exporter.set_defaults(func=export_applications)
+
+    args = parser.parse_args(argv)
+    init_engines()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
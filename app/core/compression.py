@@ -0,0 +1,204 @@
+"""
+응답 압축(Content-Encoding)입니다.
+
+- 인코딩: zstd(zstandard), br(brotli), gzip(표준 라이브러리). zstd/br은 패키지가 설치된 경우에만 사용합니다.
+  (uv sync --extra compression)
+- Accept-Encoding의 q 값으로 협상하고, q 값이 같으면 COMPRESSION_ENCODINGS 순서(서버 선호)를 따릅니다.
+- CompressionMiddleware는 요청마다 압축하므로 빠른 압축 수준을 사용합니다. 이벤트 루프에서 압축하며,
+  COMPRESSION_THREAD_SIZE 이상인 본문만 스레드풀에서 압축합니다. (작은 본문은 스레드 전환 비용이 더 큽니다.)
+- 캐시되는 응답(app.core.responses.CachedPayload)은 만들 때 precompress로 한 번만, 더 높은 수준으로
+  압축해 둡니다. 미들웨어는 Content-Encoding이 이미 있는 응답을 다시 압축하지 않습니다.
+"""
+
+import gzip
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 인코딩별 (요청마다 압축할 때, 캐시용으로 미리 압축할 때) 압축 수준
+# 미리 압축하는 수준도 캐시가 다시 채워질 때마다 비용이 드므로 최고 수준(br 11, zstd 19)은 쓰지 않습니다.
+LEVELS = {
+    "zstd": (3, 10),
+    "br": (4, 9),
+    "gzip": (6, 9),
+}
+
+
+def _gzip(body: bytes, level: int) -> bytes:
+    # mtime을 고정해야 같은 본문이 항상 같은 바이트로 압축됩니다.
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _brotli(body: bytes, level: int) -> bytes:
+    return brotli.compress(body, quality=level)
+
+
+def _zstd(body: bytes, level: int) -> bytes:
+    # ZstdCompressor는 스레드 간에 공유할 수 없으므로 호출마다 만듭니다.
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+_COMPRESSORS: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    _COMPRESSORS["br"] = _brotli
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = _zstd
+
+
+def available_encodings(preferred: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    preferred 중 이 환경에서 사용할 수 있는 인코딩만 순서대로 반환합니다.
+    """
+    return tuple(encoding for encoding in preferred if encoding in _COMPRESSORS)
+
+
+ENCODINGS = available_encodings(settings.compression_encodings)
+
+
+def negotiate(
+    accept_encoding: str | None, encodings: tuple[str, ...] = ENCODINGS
+) -> str | None:
+    """
+    Accept-Encoding에 맞는 인코딩을 고릅니다. 맞는 것이 없으면 None(압축하지 않음)입니다.
+    """
+    if not accept_encoding or not encodings:
+        return None
+
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+
+    default = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, precompressed: bool = False) -> bytes:
+    return _COMPRESSORS[encoding](body, LEVELS[encoding][1 if precompressed else 0])
+
+
+def precompress(
+    body: bytes,
+    encodings: tuple[str, ...] = ENCODINGS,
+    minimum_size: int = settings.compression_minimum_size,
+) -> dict[str, bytes]:
+    """
+    캐시할 본문을 사용할 수 있는 모든 인코딩으로 미리 압축합니다. (작은 본문은 압축하지 않습니다.)
+    """
+    if len(body) < minimum_size:
+        return {}
+    return {encoding: compress(body, encoding, precompressed=True) for encoding in encodings}
+
+
+def add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def _compressible(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type == "application/json"
+        or media_type.endswith("+json")
+    )
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 맞춰 minimum_size 이상인 JSON/텍스트 응답 본문을 압축합니다.
+    본문이 한 번에 오는 응답만 압축하며, 스트리밍 응답(SSE 등)과 이미 Content-Encoding이 있는
+    응답(미리 압축된 캐시 응답)은 그대로 보냅니다. thread_size 이상인 본문은 스레드풀에서 압축합니다.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int,
+        thread_size: int = settings.compression_thread_size,
+        encodings: tuple[str, ...] = ENCODINGS,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_size = thread_size
+        self.encodings = encodings
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        start_message = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                # 본문을 보고 압축 여부를 정해야 하므로 헤더는 첫 본문과 함께 보냅니다.
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            if (
+                _compressible(headers.get("content-type"))
+                and "content-encoding" not in headers
+            ):
+                add_vary_accept_encoding(headers)
+                body = message.get("body", b"")
+                if (
+                    encoding is not None
+                    and not message.get("more_body", False)
+                    and len(body) >= self.minimum_size
+                ):
+                    if len(body) >= self.thread_size:
+                        body = await run_in_threadpool(compress, body, encoding)
+                    else:
+                        body = compress(body, encoding)
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(body))
+                    message = {**message, "body": body}
+
+            await send(start_message)
+            start_message = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
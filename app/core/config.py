@@ -0,0 +1,225 @@
+"""
+환경 변수(.env 포함)에서 읽는 설정입니다.
+
+프로세스마다 한 번만 읽어 settings 하나로 제공합니다. 다른 모듈에서 os.getenv를 직접 부르지 말고
+이 객체를 사용합니다.
+"""
+
+import os
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+
+def _env_str(name: str, default: str | None = None) -> str | None:
+    return os.getenv(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def _env_list(name: str, default: tuple[str, ...] = ()) -> tuple[str, ...]:
+    """
+    쉼표로 구분된 값을 읽습니다. 설정하지 않았으면 default, 빈 값이면 빈 튜플입니다.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
+    secret_key: str | None
+
+    # "sync": pymysql + def 엔드포인트 / "async": aiomysql + async def 엔드포인트
+    db_mode: str
+    database_url: str
+    async_database_url: str
+
+    # 읽기 전용 복제본 URL (쉼표로 구분, 비어 있으면 모든 요청이 primary를 사용)
+    replica_database_urls: tuple[str, ...]
+    async_replica_database_urls: tuple[str, ...]
+    # 쓰기 후 primary에서 읽는 시간 (복제 지연보다 길어야 합니다)
+    replica_sticky_seconds: float
+    # 연결에 실패한 복제본을 다시 시도하기까지의 시간
+    replica_retry_seconds: float
+
+    # 커넥션 풀 설정 (워커 프로세스 하나당 적용됩니다)
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout: float
+    # MySQL wait_timeout보다 짧게 두어야 끊긴 커넥션을 재사용하지 않습니다.
+    db_pool_recycle: int
+    db_pool_pre_ping: bool
+
+    # 인증 토큰 캐시 (워커별 인메모리)
+    auth_cache_maxsize: int
+    auth_cache_ttl_seconds: float
+
+    # GET /universities, GET /universities/{id} 응답 캐시 (워커 간 최대 지연 시간, 0이면 캐시하지 않음)
+    university_list_cache_ttl_seconds: float
+    university_detail_cache_ttl_seconds: float
+
+    # 응답 압축: 서버 선호 순서의 인코딩(zstd, br, gzip)과 압축할 최소 본문 크기(바이트)
+    # zstd/br은 zstandard/brotli 패키지가 있을 때만 사용하며, 빈 값이면 압축하지 않습니다.
+    # compression_thread_size 이상인 본문은 이벤트 루프를 막지 않도록 스레드풀에서 압축합니다.
+    compression_encodings: tuple[str, ...]
+    compression_minimum_size: int
+    compression_thread_size: int
+
+    # true이면 dict로 바로 직렬화하는 응답도 스키마(response_model)로 검증합니다. (테스트/개발용)
+    validate_responses: bool
+
+    # 이 시간(ms)을 넘는 요청은 SQL 통계와 함께 WARNING 로그로 남깁니다.
+    slow_request_ms: float
+
+    # GET /metrics: 워커별 값 파일(mmap)을 두는 디렉터리(빈 값이면 워커 내부 값만)와
+    # 커넥션 풀/토큰 캐시 통계를 옮겨 쓰는 주기
+    metrics_dir: str
+    metrics_collect_seconds: float
+    # GET /metrics는 Authorization: Bearer <metrics_token>일 때만 응답합니다. (빈 값이면 404)
+    metrics_token: str
+
+    # 지원자 수 실시간 스트림 (GET /universities/stream)
+    # event_broker: "memory"(워커 내부만) | "local-socket"(같은 호스트의 워커 간 전파)
+    event_broker: str
+    event_broker_dir: str
+    stream_coalesce_seconds: float
+    stream_snapshot_seconds: float
+    stream_max_subscribers: int
+
+    # 워커별 대학 카탈로그가 DB의 university_catalog_version을 확인하는 주기
+    university_catalog_check_seconds: float
+
+    # 합격 예측(GET /users/me/standings) 전체 재계산 주기
+    # 변경은 이벤트로 증분 반영되며, 유실된 이벤트는 이 주기 안에 DB 기준으로 맞춰집니다.
+    standings_max_age_seconds: float
+
+    # 요청 제한 (토큰 버킷)
+    # rate_limit_store: "memory"(워커별) | "sqlite"(같은 호스트의 워커 간 공유, rate_limit_sqlite_path)
+    rate_limit_store: str
+    rate_limit_sqlite_path: str
+    # POST /auth/token: 클라이언트 IP당 최대 연속 요청 수와 초당 회복량 (capacity=0이면 제한 없음)
+    # 학교 NAT처럼 여러 사용자가 IP 하나를 함께 쓰는 경우를 고려해 넉넉하게 둡니다.
+    auth_rate_limit_capacity: float
+    auth_rate_limit_refill_per_second: float
+    # X-Forwarded-For를 믿을 리버스 프록시 주소 (IP 또는 CIDR, 쉼표로 구분, 비어 있으면 직접 연결한 IP 사용)
+    trusted_proxies: tuple[str, ...]
+
+    # PUT /users/me/applications 그룹 커밋 파이프라인 (app.core.group_commit)
+    # 켜면 검증을 마친 수정 요청을 워커별 큐에 모아 최대 batch_size개씩, 첫 요청 뒤 최대 batch_wait_ms만큼
+    # 기다렸다가 한 트랜잭션으로 반영합니다. 큐에 queue_max개가 쌓여 있으면 503으로 거절합니다.
+    # db_mode=sync에서는 기다리는 요청마다 스레드풀 스레드(AnyIO 기본 워커당 40개)를 잡으므로 그 수가 실제 상한입니다.
+    application_write_pipeline: bool
+    application_write_batch_size: int
+    application_write_batch_wait_ms: float
+    application_write_queue_max: int
+
+    # 워커 간 공유 스냅샷 (app.services.applicant_snapshot, 기본값인 빈 경로면 사용하지 않음)
+    # 워커 하나가 refresh_seconds마다 대학별 지원자 수(grades=true이면 대학별 학점 정렬 배열도)를 파일에 쓰고,
+    # 조회 API는 만든 지 max_age_seconds가 지나지 않은 스냅샷을 DB 대신 읽습니다.
+    # 다른 사용자의 수정은 최대 max_age_seconds 늦게 보입니다. 자신의 수정은 바로 보이려면 수정 이벤트가
+    # 모든 워커에 전달되어야 하므로 여러 워커에서는 event_broker=local-socket과 함께 켭니다.
+    shared_snapshot_path: str
+    shared_snapshot_refresh_seconds: float
+    shared_snapshot_max_age_seconds: float
+    shared_snapshot_grades: bool
+
+    @property
+    def pool_options(self) -> dict:
+        return {
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+        }
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        load_dotenv()
+        mysql = (
+            f"{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}"
+            f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DB')}"
+        )
+        return cls(
+            secret_key=_env_str("SECRET_KEY"),
+            db_mode=_env_str("DB_MODE", "sync"),
+            database_url=_env_str("DATABASE_URL") or f"mysql+pymysql://{mysql}",
+            async_database_url=_env_str("ASYNC_DATABASE_URL") or f"mysql+aiomysql://{mysql}",
+            replica_database_urls=_env_list("REPLICA_DATABASE_URLS"),
+            async_replica_database_urls=_env_list("ASYNC_REPLICA_DATABASE_URLS"),
+            replica_sticky_seconds=_env_float("REPLICA_STICKY_SECONDS", 5),
+            replica_retry_seconds=_env_float("REPLICA_RETRY_SECONDS", 30),
+            db_pool_size=_env_int("DB_POOL_SIZE", 5),
+            db_max_overflow=_env_int("DB_MAX_OVERFLOW", 10),
+            db_pool_timeout=_env_float("DB_POOL_TIMEOUT", 30),
+            db_pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+            db_pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+            auth_cache_maxsize=_env_int("AUTH_CACHE_MAXSIZE", 10000),
+            auth_cache_ttl_seconds=_env_float("AUTH_CACHE_TTL_SECONDS", 60),
+            university_list_cache_ttl_seconds=_env_float(
+                "UNIVERSITY_LIST_CACHE_TTL_SECONDS", 5
+            ),
+            university_detail_cache_ttl_seconds=_env_float(
+                "UNIVERSITY_DETAIL_CACHE_TTL_SECONDS", 5
+            ),
+            compression_encodings=_env_list(
+                "COMPRESSION_ENCODINGS", ("zstd", "br", "gzip")
+            ),
+            compression_minimum_size=_env_int("COMPRESSION_MINIMUM_SIZE", 1024),
+            compression_thread_size=_env_int("COMPRESSION_THREAD_SIZE", 64 * 1024),
+            validate_responses=_env_bool("VALIDATE_RESPONSES", False),
+            slow_request_ms=_env_float("SLOW_REQUEST_MS", 500),
+            metrics_dir=_env_str("METRICS_DIR", "/tmp/knu-metrics"),
+            metrics_collect_seconds=_env_float("METRICS_COLLECT_SECONDS", 5),
+            metrics_token=_env_str("METRICS_TOKEN", ""),
+            event_broker=_env_str("EVENT_BROKER", "memory"),
+            event_broker_dir=_env_str("EVENT_BROKER_DIR", "/tmp/knu-events"),
+            stream_coalesce_seconds=_env_float("STREAM_COALESCE_SECONDS", 0.5),
+            stream_snapshot_seconds=_env_float("STREAM_SNAPSHOT_SECONDS", 15),
+            stream_max_subscribers=_env_int("STREAM_MAX_SUBSCRIBERS", 1000),
+            university_catalog_check_seconds=_env_float(
+                "UNIVERSITY_CATALOG_CHECK_SECONDS", 30
+            ),
+            standings_max_age_seconds=_env_float("STANDINGS_MAX_AGE_SECONDS", 300),
+            rate_limit_store=_env_str("RATE_LIMIT_STORE", "memory"),
+            rate_limit_sqlite_path=_env_str(
+                "RATE_LIMIT_SQLITE_PATH", "/tmp/knu-rate-limit.sqlite3"
+            ),
+            auth_rate_limit_capacity=_env_float("AUTH_RATE_LIMIT_CAPACITY", 60),
+            auth_rate_limit_refill_per_second=_env_float(
+                "AUTH_RATE_LIMIT_REFILL_PER_SECOND", 2
+            ),
+            trusted_proxies=_env_list("TRUSTED_PROXIES"),
+            application_write_pipeline=_env_bool("APPLICATION_WRITE_PIPELINE", False),
+            application_write_batch_size=_env_int("APPLICATION_WRITE_BATCH_SIZE", 50),
+            application_write_batch_wait_ms=_env_float(
+                "APPLICATION_WRITE_BATCH_WAIT_MS", 5
+            ),
+            application_write_queue_max=_env_int("APPLICATION_WRITE_QUEUE_MAX", 1000),
+            shared_snapshot_path=_env_str("SHARED_SNAPSHOT_PATH", ""),
+            shared_snapshot_refresh_seconds=_env_float(
+                "SHARED_SNAPSHOT_REFRESH_SECONDS", 1
+            ),
+            shared_snapshot_max_age_seconds=_env_float(
+                "SHARED_SNAPSHOT_MAX_AGE_SECONDS", 5
+            ),
+            shared_snapshot_grades=_env_bool("SHARED_SNAPSHOT_GRADES", False),
+        )
+
+
+settings = Settings.from_env()
@@ -1,28 +1,218 @@
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from dotenv import load_dotenv
+import logging
+import threading
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
-load_dotenv()
+from app.core.config import settings
+from app.core.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    pool_stats,
+    record_pool_metrics,
+)
+from app.core.events import broker
+from app.core.metrics import REGISTRY
+from app.core.query_stats import install_query_hooks
+from app.core.replicas import ReplicaRouter
 
-MYSQL_USER = os.getenv("MYSQL_USER")
-MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
-MYSQL_HOST = os.getenv("MYSQL_HOST")
-MYSQL_PORT = os.getenv("MYSQL_PORT")
-MYSQL_DB = os.getenv("MYSQL_DB")
+logger = logging.getLogger(__name__)
 
+Base = declarative_base()
 
-DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
+# 엔진은 import 시점이 아니라 init_engines()에서 만듭니다.
+# 앱은 lifespan 시작 시 호출하고, 세션 의존성(get_db 등)도 처음 사용할 때 호출하므로
+# 모델/서비스 모듈을 import 하는 것만으로는 DB 드라이버를 불러오거나 연결하지 않습니다.
+engine: Engine | None = None
+async_engine = None
+replica_engines = []
+async_replica_engines = []
+# 세션 팩토리는 미리 만들어 두고 init_engines()에서 엔진을 연결합니다.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = None
+ReplicaSessionLocals = []
+AsyncReplicaSessionLocals = []
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+replica_router = ReplicaRouter(
+    broker=broker,
+    sticky_seconds=settings.replica_sticky_seconds,
+    retry_seconds=settings.replica_retry_seconds,
+)
 
-Base = declarative_base()
+_init_lock = threading.Lock()
+
+
+def init_engines() -> None:
+    """
+    엔진과 세션 팩토리를 만듭니다. 여러 번 호출해도 한 번만 만들며, 연결은 처음 사용할 때 맺습니다.
+    """
+    global engine, async_engine, AsyncSessionLocal
+    if engine is not None:
+        return
+    with _init_lock:
+        if engine is not None:
+            return
+
+        sync_engine = create_engine(
+            settings.database_url, poolclass=InstrumentedQueuePool, **settings.pool_options
+        )
+        install_query_hooks(sync_engine)
+        SessionLocal.configure(bind=sync_engine)
+
+        if settings.db_mode == "async":
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+            async_engine = create_async_engine(
+                settings.async_database_url,
+                poolclass=InstrumentedAsyncAdaptedQueuePool,
+                **settings.pool_options,
+            )
+            install_query_hooks(async_engine.sync_engine)
+            # 커밋 후 속성 접근 시 암묵적 I/O가 일어나지 않도록 expire_on_commit=False
+            AsyncSessionLocal = async_sessionmaker(
+                bind=async_engine, autoflush=False, expire_on_commit=False
+            )
+
+            for url in settings.async_replica_database_urls:
+                replica_engine = create_async_engine(
+                    url, poolclass=InstrumentedAsyncAdaptedQueuePool, **settings.pool_options
+                )
+                install_query_hooks(replica_engine.sync_engine)
+                async_replica_engines.append(replica_engine)
+                AsyncReplicaSessionLocals.append(
+                    async_sessionmaker(
+                        bind=replica_engine, autoflush=False, expire_on_commit=False
+                    )
+                )
+            replica_router.attach(
+                [replica_engine.sync_engine for replica_engine in async_replica_engines]
+            )
+        else:
+            for url in settings.replica_database_urls:
+                replica_engine = create_engine(
+                    url, poolclass=InstrumentedQueuePool, **settings.pool_options
+                )
+                install_query_hooks(replica_engine)
+                replica_engines.append(replica_engine)
+                ReplicaSessionLocals.append(
+                    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+                )
+            replica_router.attach(replica_engines)
+
+        # 다른 스레드가 빠른 경로에서 절반만 만들어진 상태를 보지 않도록 마지막에 설정합니다.
+        engine = sync_engine
+
+
+def get_engine() -> Engine:
+    """
+    primary(sync) 엔진을 반환합니다. 스크립트에서 엔진이 직접 필요할 때 사용합니다.
+    """
+    init_engines()
+    return engine
+
+
+async def dispose_engines() -> None:
+    """
+    모든 풀의 커넥션을 닫습니다. (lifespan 종료 시)
+    """
+    if engine is None:
+        return
+    for replica_engine in replica_engines:
+        replica_engine.dispose()
+    for replica_engine in async_replica_engines:
+        await replica_engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
 
 
 def get_db():
+    init_engines()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    init_engines()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def open_read_session(user_id: int | None) -> Session:
+    """
+    읽기 전용 세션을 엽니다. 복제본이 없거나, 모두 쓸 수 없거나,
+    사용자가 방금 쓰기를 한 경우에는 primary 세션을 반환합니다.
+    """
+    init_engines()
+    index, probe = replica_router.choose(user_id)
+    if index is None:
+        return SessionLocal()
+    if probe:
+        try:
+            with replica_engines[index].connect():
+                pass
+        except exc.DBAPIError:
+            logger.warning("replica-%d is unavailable, reading from primary", index)
+            replica_router.mark_down(index)
+            return SessionLocal()
+        replica_router.mark_up(index)
+    return ReplicaSessionLocals[index]()
+
+
+async def open_async_read_session(user_id: int | None):
+    """
+    open_read_session의 async 버전입니다.
+    """
+    init_engines()
+    index, probe = replica_router.choose(user_id)
+    if index is None:
+        return AsyncSessionLocal()
+    if probe:
+        try:
+            async with async_replica_engines[index].connect():
+                pass
+        except exc.DBAPIError:
+            logger.warning("replica-%d is unavailable, reading from primary", index)
+            replica_router.mark_down(index)
+            return AsyncSessionLocal()
+        replica_router.mark_up(index)
+    return AsyncReplicaSessionLocals[index]()
+
+
+def get_pool_stats() -> dict:
+    """
+    현재 워커의 커넥션 풀 통계를 반환합니다. 엔진을 만들기 전이면 빈 dict입니다.
+    """
+    if engine is None:
+        return {}
+    stats = {"sync": pool_stats(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.pool)
+    for index, replica_engine in enumerate(replica_engines or async_replica_engines):
+        stats[f"replica-{index}"] = pool_stats(replica_engine.pool)
+    if replica_router.enabled:
+        stats["replica_routing"] = replica_router.stats()
+    return stats
+
+
+def _collect_pool_metrics() -> None:
+    if engine is None:
+        return
+    record_pool_metrics("sync", engine.pool)
+    if async_engine is not None:
+        record_pool_metrics("async", async_engine.pool)
+    for index, replica_engine in enumerate(replica_engines or async_replica_engines):
+        record_pool_metrics(f"replica-{index}", replica_engine.pool)
+
+
+REGISTRY.register_collector(_collect_pool_metrics)
+
+
+def log_pool_stats() -> None:
+    """
+    lifespan 종료 시 워커별 풀 통계와 복제본 라우팅 횟수를 로그로 남깁니다.
+    """
+    logger.info("DB pool stats: %s", get_pool_stats())
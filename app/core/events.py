@@ -0,0 +1,144 @@
+import abc
+import json
+import logging
+import os
+import socket
+import threading
+from pathlib import Path
+from typing import Callable
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 지원 내역이 커밋된 뒤 발행되는 메시지 종류
+# {"type": APPLICATIONS_UPDATED, "user_id", "user_uuid", "grade",
+#  "choices": [1지망 대학ID, ...], "deltas": {대학ID: 지원자 수 증감량}}
+APPLICATIONS_UPDATED = "applications_updated"
+
+# unix datagram 소켓 하나로 보낼 수 있는 메시지 최대 크기
+MAX_DATAGRAM_SIZE = 64 * 1024
+
+
+class Broker(abc.ABC):
+    """
+    워커 간 이벤트 전달 인터페이스입니다.
+    publish한 메시지는 (자기 자신을 포함한) 모든 워커의 구독 콜백으로 전달됩니다.
+    콜백은 임의의 스레드에서 호출될 수 있습니다.
+    """
+
+    @abc.abstractmethod
+    def publish(self, message: dict) -> None:
+        """
+        메시지를 모든 워커의 구독 콜백으로 보냅니다.
+        """
+
+    @abc.abstractmethod
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        """
+        이 워커에서 메시지를 받을 콜백을 등록합니다.
+        """
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _deliver(callbacks: list[Callable[[dict], None]], message: dict) -> None:
+        """
+        콜백 하나의 예외가 발행한 요청이나 수신 스레드, 다른 콜백으로 번지지 않게 합니다.
+        """
+        for callback in callbacks:
+            try:
+                callback(message)
+            except Exception:
+                logger.exception("event callback %r failed", callback)
+
+
+class InMemoryBroker(Broker):
+    """
+    한 프로세스 안에서만 전달합니다. (워커 1개 또는 테스트용)
+    """
+
+    def __init__(self):
+        self._callbacks: list[Callable[[dict], None]] = []
+
+    def publish(self, message: dict) -> None:
+        self._deliver(self._callbacks, message)
+
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        self._callbacks.append(callback)
+
+
+class LocalSocketBroker(Broker):
+    """
+    같은 호스트의 워커끼리 unix datagram 소켓으로 전달합니다.
+    구독한 워커마다 directory/<pid>.sock 을 열고, publish는 디렉터리의 모든 소켓으로 보냅니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._callbacks: list[Callable[[dict], None]] = []
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+        self._receiver: socket.socket | None = None
+        self._path = self.directory / f"{os.getpid()}.sock"
+        self._lock = threading.Lock()
+
+    def publish(self, message: dict) -> None:
+        data = json.dumps(message).encode()
+        if len(data) > MAX_DATAGRAM_SIZE:
+            logger.warning("event dropped: %d bytes exceeds datagram size", len(data))
+            return
+        for path in self.directory.glob("*.sock"):
+            try:
+                self._sender.sendto(data, str(path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # 종료된 워커가 남긴 소켓
+                path.unlink(missing_ok=True)
+            except BlockingIOError:
+                # 받는 쪽 버퍼가 가득 찬 느린 워커: 다음 스냅샷으로 따라잡습니다.
+                logger.warning("event dropped for slow worker %s", path.name)
+
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        with self._lock:
+            self._callbacks.append(callback)
+            if self._receiver is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._path.unlink(missing_ok=True)
+                self._receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._receiver.bind(str(self._path))
+                threading.Thread(
+                    target=self._receive_loop, name="event-broker", daemon=True
+                ).start()
+
+    def _receive_loop(self) -> None:
+        receiver = self._receiver
+        while True:
+            try:
+                data = receiver.recv(MAX_DATAGRAM_SIZE)
+            except OSError:
+                return
+            try:
+                message = json.loads(data)
+            except ValueError:
+                continue
+            self._deliver(self._callbacks, message)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._receiver is not None:
+                self._receiver.close()
+                self._receiver = None
+                self._path.unlink(missing_ok=True)
+        self._sender.close()
+
+
+def create_broker(kind: str, directory: str) -> Broker:
+    if kind == "memory":
+        return InMemoryBroker()
+    if kind == "local-socket":
+        return LocalSocketBroker(directory)
+    raise ValueError(f"알 수 없는 EVENT_BROKER 입니다: {kind}")
+
+
+broker = create_broker(settings.event_broker, settings.event_broker_dir)
@@ -0,0 +1,279 @@
+"""
+여러 요청의 쓰기를 모아 한 트랜잭션으로 반영합니다. (group commit)
+
+요청은 submit으로 항목을 큐에 넣고 자기 결과를 기다립니다. 워커마다 하나인 writer가 큐에서
+최대 max_batch개를 꺼내 apply_batch(항목 목록)를 한 번 호출하고, apply_batch가 항목 순서대로 돌려준
+결과(값 또는 예외 객체)를 각 요청에 전달합니다. 커밋은 apply_batch 안에서 배치마다 한 번 합니다.
+
+- 배치는 첫 항목이 들어온 뒤 max_wait_seconds가 지나거나 max_batch개가 모이면 시작합니다.
+  writer가 이전 배치를 반영하는 동안 쌓인 항목은 기다리지 않고 바로 다음 배치가 됩니다.
+- 큐에 max_depth개가 쌓여 있으면 GroupCommitQueueFullError로 바로 거절합니다.
+- apply_batch 자체가 예외를 내면 (배치 전체가 롤백된 것으로 보고) 항목을 하나씩 다시 반영해서
+  문제가 된 요청만 실패하게 합니다.
+- 큐 길이, 배치 크기, 대기 시간, 배치 반영 시간은 /metrics의 knu_group_commit_* 입니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+
+from app.core.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# 배치 크기 / 큐 대기 시간(초, 상한) 히스토그램 버킷
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+WAIT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+queue_depth = REGISTRY.gauge("knu_group_commit_depth", "반영을 기다리는 요청 수", ("queue",))
+queue_rejected = REGISTRY.counter(
+    "knu_group_commit_rejected", "큐가 가득 차 거절한 요청 수", ("queue",)
+)
+batch_size = REGISTRY.histogram(
+    "knu_group_commit_batch_size", "배치당 요청 수", ("queue",), buckets=BATCH_SIZE_BUCKETS
+)
+queue_wait = REGISTRY.histogram(
+    "knu_group_commit_wait_seconds",
+    "큐에 들어온 뒤 배치가 시작될 때까지의 시간",
+    ("queue",),
+    buckets=WAIT_BUCKETS,
+)
+batch_duration = REGISTRY.histogram(
+    "knu_group_commit_batch_seconds",
+    "배치 반영(커밋 포함) 시간",
+    ("queue",),
+    buckets=WAIT_BUCKETS,
+)
+
+
+class GroupCommitQueueFullError(Exception):
+    """
+    큐에 반영을 기다리는 요청이 max_depth개 이상이라 받지 않은 경우입니다.
+    """
+
+
+class _Pending:
+    __slots__ = ("item", "future", "enqueued_at")
+
+    def __init__(self, item: Any, future):
+        self.item = item
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+
+
+class _GroupCommitBase:
+    def __init__(
+        self,
+        name: str,
+        apply_batch: Callable,
+        *,
+        max_batch: int,
+        max_wait_seconds: float,
+        max_depth: int,
+    ):
+        self.name = name
+        self.apply_batch = apply_batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        self.max_depth = max_depth
+        self.batches = 0
+        self.items = 0
+        self._pending: deque[_Pending] = deque()
+        self._closed = False
+        self._depth = queue_depth.labels(name)
+        self._rejected = queue_rejected.labels(name)
+        self._batch_size = batch_size.labels(name)
+        self._wait = queue_wait.labels(name)
+        self._duration = batch_duration.labels(name)
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def _enqueue(self, pending: _Pending) -> bool:
+        """
+        큐에 넣고, writer를 깨워야 하면(큐가 비어 있었거나 배치가 찼으면) True를 반환합니다.
+        """
+        if self._closed:
+            raise RuntimeError(f"{self.name}: group commit queue is closed")
+        if len(self._pending) >= self.max_depth:
+            self._rejected.inc()
+            raise GroupCommitQueueFullError()
+        self._pending.append(pending)
+        self._depth.set(len(self._pending))
+        return len(self._pending) == 1 or len(self._pending) >= self.max_batch
+
+    def _remaining(self) -> float:
+        """
+        첫 항목 기준으로 배치를 더 모을 수 있는 시간(초)입니다. 0 이하이면 바로 시작합니다.
+        """
+        if len(self._pending) >= self.max_batch or self._closed:
+            return 0.0
+        return self._pending[0].enqueued_at + self.max_wait_seconds - time.perf_counter()
+
+    def _take_batch(self) -> list[_Pending]:
+        batch = [self._pending.popleft() for _ in range(min(len(self._pending), self.max_batch))]
+        self._depth.set(len(self._pending))
+        started = time.perf_counter()
+        for pending in batch:
+            self._wait.observe(started - pending.enqueued_at)
+        return batch
+
+    def _record_batch(self, batch: list[_Pending], started: float) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        self._batch_size.observe(len(batch))
+        self._duration.observe(time.perf_counter() - started)
+
+    @staticmethod
+    def _deliver(batch: list[_Pending], results: list) -> None:
+        for pending, result in zip(batch, results, strict=True):
+            # async에서는 기다리던 요청이 취소되었을 수 있습니다. (반영은 그대로 유지)
+            if pending.future.done():
+                continue
+            if isinstance(result, BaseException):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(result)
+
+    def _log_batch_failure(self, batch: list[_Pending]) -> None:
+        logger.warning(
+            "%s: batch of %d failed, applying one by one", self.name, len(batch), exc_info=True
+        )
+
+
+class GroupCommitQueue(_GroupCommitBase):
+    """
+    sync 엔드포인트(스레드풀)용입니다. writer는 첫 submit에서 시작하는 데몬 스레드입니다.
+    apply_batch(items) -> list[결과 | 예외]
+    """
+
+    def __init__(self, name: str, apply_batch: Callable[[list], list], **options):
+        super().__init__(name, apply_batch, **options)
+        self._condition = threading.Condition()
+        self._writer: threading.Thread | None = None
+
+    def submit(self, item: Any) -> Any:
+        """
+        항목이 반영될 때까지 기다렸다가 결과를 반환합니다. (결과가 예외이면 그 예외를 냅니다.)
+        """
+        pending = _Pending(item, Future())
+        with self._condition:
+            if self._enqueue(pending):
+                self._condition.notify()
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run, name=f"group-commit-{self.name}", daemon=True
+                )
+                self._writer.start()
+        return pending.future.result()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                while (remaining := self._remaining()) > 0:
+                    self._condition.wait(remaining)
+                batch = self._take_batch()
+            self._apply(batch)
+
+    def _apply(self, batch: list[_Pending]) -> None:
+        started = time.perf_counter()
+        try:
+            results = self.apply_batch([pending.item for pending in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                self._record_batch(batch, started)
+                batch[0].future.set_exception(e)
+                return
+            self._log_batch_failure(batch)
+            for pending in batch:
+                self._apply([pending])
+            return
+        self._record_batch(batch, started)
+        self._deliver(batch, results)
+
+    async def close(self) -> None:
+        """
+        남은 항목을 모두 반영한 뒤 writer를 멈춥니다. (lifespan 종료 시)
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.join)
+
+
+class AsyncGroupCommitQueue(_GroupCommitBase):
+    """
+    async 엔드포인트(이벤트 루프)용입니다. writer는 첫 submit에서 시작하는 태스크입니다.
+    apply_batch(items) -> Awaitable[list[결과 | 예외]]
+    """
+
+    def __init__(
+        self, name: str, apply_batch: Callable[[list], Awaitable[list]], **options
+    ):
+        super().__init__(name, apply_batch, **options)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._writer: asyncio.Task | None = None
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # 이벤트 루프가 바뀌면(요청마다 루프를 새로 만드는 테스트 클라이언트 등) writer를 새로 만듭니다.
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._writer = None
+        pending = _Pending(item, loop.create_future())
+        if self._enqueue(pending):
+            self._wakeup.set()
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._run())
+        return await pending.future
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            while (remaining := self._remaining()) > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except TimeoutError:
+                    break
+            await self._apply(self._take_batch())
+
+    async def _apply(self, batch: list[_Pending]) -> None:
+        started = time.perf_counter()
+        try:
+            results = await self.apply_batch([pending.item for pending in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                self._record_batch(batch, started)
+                if not batch[0].future.done():
+                    batch[0].future.set_exception(e)
+                return
+            self._log_batch_failure(batch)
+            for pending in batch:
+                await self._apply([pending])
+            return
+        self._record_batch(batch, started)
+        self._deliver(batch, results)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._writer is not None and self._loop is asyncio.get_running_loop():
+            self._wakeup.set()
+            await self._writer
@@ -0,0 +1,537 @@
+"""
+Prometheus 텍스트 형식의 메트릭입니다. (GET /metrics)
+
+uvicorn --workers로 띄운 워커들의 값을 합치기 위해 워커마다 METRICS_DIR/<pid>.db 파일 하나를
+mmap으로 열어 값을 씁니다. 값을 기록할 때는 자기 파일의 float64 하나만 고치므로 (잠금 하나, 시스템 콜 없음)
+요청 처리 경로의 비용은 수 마이크로초입니다. /metrics를 받은 워커가 모든 파일을 읽어 합칩니다.
+
+- counter / histogram: 종료된 워커의 파일도 합칩니다. (값이 줄어들지 않도록)
+- gauge: 살아 있는 워커의 값만 합칩니다. (진행 중인 요청 수, 커넥션 풀 상태 등)
+- 풀/토큰 캐시처럼 다른 곳에 이미 있는 통계는 register_collector로 등록한 함수가
+  METRICS_COLLECT_SECONDS마다(그리고 /metrics 응답 직전에) 파일에 옮겨 씁니다.
+
+서버를 시작하기 전에 METRICS_DIR을 비워야 이전 실행의 값이 섞이지 않습니다.
+METRICS_DIR이 비어 있으면 워커 내부 값만 보여 줍니다.
+"""
+
+import abc
+import asyncio
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 요청 처리 시간 히스토그램 버킷 (초, 상한)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_HEADER = struct.Struct("<I4x")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+_INITIAL_SIZE = 1 << 16
+
+
+def _padded(length: int) -> int:
+    return (length + 7) & ~7
+
+
+def _read_entries(data, used: int) -> Iterator[tuple[str, int, float]]:
+    """
+    (키, 값의 위치, 값)을 차례로 읽습니다.
+    파일 형식: [사용한 바이트 수(uint32) + 패딩] 뒤에 [키 길이(uint32), 키(8바이트 정렬), 값(float64)] 반복
+    """
+    position = _HEADER.size
+    while position < used:
+        (length,) = _KEY_LENGTH.unpack_from(data, position)
+        key_start = position + _KEY_LENGTH.size
+        value_offset = key_start + _padded(length)
+        key = bytes(data[key_start : key_start + length]).decode()
+        (value,) = _VALUE.unpack_from(data, value_offset)
+        yield key, value_offset, value
+        position = value_offset + _VALUE.size
+
+
+class _ValueFile:
+    """
+    한 워커가 쓰는 값 파일입니다. (path가 None이면 파일 없이 메모리에만 둡니다.)
+    """
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self._lock = threading.Lock()
+        if path is None:
+            self._file = None
+            self._mmap = mmap.mmap(-1, _INITIAL_SIZE)
+            self._used = _HEADER.size
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "a+b")
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _INITIAL_SIZE:
+                self._file.truncate(_INITIAL_SIZE)
+                size = _INITIAL_SIZE
+            self._mmap = mmap.mmap(self._file.fileno(), size)
+            # 같은 pid로 다시 시작한 경우 이전 값을 이어서 씁니다.
+            self._used = _HEADER.unpack_from(self._mmap, 0)[0] or _HEADER.size
+        self._positions = {
+            key: offset for key, offset, _ in _read_entries(self._mmap, self._used)
+        }
+
+    def _grow(self, needed: int) -> None:
+        size = len(self._mmap)
+        while size < needed:
+            size *= 2
+        if self._file is None:
+            grown = mmap.mmap(-1, size)
+            grown[: self._used] = self._mmap[: self._used]
+        else:
+            self._file.truncate(size)
+            grown = mmap.mmap(self._file.fileno(), size)
+        self._mmap.close()
+        self._mmap = grown
+
+    def offset(self, key: str) -> int:
+        """
+        키의 값 위치를 반환합니다. 처음 보는 키는 0으로 추가합니다.
+        """
+        with self._lock:
+            offset = self._positions.get(key)
+            if offset is not None:
+                return offset
+            encoded = key.encode()
+            entry_size = _KEY_LENGTH.size + _padded(len(encoded)) + _VALUE.size
+            if self._used + entry_size > len(self._mmap):
+                self._grow(self._used + entry_size)
+            position = self._used
+            _KEY_LENGTH.pack_into(self._mmap, position, len(encoded))
+            key_start = position + _KEY_LENGTH.size
+            self._mmap[key_start : key_start + len(encoded)] = encoded
+            offset = key_start + _padded(len(encoded))
+            _VALUE.pack_into(self._mmap, offset, 0.0)
+            # 다른 워커가 절반만 쓰인 항목을 읽지 않도록 사용한 크기는 마지막에 갱신합니다.
+            self._used = offset + _VALUE.size
+            _HEADER.pack_into(self._mmap, 0, self._used)
+            self._positions[key] = offset
+            return offset
+
+    def add(self, offset: int, amount: float) -> None:
+        with self._lock:
+            (value,) = _VALUE.unpack_from(self._mmap, offset)
+            _VALUE.pack_into(self._mmap, offset, value + amount)
+
+    def set(self, offset: int, value: float) -> None:
+        with self._lock:
+            _VALUE.pack_into(self._mmap, offset, value)
+
+    def observe(self, bucket_offset: int, sum_offset: int, count_offset: int, value: float):
+        """
+        히스토그램 관측 하나(버킷 +1, 합계 +value, 개수 +1)를 잠금 한 번으로 기록합니다.
+        """
+        with self._lock:
+            # _grow가 이전 mmap을 닫으므로 잠금 안에서 읽어야 합니다.
+            data = self._mmap
+            _VALUE.pack_into(data, bucket_offset, _VALUE.unpack_from(data, bucket_offset)[0] + 1)
+            _VALUE.pack_into(data, sum_offset, _VALUE.unpack_from(data, sum_offset)[0] + value)
+            _VALUE.pack_into(data, count_offset, _VALUE.unpack_from(data, count_offset)[0] + 1)
+
+    def read(self) -> list[tuple[str, float]]:
+        with self._lock:
+            return [(key, value) for key, _, value in _read_entries(self._mmap, self._used)]
+
+
+def _key(name: str, labels: dict[str, str]) -> str:
+    return json.dumps([name, labels], separators=(",", ":"), sort_keys=True)
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, registry: "Registry", name: str, documentation: str, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple, object] = {}
+        self._children_lock = threading.Lock()
+        registry.register(self)
+
+    def labels(self, *values):
+        """
+        라벨 값이 같은 자식은 한 번만 만들어 재사용합니다. (이후 기록은 dict 조회 한 번)
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: labels {self.labelnames} expected")
+            with self._children_lock:
+                child = self._children.get(values)
+                if child is None:
+                    labels = dict(zip(self.labelnames, map(str, values)))
+                    child = self._children[values] = self._make_child(labels)
+        return child
+
+    @abc.abstractmethod
+    def _make_child(self, labels: dict[str, str]):
+        """
+        라벨 값 하나에 대한 기록 객체를 만듭니다.
+        """
+
+
+class _Value:
+    __slots__ = ("file", "offset")
+
+    def __init__(self, file: _ValueFile, key: str):
+        self.file = file
+        self.offset = file.offset(key)
+
+    def inc(self, amount: float = 1) -> None:
+        self.file.add(self.offset, amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self.file.add(self.offset, -amount)
+
+    def set(self, value: float) -> None:
+        self.file.set(self.offset, value)
+
+
+class Counter(_Metric):
+    """
+    증가만 하는 값입니다. 다른 곳의 누적값을 옮길 때(collector)는 set을 사용합니다.
+    """
+
+    kind = "counter"
+
+    def _make_child(self, labels):
+        return _Value(self.registry.file, _key(f"{self.name}_total", labels))
+
+
+class Gauge(_Metric):
+    """
+    현재 값입니다. 살아 있는 워커의 값만 합칩니다.
+    """
+
+    kind = "gauge"
+
+    def _make_child(self, labels):
+        return _Value(self.registry.file, _key(self.name, labels))
+
+
+class _HistogramChild:
+    __slots__ = ("_file", "_buckets", "_bucket_values", "_bucket_offsets", "_sum", "_count")
+
+    def __init__(self, file: _ValueFile, name: str, labels: dict, buckets: tuple):
+        self._file = file
+        self._buckets = buckets
+        # 버킷별 개수는 누적하지 않고 저장하며, 내보낼 때 누적합니다.
+        self._bucket_values = [
+            _Value(file, _key(f"{name}_bucket", {**labels, "le": _format_bound(bound)}))
+            for bound in buckets + (float("inf"),)
+        ]
+        self._bucket_offsets = [value.offset for value in self._bucket_values]
+        self._sum = _Value(file, _key(f"{name}_sum", labels))
+        self._count = _Value(file, _key(f"{name}_count", labels))
+
+    def observe(self, value: float) -> None:
+        self._file.observe(
+            self._bucket_offsets[bisect.bisect_left(self._buckets, value)],
+            self._sum.offset,
+            self._count.offset,
+            value,
+        )
+
+    def set_state(self, bucket_counts, total: float) -> None:
+        """
+        다른 곳에서 모은 (누적하지 않은) 버킷별 개수와 합계를 그대로 옮깁니다. (collector용)
+        """
+        for value, count in zip(self._bucket_values, bucket_counts):
+            value.set(count)
+        self._sum.set(total)
+        self._count.set(sum(bucket_counts))
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        super().__init__(registry, name, documentation, labelnames)
+
+    def _make_child(self, labels):
+        return _HistogramChild(self.registry.file, self.name, labels, self.buckets)
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Registry:
+    def __init__(self, directory: str | None):
+        self.directory = Path(directory) if directory else None
+        self._file: _ValueFile | None = None
+        self._file_pid: int | None = None
+        self._file_lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    @property
+    def file(self) -> _ValueFile:
+        # fork된 워커가 부모의 파일에 쓰지 않도록 pid가 바뀌면 새 파일을 엽니다.
+        pid = os.getpid()
+        if self._file_pid != pid:
+            with self._file_lock:
+                if self._file_pid != pid:
+                    path = None if self.directory is None else self.directory / f"{pid}.db"
+                    self._file = _ValueFile(path)
+                    self._file_pid = pid
+        return self._file
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return Counter(self, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return Gauge(self, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return Histogram(self, name, documentation, labelnames, buckets)
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """
+        다른 곳에 모여 있는 통계를 메트릭에 옮겨 쓰는 함수를 등록합니다.
+        """
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                logger.exception("metrics collector failed")
+
+    def _samples(self) -> Iterator[tuple[int | None, list[tuple[str, float]]]]:
+        if self.directory is None:
+            yield None, self.file.read()
+            return
+        for path in self.directory.glob("*.db"):
+            try:
+                pid = int(path.stem)
+                data = path.read_bytes()
+            except (ValueError, OSError):
+                continue
+            if len(data) < _HEADER.size:
+                continue
+            used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+            yield pid, [(key, value) for key, _, value in _read_entries(data, used)]
+
+    def render(self) -> str:
+        """
+        모든 워커의 값을 합쳐 Prometheus 텍스트 형식으로 만듭니다.
+        """
+        self.collect()
+        totals: dict[str, dict[tuple, float]] = {}
+        for pid, samples in self._samples():
+            alive = pid is None or pid == os.getpid() or _pid_alive(pid)
+            for key, value in samples:
+                sample_name, labels = json.loads(key)
+                metric = self._metric_for(sample_name)
+                if metric is None or (metric.kind == "gauge" and not alive):
+                    continue
+                series = totals.setdefault(sample_name, {})
+                label_key = tuple(labels.items())
+                series[label_key] = series.get(label_key, 0.0) + value
+
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if metric.kind == "counter":
+                lines.extend(_series_lines(f"{metric.name}_total", totals))
+            elif metric.kind == "gauge":
+                lines.extend(_series_lines(metric.name, totals))
+            else:
+                lines.extend(_histogram_lines(metric, totals))
+        return "\n".join(lines) + "\n"
+
+    def _metric_for(self, sample_name: str) -> _Metric | None:
+        # gauge는 이름 그대로, counter/histogram은 _total/_bucket/_sum/_count가 붙어 있습니다.
+        metric = self._metrics.get(sample_name)
+        if metric is None:
+            metric = self._metrics.get(sample_name.rpartition("_")[0])
+        return metric
+
+
+def _series_lines(sample_name: str, totals) -> list[str]:
+    return [
+        f"{sample_name}{_format_labels(dict(labels))} {_format_value(value)}"
+        for labels, value in sorted(totals.get(sample_name, {}).items())
+    ]
+
+
+def _histogram_lines(metric: Histogram, totals) -> list[str]:
+    buckets = totals.get(f"{metric.name}_bucket", {})
+    grouped: dict[tuple, dict[str, float]] = {}
+    for labels, value in buckets.items():
+        labels = dict(labels)
+        bound = labels.pop("le")
+        grouped.setdefault(tuple(sorted(labels.items())), {})[bound] = value
+
+    lines = []
+    bounds = [_format_bound(bound) for bound in metric.buckets + (float("inf"),)]
+    sums = totals.get(f"{metric.name}_sum", {})
+    counts = totals.get(f"{metric.name}_count", {})
+    for labels in sorted(grouped):
+        cumulative = 0.0
+        for bound in bounds:
+            cumulative += grouped[labels].get(bound, 0.0)
+            bucket_labels = _format_labels({**dict(labels), "le": bound})
+            lines.append(f"{metric.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+        label_text = _format_labels(dict(labels))
+        lines.append(f"{metric.name}_sum{label_text} {_format_value(sums.get(labels, 0.0))}")
+        lines.append(f"{metric.name}_count{label_text} {_format_value(counts.get(labels, 0.0))}")
+    return lines
+
+
+REGISTRY = Registry(settings.metrics_dir)
+
+http_requests = REGISTRY.counter(
+    "knu_http_requests", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration = REGISTRY.histogram(
+    "knu_http_request_duration_seconds",
+    "엔드포인트 처리 시간 (의존성, 직렬화 포함 / RouteMetricsMiddleware 바깥의 미들웨어 제외)",
+    ("method", "route"),
+)
+http_requests_in_progress = REGISTRY.gauge(
+    "knu_http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method",)
+)
+
+
+class _RouteMetrics:
+    __slots__ = ("route", "method", "duration", "requests")
+
+    def __init__(self, route: str, method: str):
+        self.route = route
+        self.method = method
+        self.duration = http_request_duration.labels(method, route)
+        self.requests: dict[int, _Value] = {}
+
+    def count(self, status_code: int) -> None:
+        counter = self.requests.get(status_code)
+        if counter is None:
+            counter = self.requests[status_code] = http_requests.labels(
+                self.method, self.route, status_code
+            )
+        counter.inc()
+
+
+def route_template(path: str, route_path: str) -> str:
+    """
+    요청 경로 path에 매칭된 경로 템플릿 route_path 앞에 빠진 prefix를 붙입니다.
+    ("/users/5", "/{user_id}") -> "/users/{user_id}", route_path가 이미 전체 경로이면 그대로입니다.
+    경로 변수 하나가 "/" 하나에 대응한다고 가정합니다. ({name:path} 변수는 쓰지 않습니다.)
+    """
+    return path.rsplit("/", route_path.count("/"))[0] + route_path
+
+
+class RouteMetricsMiddleware:
+    """
+    경로 템플릿(/universities/{university_id}) 단위로 요청 수와 처리 시간을 기록합니다.
+    FastAPI 내부를 바꾸지 않고 요청을 처리한 뒤 라우팅이 남긴 scope["route"]를 읽습니다.
+    (fastapi 0.137부터는 scope["route"].path에 include_router의 prefix가 빠지므로 route_template으로 채웁니다.)
+    처리 중인 요청 수는 라우팅 전이라 method 단위로만 기록합니다.
+    다른 미들웨어의 시간이 섞이지 않도록 가장 안쪽(가장 먼저 add_middleware)에 둡니다.
+    매칭되지 않은 요청(404, 405)은 기록하지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._metrics: dict[tuple[str, str], _RouteMetrics] = {}
+        self._in_progress: dict[str, _Value] = {}
+
+    def _route_metrics(self, route: str, method: str) -> _RouteMetrics:
+        route_metrics = self._metrics.get((route, method))
+        if route_metrics is None:
+            route_metrics = self._metrics[route, method] = _RouteMetrics(route, method)
+        return route_metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        in_progress = self._in_progress.get(method)
+        if in_progress is None:
+            in_progress = self._in_progress[method] = http_requests_in_progress.labels(method)
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = scope.get("route")
+            if route is not None:
+                route_metrics = self._route_metrics(
+                    route_template(scope["path"], route.path), method
+                )
+                route_metrics.duration.observe(elapsed)
+                route_metrics.count(status_code)
+
+
+async def run_collector(interval: float) -> None:
+    """
+    등록된 collector를 주기적으로 실행합니다. (lifespan에서 워커마다 실행)
+    """
+    while True:
+        await asyncio.to_thread(REGISTRY.collect)
+        await asyncio.sleep(interval)
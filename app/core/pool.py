@@ -0,0 +1,130 @@
+import bisect
+import logging
+import math
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 획득 대기 시간 히스토그램 버킷 (초, 상한)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# pool: sync | async | replica-<n>, state: checked_out | checked_in | overflow
+pool_size = REGISTRY.gauge("knu_db_pool_size", "커넥션 풀 크기", ("pool",))
+pool_connections = REGISTRY.gauge(
+    "knu_db_pool_connections", "상태별 커넥션 수", ("pool", "state")
+)
+pool_checkout_timeouts = REGISTRY.counter(
+    "knu_db_pool_checkout_timeouts", "커넥션 획득 timeout 수", ("pool",)
+)
+pool_wait = REGISTRY.histogram(
+    "knu_db_pool_wait_seconds", "커넥션 획득 대기 시간", ("pool",), buckets=WAIT_BUCKETS
+)
+
+
+class PoolMetrics:
+    """
+    커넥션 풀의 checkout 대기 시간과 timeout 횟수를 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds: float) -> None:
+        index = bisect.bisect_left(WAIT_BUCKETS, seconds)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.wait_count += 1
+            self.wait_sum += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def bucket_state(self) -> tuple[list[int], float]:
+        """
+        (누적하지 않은 버킷별 개수, 대기 시간 합계)입니다.
+        """
+        with self._lock:
+            return list(self.bucket_counts), self.wait_sum
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            cumulative = 0
+            histogram = {}
+            for bound, count in zip(WAIT_BUCKETS + (math.inf,), self.bucket_counts):
+                cumulative += count
+                histogram["+Inf" if bound == math.inf else str(bound)] = cumulative
+            return {
+                "wait_count": self.wait_count,
+                "wait_sum_seconds": self.wait_sum,
+                "wait_max_seconds": self.wait_max,
+                "wait_histogram": histogram,
+                "timeouts": self.timeouts,
+            }
+
+
+class _InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            logger.warning("DB pool checkout timeout: %s", pool_stats(self))
+            raise
+        self.metrics.observe_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(pool) -> dict:
+    """
+    풀의 현재 상태(크기, 사용 중, overflow)와 대기 시간 통계를 반환합니다.
+    """
+    stats = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
+
+
+def record_pool_metrics(name: str, pool) -> None:
+    """
+    풀의 현재 상태와 대기 시간 통계를 메트릭(GET /metrics)에 옮겨 씁니다.
+    """
+    pool_size.labels(name).set(pool.size())
+    pool_connections.labels(name, "checked_out").set(pool.checkedout())
+    pool_connections.labels(name, "checked_in").set(pool.checkedin())
+    pool_connections.labels(name, "overflow").set(max(pool.overflow(), 0))
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        pool_checkout_timeouts.labels(name).set(metrics.timeouts)
+        pool_wait.labels(name).set_state(*metrics.bucket_state())
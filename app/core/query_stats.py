@@ -0,0 +1,123 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger("app.requests")
+
+# 로그에 남길 SQL 문 최대 길이
+MAX_STATEMENT_LENGTH = 300
+
+
+class RequestQueryStats:
+    """
+    요청 하나에서 실행된 SQL 문 수, 총 DB 시간, 가장 느린 SQL 문을 기록합니다.
+    """
+
+    __slots__ = ("count", "total_seconds", "slowest_seconds", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: str | None = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # SQL 문마다 새로 만드는 실행 컨텍스트에 두므로, 실패해 after가 호출되지 않아도 남지 않습니다.
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context._query_start)
+
+
+def install_query_hooks(engine) -> None:
+    """
+    동기 엔진(AsyncEngine은 .sync_engine)에 SQL 실행 시간 측정 훅을 등록합니다.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    요청별 SQL 통계를 Server-Timing 헤더로 내보내고 구조화된 로그로 남깁니다.
+    slow_request_ms를 넘는 요청은 WARNING, 나머지는 DEBUG 레벨로 기록합니다.
+    (sync 엔드포인트는 스레드풀에서 실행되지만 contextvar가 복사되므로 같은 통계 객체에 기록됩니다.)
+    """
+
+    def __init__(self, app, slow_request_ms: float):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_server_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries", '
+                    f"app;dur={elapsed_ms:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, status_code, stats, (time.perf_counter() - started) * 1000)
+
+    def _log(self, scope, status_code, stats: RequestQueryStats, elapsed_ms: float):
+        slow = elapsed_ms >= self.slow_request_ms
+        level = logging.WARNING if slow else logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return
+
+        route = scope.get("route")
+        record = {
+            "event": "slow_request" if slow else "request",
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status_code,
+            "duration_ms": round(elapsed_ms, 2),
+            "db_queries": stats.count,
+            "db_ms": round(stats.total_seconds * 1000, 2),
+            "slowest_query_ms": round(stats.slowest_seconds * 1000, 2),
+            "slowest_query": (stats.slowest_statement or "")[:MAX_STATEMENT_LENGTH],
+        }
+        logger.log(level, json.dumps(record, ensure_ascii=False))
@@ -0,0 +1,210 @@
+"""
+토큰 버킷 방식의 요청 제한입니다.
+
+버킷마다 최대 capacity개의 토큰이 있고 초당 refill_per_second개씩 다시 채워집니다.
+요청 하나가 토큰 하나를 쓰며, 토큰이 없으면 429와 Retry-After를 반환합니다.
+버킷 상태는 저장소(RateLimitStore)에 두므로 저장소만 바꾸면 워커 간에 공유할 수 있습니다.
+"""
+
+import abc
+import ipaddress
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from fastapi import HTTPException, Request, status
+
+
+class RateLimitStore(abc.ABC):
+    """
+    버킷 저장소 인터페이스입니다.
+    take()는 키의 버킷을 채운 뒤 토큰 하나를 꺼내며, 한 번의 원자적 연산이어야 합니다.
+    """
+
+    @abc.abstractmethod
+    def take(
+        self, key: str, capacity: float, refill_per_second: float
+    ) -> tuple[bool, float]:
+        """
+        (허용 여부, 허용되지 않았다면 다음 토큰까지 남은 초)를 반환합니다.
+        """
+
+
+def _refill(
+    tokens: float, updated: float, now: float, capacity: float, refill_per_second: float
+) -> float:
+    return min(capacity, tokens + max(0.0, now - updated) * refill_per_second)
+
+
+def _take_from(tokens: float, refill_per_second: float) -> tuple[bool, float, float]:
+    """
+    (허용 여부, 대기 시간, 남은 토큰)
+    """
+    if tokens >= 1:
+        return True, 0.0, tokens - 1
+    return False, (1 - tokens) / refill_per_second, tokens
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    워커 프로세스 안에서만 공유되는 저장소입니다.
+    워커가 N개면 클라이언트는 최대 N배까지 허용될 수 있습니다.
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, refill_per_second):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = _refill(tokens, updated, now, capacity, refill_per_second)
+            allowed, retry_after, tokens = _take_from(tokens, refill_per_second)
+            self._buckets[key] = (tokens, now)
+            # 오래 요청이 없던 버킷부터 버립니다. (버려진 버킷은 가득 찬 상태와 같습니다.)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return allowed, retry_after
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """
+    같은 호스트의 워커들이 SQLite 파일 하나를 공유하는 저장소입니다.
+    Redis 같은 공유 저장소를 대신하며, BEGIN IMMEDIATE로 읽기-수정-쓰기를 직렬화합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                " key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def take(self, key, capacity, refill_per_second):
+        # 여러 프로세스가 함께 쓰므로 monotonic이 아닌 벽시계 시각을 사용합니다.
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row is not None else (capacity, now)
+            tokens = _refill(tokens, updated, now, capacity, refill_per_second)
+            allowed, retry_after, tokens = _take_from(tokens, refill_per_second)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated)"
+                " VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, retry_after
+
+
+def create_rate_limit_store(kind: str, path: str) -> RateLimitStore:
+    if kind == "memory":
+        return InMemoryRateLimitStore()
+    if kind == "sqlite":
+        return SQLiteRateLimitStore(path)
+    raise ValueError(f"unknown RATE_LIMIT_STORE: {kind}")
+
+
+def parse_trusted_proxies(values) -> tuple:
+    """
+    IP 또는 CIDR 문자열 목록을 네트워크 목록으로 바꿉니다. (TRUSTED_PROXIES)
+    """
+    return tuple(ipaddress.ip_network(value, strict=False) for value in values)
+
+
+def _is_trusted(address: str, trusted_proxies: tuple) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def client_ip(request: Request, trusted_proxies: tuple = ()) -> str:
+    """
+    요청한 클라이언트의 IP입니다.
+    직접 연결한 쪽이 신뢰하는 프록시이면 X-Forwarded-For를 오른쪽(가까운 쪽)부터 읽어
+    신뢰하는 프록시가 아닌 첫 주소를 사용합니다. 클라이언트가 보낸 앞부분은 믿지 않습니다.
+    """
+    client = request.client.host if request.client else "unknown"
+    if not trusted_proxies or not _is_trusted(client, trusted_proxies):
+        return client
+    forwarded = [
+        address.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for address in header.split(",")
+        if address.strip()
+    ]
+    for address in reversed(forwarded):
+        if not _is_trusted(address, trusted_proxies):
+            return address
+        client = address
+    return client
+
+
+class RateLimit:
+    """
+    클라이언트 IP별 토큰 버킷을 적용하는 의존성입니다.
+
+        @router.post("/token", dependencies=[Depends(auth_rate_limit)])
+
+    리버스 프록시 뒤에서는 trusted_proxies(TRUSTED_PROXIES)에 프록시 주소를 넣어야
+    모든 요청이 프록시 IP 하나로 묶이지 않습니다. (client_ip 참고)
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        scope: str,
+        capacity: float,
+        refill_per_second: float,
+        trusted_proxies: tuple = (),
+    ):
+        self.store = store
+        self.scope = scope
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.trusted_proxies = trusted_proxies
+        self.rejected = 0
+
+    def __call__(self, request: Request) -> None:
+        if self.capacity <= 0:
+            return
+        client = client_ip(request, self.trusted_proxies)
+        allowed, retry_after = self.store.take(
+            f"{self.scope}:{client}", self.capacity, self.refill_per_second
+        )
+        if not allowed:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
@@ -0,0 +1,127 @@
+"""
+읽기 전용 요청을 복제본(replica)으로 나누어 보내기 위한 라우터입니다.
+
+- 복제본은 라운드 로빈으로 고르며, 쓸 수 있는 복제본이 없으면 primary를 사용합니다.
+- 복제본은 처음 사용할 때 연결을 확인(probe)합니다. 사용 중 연결 오류가 나면
+  retry_seconds 동안 그 복제본을 쓰지 않고, 그 뒤 첫 요청에서 다시 확인한 다음 사용합니다.
+  (오류가 난 그 요청 자체는 다시 시도하지 않습니다.)
+- 지원 내역을 수정한 사용자는 sticky_seconds 동안 primary에서 읽습니다. (read-your-writes)
+  다른 워커에도 브로커의 applications_updated 이벤트로 전달됩니다.
+"""
+
+import functools
+import itertools
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.events import APPLICATIONS_UPDATED, Broker
+
+# sticky 기록이 이 수를 넘으면 만료된 항목을 정리합니다.
+_STICKY_PRUNE_SIZE = 10_000
+
+
+class ReplicaRouter:
+    def __init__(self, broker: Broker, sticky_seconds: float, retry_seconds: float):
+        self.replicas: list[Engine] = []
+        self.broker = broker
+        self.sticky_seconds = sticky_seconds
+        self.retry_seconds = retry_seconds
+        self.routed = {"primary": 0}
+        self._down_until: dict[int, float] = {}
+        self._sticky_until: dict[int, float] = {}
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        self._subscribed = False
+
+    def attach(self, replicas: list[Engine]) -> None:
+        """
+        엔진을 만든 뒤(init_engines) 복제본 엔진을 등록합니다.
+        """
+        with self._lock:
+            self.replicas = replicas
+            self.routed.update({f"replica-{i}": 0 for i in range(len(replicas))})
+            # 처음에는 모든 복제본을 연결 확인이 필요한 상태(0)로 둡니다.
+            self._down_until = {i: 0.0 for i in range(len(replicas))}
+        for index, replica in enumerate(replicas):
+            event.listen(replica, "handle_error", functools.partial(self._on_error, index))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self, user_id: int | None) -> tuple[int | None, bool]:
+        """
+        (복제본 번호 또는 primary이면 None, 사용 전에 연결 확인이 필요한지)를 반환합니다.
+        """
+        self._subscribe()
+        now = time.monotonic()
+        with self._lock:
+            if user_id is not None and self._sticky_until.get(user_id, 0) > now:
+                self.routed["primary"] += 1
+                return None, False
+            for _ in range(len(self.replicas)):
+                index = next(self._next) % len(self.replicas)
+                down_until = self._down_until.get(index)
+                if down_until is None:
+                    self.routed[f"replica-{index}"] += 1
+                    return index, False
+                if down_until <= now:
+                    # 다른 요청이 동시에 확인하지 않도록 확인하는 동안에는 계속 down으로 둡니다.
+                    self._down_until[index] = now + self.retry_seconds
+                    return index, True
+            self.routed["primary"] += 1
+            return None, False
+
+    def mark_up(self, index: int) -> None:
+        with self._lock:
+            self._down_until.pop(index, None)
+            self.routed[f"replica-{index}"] += 1
+
+    def mark_down(self, index: int) -> None:
+        with self._lock:
+            self.routed["primary"] += 1
+            self._down_until[index] = time.monotonic() + self.retry_seconds
+
+    def mark_written(self, user_id: int) -> None:
+        """
+        사용자가 방금 쓰기를 했으므로 sticky_seconds 동안 primary에서 읽게 합니다.
+        """
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._sticky_until[user_id] = now + self.sticky_seconds
+            if len(self._sticky_until) > _STICKY_PRUNE_SIZE:
+                self._sticky_until = {
+                    key: until for key, until in self._sticky_until.items() if until > now
+                }
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "routed": dict(self.routed),
+                "down": sorted(i for i, until in self._down_until.items() if until > now),
+            }
+
+    def _subscribe(self) -> None:
+        if self._subscribed or not self.enabled:
+            return
+        with self._lock:
+            if self._subscribed:
+                return
+            self._subscribed = True
+        self.broker.subscribe(self._on_message)
+
+    def _on_message(self, message: dict) -> None:
+        if message.get("type") == APPLICATIONS_UPDATED:
+            self.mark_written(message["user_id"])
+
+    def _on_error(self, index: int, context) -> None:
+        # 연결이 끊겼거나 연결할 수 없는 경우에만 복제본을 빼고, SQL 오류는 그대로 둡니다.
+        if context.is_disconnect or context.connection is None:
+            with self._lock:
+                self._down_until[index] = time.monotonic() + self.retry_seconds
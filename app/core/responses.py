@@ -0,0 +1,84 @@
+import functools
+import hashlib
+from typing import Any, NamedTuple
+
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.core.compression import negotiate, precompress
+from app.core.config import settings
+
+
+class CachedPayload(NamedTuple):
+    """
+    미리 직렬화된 JSON 응답 본문과 강한(strong) ETag, 인코딩별로 미리 압축한 본문입니다.
+    """
+
+    body: bytes
+    etag: str
+    encoded: dict[str, bytes]
+
+
+def make_cached_payload(body: bytes) -> CachedPayload:
+    """
+    캐시에 넣기 전에 한 번만 압축해 두므로 요청마다 다시 압축하지 않습니다.
+    """
+    return CachedPayload(
+        body=body,
+        etag=f'"{hashlib.sha1(body).hexdigest()}"',
+        encoded=precompress(body),
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def cached_json_response(request: Request, payload: CachedPayload) -> Response:
+    """
+    If-None-Match가 ETag와 일치하면 본문 없이 304를, 아니면 캐시된 본문을 반환합니다.
+    Accept-Encoding에 맞는 미리 압축된 본문이 있으면 그것을 보냅니다.
+    압축된 본문은 다른 표현이므로 ETag에 인코딩을 붙입니다. (예: "<sha1>-br")
+    """
+    encoding = negotiate(request.headers.get("accept-encoding"), tuple(payload.encoded))
+    etag = payload.etag if encoding is None else f'{payload.etag[:-1]}-{encoding}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    body = payload.body
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        body = payload.encoded[encoding]
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@functools.cache
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def validate_content(content: Any, schema: Any) -> None:
+    """
+    VALIDATE_RESPONSES=true이면 응답 내용을 스키마로 검증합니다. (실패 시 ValidationError)
+    """
+    if settings.validate_responses:
+        _adapter(schema).validate_python(content)
+
+
+def fast_json_response(content: Any, schema: Any) -> ORJSONResponse:
+    """
+    Row에서 바로 만든 dict/list를 orjson으로 직렬화하여 반환합니다.
+    Response를 직접 반환하므로 FastAPI의 response_model 검증/직렬화를 거치지 않습니다.
+    (response_model은 문서화와 VALIDATE_RESPONSES 검증에만 사용됩니다.)
+    """
+    validate_content(content, schema)
+    return ORJSONResponse(content)
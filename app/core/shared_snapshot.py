@@ -0,0 +1,185 @@
+"""
+여러 워커 프로세스가 함께 읽는 mmap 공유 스냅샷 파일입니다. (쓰는 프로세스 하나, 읽는 프로세스 여럿)
+
+파일 형식: [헤더 64바이트][본문]
+헤더: magic(u32), 형식 버전(u32), seq(u64), generation(u64), taken_at(f64, unix time), 본문 길이(u64)
+
+- 쓰기(seqlock): seq를 홀수로 올리고, 본문과 헤더 값을 쓴 뒤, seq를 다시 짝수로 올립니다.
+- 읽기: seq가 짝수인지 확인하고, 본문을 mmap 위에서 복사 없이 읽은 뒤(parse), seq가 그대로인지
+  다시 확인합니다. 그 사이에 쓰기가 있었으면 다시 읽습니다. 따라서 parse는 본문 memoryview를
+  밖으로 넘기지 말고 필요한 값만 꺼내야 하며, 쓰는 중인 본문을 읽어 예외가 나도 다시 읽습니다.
+- 쓰는 프로세스는 <path>.lock의 flock으로 하나만 정합니다. 그 프로세스가 끝나면 잠금이 풀리므로
+  다른 워커가 다음 갱신 때 이어받습니다.
+- 저장 순서가 다른 프로세스에도 그대로 보이는 CPU(x86-64의 TSO)를 전제로 합니다.
+  Python에서는 메모리 배리어를 넣을 수 없습니다.
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, NamedTuple
+
+_MAGIC = 0x4B4E5553  # "KNUS"
+FORMAT_VERSION = 1
+# magic, 형식 버전, seq, generation, taken_at, 본문 길이
+_HEADER = struct.Struct("<IIQQdQ")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = 8
+HEADER_SIZE = 64
+# 본문이 커질 때 파일을 이 단위로 늘립니다.
+_GROW_SIZE = 1 << 20
+_READ_ATTEMPTS = 100
+
+
+class SnapshotHeader(NamedTuple):
+    generation: int
+    taken_at: float
+    length: int
+
+
+class SharedSnapshot:
+    def __init__(self, path: str):
+        self.path = path
+        self._map: mmap.mmap | None = None
+        self._map_lock = threading.Lock()
+        self._writer_fd: int | None = None
+        self._writer_lock = threading.Lock()
+
+    def _mapping(self, min_size: int = HEADER_SIZE) -> mmap.mmap | None:
+        """
+        파일 전체를 매핑합니다. 파일이 아직 없거나(쓰는 워커가 만들기 전) 본문이 매핑보다 커졌으면
+        다시 엽니다.
+        """
+        current = self._map
+        if current is not None and len(current) >= min_size:
+            return current
+        with self._map_lock:
+            if self._map is not None and len(self._map) >= min_size:
+                return self._map
+            try:
+                fd = os.open(self.path, os.O_RDONLY)
+            except FileNotFoundError:
+                return None
+            try:
+                size = os.fstat(fd).st_size
+                if size < max(min_size, HEADER_SIZE):
+                    return None
+                # 이전 매핑은 읽는 중인 요청이 있을 수 있으므로 닫지 않고 참조만 버립니다.
+                self._map = mmap.mmap(fd, size, prot=mmap.PROT_READ)
+            finally:
+                os.close(fd)
+            return self._map
+
+    def _read_header(self, data) -> tuple[int, SnapshotHeader] | None:
+        magic, version, seq, generation, taken_at, length = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            return None
+        return seq, SnapshotHeader(generation, taken_at, length)
+
+    def header(self) -> SnapshotHeader | None:
+        """
+        마지막으로 완료된 쓰기의 헤더입니다. (본문은 읽지 않습니다.)
+        """
+        data = self._mapping()
+        if data is None:
+            return None
+        for _ in range(_READ_ATTEMPTS):
+            result = self._read_header(data)
+            if result is None:
+                return None
+            seq, header = result
+            if seq % 2 == 0 and _SEQ.unpack_from(data, _SEQ_OFFSET)[0] == seq:
+                return header
+            time.sleep(0)
+        return None
+
+    def read(self, parse: Callable[[memoryview], Any]) -> tuple[SnapshotHeader, Any] | None:
+        """
+        (헤더, parse(본문))을 반환합니다. 스냅샷이 없거나 계속 쓰는 중이면 None입니다.
+        """
+        data = self._mapping()
+        if data is None:
+            return None
+        for _ in range(_READ_ATTEMPTS):
+            result = self._read_header(data)
+            if result is None:
+                return None
+            seq, header = result
+            if seq % 2:
+                time.sleep(0)
+                continue
+            if HEADER_SIZE + header.length > len(data):
+                data = self._mapping(HEADER_SIZE + header.length)
+                if data is None:
+                    return None
+                continue
+            try:
+                value = parse(memoryview(data)[HEADER_SIZE : HEADER_SIZE + header.length])
+            except Exception:
+                if _SEQ.unpack_from(data, _SEQ_OFFSET)[0] == seq:
+                    raise
+                continue
+            if _SEQ.unpack_from(data, _SEQ_OFFSET)[0] == seq:
+                return header, value
+        return None
+
+    def try_acquire_writer(self) -> bool:
+        """
+        이 프로세스가 쓰는 프로세스이면(이거나 지금 그렇게 되었으면) True입니다.
+        """
+        with self._writer_lock:
+            if self._writer_fd is not None:
+                return True
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            self._writer_fd = fd
+            return True
+
+    def release_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer_fd is not None:
+                os.close(self._writer_fd)
+                self._writer_fd = None
+
+    def write(self, body: bytes, taken_at: float) -> int:
+        """
+        본문을 새 스냅샷으로 씁니다. (try_acquire_writer가 True인 프로세스만 호출합니다.)
+        generation을 반환합니다.
+        """
+        needed = HEADER_SIZE + len(body)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            if size < needed:
+                size = (needed + _GROW_SIZE - 1) // _GROW_SIZE * _GROW_SIZE
+                os.ftruncate(fd, size)
+            data = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        with data:
+            result = self._read_header(data)
+            seq, generation = (result[0] + result[0] % 2, result[1].generation) if result else (0, 0)
+            # 본문이 그대로면 taken_at만 바꾸고 generation을 유지합니다. (generation별 캐시와 ETag 유지)
+            unchanged = (
+                result is not None
+                and result[1].length == len(body)
+                and data[HEADER_SIZE:needed] == body
+            )
+            if not unchanged:
+                generation += 1
+            _SEQ.pack_into(data, _SEQ_OFFSET, seq + 1)
+            if not unchanged:
+                data[HEADER_SIZE:needed] = body
+            _HEADER.pack_into(
+                data, 0, _MAGIC, FORMAT_VERSION, seq + 1, generation, taken_at, len(body)
+            )
+            _SEQ.pack_into(data, _SEQ_OFFSET, seq + 2)
+        return generation
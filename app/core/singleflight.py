@@ -0,0 +1,80 @@
+"""
+같은 키로 동시에 들어온 조회를 하나로 합칩니다. (single-flight)
+
+먼저 들어온 요청 하나만 실제로 조회하고, 그 조회가 끝나기 전에 같은 키로 들어온 요청들은
+결과(또는 예외)를 함께 받습니다. 결과를 캐시하지는 않으므로 조회가 끝난 뒤의 요청은 새로 조회합니다.
+공유된 결과는 여러 요청이 함께 읽으므로 수정하면 안 됩니다.
+AsyncSingleFlight의 조회는 먼저 들어온 요청이 취소되어도 계속되므로, 그 요청의 세션처럼 요청이 끝나면
+닫히는 자원을 쓰면 안 됩니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    sync 엔드포인트(스레드풀)용입니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    async 엔드포인트(이벤트 루프)용입니다.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        # 먼저 들어온 요청을 포함해 어느 요청이 취소되어도 다른 요청이 기다리는 조회는 계속되어야 합니다.
+        return await asyncio.shield(task)
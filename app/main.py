@@ -1,11 +1,56 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from app.core.database import Base, engine
-from app.api import auth, universities, users
+from fastapi.responses import ORJSONResponse
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.database import dispose_engines, init_engines, log_pool_stats
+from app.core.events import broker
+from app.core.metrics import RouteMetricsMiddleware, run_collector
+from app.core.query_stats import QueryStatsMiddleware
+from app.services.applicant_snapshot import applicant_snapshot, run_writer
 from fastapi.middleware.cors import CORSMiddleware
+from app.api import metrics
+
+# 같은 엔드포인트를 sync/async 두 모드로 제공하여 처리량을 비교할 수 있습니다.
+if settings.db_mode == "async":
+    from app.api import auth_async as auth
+    from app.api import universities_async as universities
+    from app.api import users_async as users
+    from app.services import application_writes_async as application_writes
+else:
+    from app.api import auth, universities, users
+    from app.services import application_writes
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 엔진만 만들고 연결은 첫 요청에서 맺습니다.
+    # 스키마는 워커 시작 경로가 아니라 배포 시 alembic upgrade head로 한 번만 맞춥니다.
+    init_engines()
+    collector = asyncio.create_task(run_collector(settings.metrics_collect_seconds))
+    snapshot_writer = None
+    if applicant_snapshot.enabled:
+        snapshot_writer = asyncio.create_task(
+            run_writer(settings.shared_snapshot_refresh_seconds)
+        )
+    yield
+    collector.cancel()
+    if snapshot_writer is not None:
+        snapshot_writer.cancel()
+    # 큐에 남은 지원 내역 수정을 반영한 뒤 엔진을 닫습니다.
+    await application_writes.application_write_queue.close()
+    # 워커가 끝날 때의 풀 상태와 복제본 라우팅 횟수 (/metrics에 없는 값 포함)
+    log_pool_stats()
+    await dispose_engines()
+    broker.close()
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# 가장 안쪽 미들웨어입니다. (다른 미들웨어의 시간은 라우트 처리 시간에 넣지 않습니다.)
+app.add_middleware(RouteMetricsMiddleware)
 
 origins = [
     "https://soma-woad.vercel.app",
@@ -22,6 +67,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 압축 시간이 Server-Timing(app)에 포함되도록 QueryStatsMiddleware 안쪽에 둡니다.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    thread_size=settings.compression_thread_size,
+)
+app.add_middleware(QueryStatsMiddleware, slow_request_ms=settings.slow_request_ms)
+
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/users", tags=["Users"])
 app.include_router(universities.router, prefix="/universities", tags=["Universities"])
+app.include_router(metrics.router)
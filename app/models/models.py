@@ -1,4 +1,14 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, func
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    ForeignKey,
+    DateTime,
+    Index,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -9,7 +19,8 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     uuid = Column(String(36), unique=True, nullable=False)
     nickname = Column(String(255), nullable=True)
-    grade = Column(Float, nullable=False)
+    # 지원자 목록 정렬(ORDER BY grade DESC, id)용 인덱스
+    grade = Column(Float, nullable=False, index=True)
     lang = Column(String(255), nullable=False)
     modify_count = Column(Integer, default=4, nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
@@ -27,6 +38,8 @@ class PartnerUniversity(Base):
     country = Column(String(255), nullable=False)
     slot = Column(Integer, nullable=False)
     duration = Column(String(255), nullable=False)  # "1개학기" or "2개학기"
+    # 지원자 수 카운터 (update_user_applications에서 증감, reconcile로 재계산)
+    applicant_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(
         DateTime, default=func.now(), onupdate=func.now(), nullable=False
@@ -37,6 +50,12 @@ class PartnerUniversity(Base):
 
 class Application(Base):
     __tablename__ = "application"
+    __table_args__ = (
+        # 사용자별 조회/삭제 (user_id 단독 조건도 이 인덱스를 사용)
+        UniqueConstraint("user_id", "choice", name="uq_application_user_choice"),
+        # 대학별 지원자 조회/집계
+        Index("ix_application_university_user", "partner_university_id", "user_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     partner_university_id = Column(
@@ -50,4 +69,14 @@ class Application(Base):
 
     user = relationship("User", back_populates="applications")
     university = relationship("PartnerUniversity", back_populates="applications")
-    # 인덱스 질문 드리기
+
+
+class UniversityCatalogVersion(Base):
+    """
+    파트너 대학 정보(이름, 국가, 모집 인원, 기간)가 바뀔 때마다 올리는 버전입니다.
+    워커의 대학 카탈로그는 이 값이 바뀌면 다시 읽습니다. (행은 id=1 하나)
+    """
+
+    __tablename__ = "university_catalog_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
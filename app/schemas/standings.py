@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class ChoiceStanding(BaseModel):
+    choice: int
+    universityId: int
+    universityName: str
+    slot: int
+    applicants: int
+    # 해당 학교 지원자 중 순위 (학점 내림차순, 동점이면 사용자 ID 오름차순)
+    rank: int
+    # 지망 순위와 무관하게 학점만으로 뽑을 때의 커트라인 (지원자가 정원 이하면 None)
+    cutoffGrade: float | None
+    # 1지망부터 차례로 배정했을 때의 커트라인 (배정 인원이 정원 미만이면 None)
+    projectedCutoffGrade: float | None
+    projectedAdmitted: bool
+
+
+class StandingsResponse(BaseModel):
+    grade: float
+    # 1지망부터 차례로 배정했을 때 합격이 예상되는 학교 (없으면 None)
+    projectedUniversityId: int | None
+    choices: list[ChoiceStanding]
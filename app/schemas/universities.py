@@ -28,3 +28,12 @@ class UniversityDetailResponse(BaseModel):
     slot: int
     totalApplicants: int
     applicants: list[ApplicantDetail]
+
+
+class MyRankResponse(BaseModel):
+    universityId: int
+    choice: int
+    grade: float
+    rank: int
+    slot: int
+    totalApplicants: int
@@ -32,6 +32,14 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# 공개 프로필 일괄 조회 시 최대 사용자 수
+MAX_USER_BATCH_SIZE = 100
+
+
+class PublicUsersRequest(BaseModel):
+    userIds: list[int] = Field(..., min_length=1, max_length=MAX_USER_BATCH_SIZE)
+
+
 class PublicUserResponse(BaseModel):
     id: int
     nickname: str
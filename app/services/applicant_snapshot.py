@@ -0,0 +1,348 @@
+"""
+대학별 지원자 수와 (선택) 대학별 지원자 정렬 배열을 모든 워커가 함께 읽는 공유 스냅샷입니다.
+
+워커마다 대학 목록/지원자 수를 따로 조회해 캐시하면 같은 집계를 워커 수만큼 반복하고, 워커마다 값이
+조금씩 달라집니다. 그래서 워커 하나(app.core.shared_snapshot의 writer)만 SHARED_SNAPSHOT_REFRESH_SECONDS마다
+primary에서 읽어 SHARED_SNAPSHOT_PATH에 쓰고, 모든 워커는 그 파일을 mmap으로 복사 없이 읽습니다.
+
+- 만든 지 SHARED_SNAPSHOT_MAX_AGE_SECONDS가 지난 스냅샷은 쓰지 않고 지금처럼 DB에서 읽습니다.
+- 조회하는 사용자가 스냅샷을 만든 뒤에 지원 내역을 수정했다면 그 사용자에게는 DB 결과를 보여 줍니다.
+  (수정 시각은 publish_application_update와 브로커 이벤트로 기록합니다.)
+  EVENT_BROKER=memory이면 이벤트가 수정을 처리한 워커에만 전달되므로, 다른 워커로 간 조회는
+  자신의 수정 전 값을 최대 SHARED_SNAPSHOT_MAX_AGE_SECONDS 동안 볼 수 있습니다. 그래서 기본값은 꺼져 있고,
+  여러 워커에서는 EVENT_BROKER=local-socket과 함께 켭니다. (다른 사용자의 수정은 어느 경우든 그만큼 늦게 보입니다.)
+- SHARED_SNAPSHOT_GRADES=true이면 대학별 지원자를 (학점 내림차순, 사용자 ID) 순으로 정렬한 배열도 넣어
+  GET /universities/{id}/me의 순위를 이진 탐색으로 계산합니다. 전체 지원 내역을 읽으므로 갱신 비용이 큽니다.
+
+본문 형식 (little-endian):
+    대학 수 n(i64), 정렬 배열 길이 m(i64, 배열이 없으면 -1)
+    대학 ID[n](i64, 오름차순), 지원자 수[n](i64, applicant_count)
+    m >= 0이면: 대학별 시작 위치[n+1](i64), 학점[m](f64), 사용자 ID[m](i64), choice[m](u8)
+"""
+
+import asyncio
+import bisect
+import logging
+import struct
+import threading
+import time
+from array import array
+from typing import NamedTuple
+
+from sqlalchemy import Select, select
+from starlette.concurrency import run_in_threadpool
+
+from app.core import database
+from app.core.config import settings
+from app.core.events import APPLICATIONS_UPDATED, broker
+from app.core.metrics import REGISTRY
+from app.core.shared_snapshot import SharedSnapshot
+from app.models import models
+
+logger = logging.getLogger(__name__)
+
+_BODY_HEADER = struct.Struct("<qq")
+# 수정 시각 기록이 이 수를 넘으면 스냅샷 유효 기간이 지난 항목을 정리합니다.
+_WRITES_PRUNE_SIZE = 10_000
+
+# result: fresh | stale(없음, 오래됨, 사용자가 그 뒤에 수정함)
+snapshot_reads = REGISTRY.counter(
+    "knu_shared_snapshot_reads", "공유 스냅샷 조회 결과", ("result",)
+)
+
+
+class RankEntry(NamedTuple):
+    choice: int
+    rank: int
+    applicant_count: int
+
+
+def counts_statement() -> Select:
+    return select(
+        models.PartnerUniversity.id, models.PartnerUniversity.applicant_count
+    ).order_by(models.PartnerUniversity.id)
+
+
+def grades_statement() -> Select:
+    """
+    대학별 지원자를 APPLICANT_ORDER(학점 내림차순, ID 오름차순)로 조회합니다.
+    """
+    return (
+        select(
+            models.Application.partner_university_id,
+            models.User.grade,
+            models.User.id,
+            models.Application.choice,
+        )
+        .join(models.User, models.User.id == models.Application.user_id)
+        .order_by(
+            models.Application.partner_university_id,
+            models.User.grade.desc(),
+            models.User.id,
+        )
+    )
+
+
+def encode_snapshot(count_rows, grade_rows=None) -> bytes:
+    """
+    counts_statement()와 (선택) grades_statement() 결과를 스냅샷 본문으로 만듭니다.
+    """
+    ids = array("q")
+    counts = array("q")
+    for university_id, applicant_count in count_rows:
+        ids.append(university_id)
+        counts.append(applicant_count)
+    if grade_rows is None:
+        return _BODY_HEADER.pack(len(ids), -1) + ids.tobytes() + counts.tobytes()
+
+    positions = {university_id: i for i, university_id in enumerate(ids)}
+    sizes = [0] * len(ids)
+    grades = array("d")
+    user_ids = array("q")
+    choices = array("B")
+    for university_id, grade, user_id, choice in grade_rows:
+        position = positions.get(university_id)
+        if position is None:
+            continue
+        sizes[position] += 1
+        grades.append(grade)
+        user_ids.append(user_id)
+        choices.append(choice)
+    offsets = array("q", [0])
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+    return b"".join(
+        (
+            _BODY_HEADER.pack(len(ids), len(grades)),
+            ids.tobytes(),
+            counts.tobytes(),
+            offsets.tobytes(),
+            grades.tobytes(),
+            user_ids.tobytes(),
+            choices.tobytes(),
+        )
+    )
+
+
+def _columns(body: memoryview):
+    """
+    본문 위의 열 memoryview들 (ids, counts, offsets, grades, user_ids, choices)입니다.
+    정렬 배열이 없으면 뒤의 넷은 None입니다.
+    """
+    n, m = _BODY_HEADER.unpack_from(body, 0)
+    position = _BODY_HEADER.size
+    ids = body[position : position + 8 * n].cast("q")
+    position += 8 * n
+    counts = body[position : position + 8 * n].cast("q")
+    position += 8 * n
+    if m < 0:
+        return ids, counts, None, None, None, None
+    offsets = body[position : position + 8 * (n + 1)].cast("q")
+    position += 8 * (n + 1)
+    grades = body[position : position + 8 * m].cast("d")
+    position += 8 * m
+    user_ids = body[position : position + 8 * m].cast("q")
+    position += 8 * m
+    choices = body[position : position + m]
+    return ids, counts, offsets, grades, user_ids, choices
+
+
+def parse_counts(body: memoryview) -> dict[int, int]:
+    ids, counts, *_ = _columns(body)
+    return dict(zip(ids.tolist(), counts.tolist()))
+
+
+def parse_rank(
+    body: memoryview, university_id: int, user_id: int, grade: float
+) -> RankEntry | None:
+    """
+    정렬 배열에서 (학점, 사용자 ID)를 이진 탐색합니다. 배열이 없거나 지원 내역이 없으면 None입니다.
+    """
+    ids, counts, offsets, grades, user_ids, choices = _columns(body)
+    if offsets is None:
+        return None
+    position = bisect.bisect_left(ids, university_id)
+    if position == len(ids) or ids[position] != university_id:
+        return None
+    start, end = offsets[position], offsets[position + 1]
+    # (-학점, 사용자 ID)가 (-grade, user_id)보다 작은(앞선) 항목 수를 셉니다.
+    low, high = start, end
+    while low < high:
+        middle = (low + high) // 2
+        other_grade = grades[middle]
+        if other_grade > grade or (other_grade == grade and user_ids[middle] < user_id):
+            low = middle + 1
+        else:
+            high = middle
+    if low == end or user_ids[low] != user_id or grades[low] != grade:
+        return None
+    return RankEntry(choices[low], low - start + 1, counts[position])
+
+
+class ApplicantSnapshot:
+    """
+    워커마다 하나씩 두는 스냅샷 읽기/쓰기 관리자입니다.
+    """
+
+    def __init__(self, path: str, max_age_seconds: float, grades: bool):
+        self.snapshot = SharedSnapshot(path) if path else None
+        self.max_age_seconds = max_age_seconds
+        self.grades = grades
+        self._written_at: dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._subscribed = False
+        # generation별로 한 번만 dict로 만듭니다. (generation, {대학ID: 지원자 수})
+        self._counts: tuple[int, dict[int, int]] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.snapshot is not None
+
+    def mark_written(self, user_id: int) -> None:
+        """
+        사용자가 방금 지원 내역을 수정했으므로 그 뒤에 만든 스냅샷만 보여 주게 합니다.
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            self._written_at[user_id] = now
+            if len(self._written_at) > _WRITES_PRUNE_SIZE:
+                self._written_at = {
+                    key: at
+                    for key, at in self._written_at.items()
+                    if now - at <= self.max_age_seconds
+                }
+
+    def _subscribe(self) -> None:
+        if self._subscribed:
+            return
+        with self._lock:
+            if self._subscribed:
+                return
+            self._subscribed = True
+        broker.subscribe(self._on_message)
+
+    def _on_message(self, message: dict) -> None:
+        if message.get("type") == APPLICATIONS_UPDATED:
+            self.mark_written(message["user_id"])
+
+    def _is_fresh(self, taken_at: float, user_id: int | None) -> bool:
+        if time.time() - taken_at > self.max_age_seconds:
+            return False
+        return user_id is None or self._written_at.get(user_id, 0.0) <= taken_at
+
+    def fresh_generation(self, user_id: int | None) -> int | None:
+        """
+        user_id에게 보여 줄 수 있는 스냅샷의 generation입니다. (본문은 읽지 않습니다.)
+        """
+        if not self.enabled:
+            return None
+        self._subscribe()
+        header = self.snapshot.header()
+        if header is None or not self._is_fresh(header.taken_at, user_id):
+            snapshot_reads.labels("stale").inc()
+            return None
+        snapshot_reads.labels("fresh").inc()
+        return header.generation
+
+    def get_counts(self, user_id: int | None) -> tuple[int, dict[int, int]] | None:
+        """
+        (generation, {대학ID: 지원자 수})입니다. 쓸 수 있는 스냅샷이 없으면 None입니다.
+        반환한 dict는 같은 generation의 요청들이 함께 쓰므로 수정하면 안 됩니다.
+        """
+        generation = self.fresh_generation(user_id)
+        if generation is None:
+            return None
+        cached = self._counts
+        if cached is not None and cached[0] == generation:
+            return cached
+        result = self.snapshot.read(parse_counts)
+        if result is None:
+            return None
+        header, counts = result
+        self._counts = (header.generation, counts)
+        return self._counts
+
+    def get_rank(self, university_id: int, user_id: int, grade: float) -> RankEntry | None:
+        """
+        스냅샷의 정렬 배열로 계산한 순위입니다. 쓸 수 있는 스냅샷이 없거나, 배열이 없거나,
+        스냅샷에서 지원 내역을 찾지 못하면(그 뒤에 지원했을 수 있으므로) None입니다.
+        """
+        if not self.grades or self.fresh_generation(user_id) is None:
+            return None
+        result = self.snapshot.read(
+            lambda body: parse_rank(body, university_id, user_id, grade)
+        )
+        if result is None or not self._is_fresh(result[0].taken_at, user_id):
+            return None
+        return result[1]
+
+    def write(self, count_rows, grade_rows, taken_at: float) -> int:
+        return self.snapshot.write(encode_snapshot(count_rows, grade_rows), taken_at)
+
+
+applicant_snapshot = ApplicantSnapshot(
+    path=settings.shared_snapshot_path,
+    max_age_seconds=settings.shared_snapshot_max_age_seconds,
+    grades=settings.shared_snapshot_grades,
+)
+
+
+def refresh(db) -> int:
+    """
+    primary에서 읽어 스냅샷을 새로 씁니다. (sync 세션)
+    """
+    # 조회 시작 전 시각을 기록해야 그 전에 커밋된 수정이 모두 들어 있다고 볼 수 있습니다.
+    taken_at = time.time()
+    count_rows = db.execute(counts_statement()).all()
+    grade_rows = db.execute(grades_statement()) if applicant_snapshot.grades else None
+    return applicant_snapshot.write(count_rows, grade_rows, taken_at)
+
+
+async def refresh_async(db) -> int:
+    """
+    refresh의 AsyncSession 버전입니다.
+    """
+    taken_at = time.time()
+    count_rows = (await db.execute(counts_statement())).all()
+    grade_rows = None
+    if applicant_snapshot.grades:
+        grade_rows = (await db.execute(grades_statement())).all()
+    return await asyncio.to_thread(
+        applicant_snapshot.write, count_rows, grade_rows, taken_at
+    )
+
+
+def _refresh_sync() -> int:
+    with database.SessionLocal() as db:
+        return refresh(db)
+
+
+async def run_writer(interval: float) -> None:
+    """
+    lifespan에서 워커마다 실행합니다. 쓰기 잠금을 가진 워커만 스냅샷을 갱신하고,
+    나머지는 그 워커가 끝나면 이어받을 수 있도록 주기마다 잠금을 시도합니다.
+    """
+    snapshot = applicant_snapshot.snapshot
+    if settings.event_broker != "local-socket":
+        logger.warning(
+            "shared snapshot with EVENT_BROKER=%s: other workers may serve a user's "
+            "pre-update counts for up to %.0fs",
+            settings.event_broker,
+            applicant_snapshot.max_age_seconds,
+        )
+    try:
+        while True:
+            try:
+                if await asyncio.to_thread(snapshot.try_acquire_writer):
+                    if settings.db_mode == "async":
+                        async with database.AsyncSessionLocal() as db:
+                            await refresh_async(db)
+                    else:
+                        await run_in_threadpool(_refresh_sync)
+            except Exception:
+                logger.exception("failed to refresh applicant snapshot")
+            await asyncio.sleep(interval)
+    finally:
+        snapshot.release_writer()
@@ -0,0 +1,170 @@
+"""
+대학별 지원자 수 변화를 SSE(GET /universities/stream)로 전달하는 워커별 허브입니다.
+
+- 지원 내역 수정이 커밋되면 user_service.publish_application_update()가 브로커에 발행합니다.
+- 브로커는 모든 워커에 메시지를 전달하고, 각 워커의 허브가 증감량을 구독자들에게 나눠 줍니다.
+- 구독자마다 아직 보내지 못한 증감량을 대학별로 합쳐 두므로, 느린 구독자가 있어도
+  대기열이 대학 수 이상으로 커지지 않습니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core import database
+from app.core.events import APPLICATIONS_UPDATED, Broker, broker
+from app.services.applicant_snapshot import applicant_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class _Subscriber:
+    __slots__ = ("pending", "wakeup")
+
+    def __init__(self):
+        self.pending: dict[int, int] = {}
+        self.wakeup = asyncio.Event()
+
+
+def _sse(event: str, data: dict[int, int]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def _load_counts() -> dict[int, int]:
+    # 공유 스냅샷이 유효하면 DB를 조회하지 않습니다. (delta로 값을 바꾸므로 복사해서 씁니다.)
+    snapshot = applicant_snapshot.get_counts(None)
+    if snapshot is not None:
+        return dict(snapshot[1])
+    if settings.db_mode == "async":
+        import app.services.university_async as university_async_service
+
+        async with database.AsyncSessionLocal() as db:
+            rows = await university_async_service.get_universities_with_applicant_count(
+                db
+            )
+    else:
+        import app.services.university as university_service
+
+        def load():
+            with database.SessionLocal() as db:
+                return university_service.get_universities_with_applicant_count(db)
+
+        rows = await run_in_threadpool(load)
+    return {row.id: row.applicant_count for row in rows}
+
+
+class ApplicantCountHub:
+    def __init__(
+        self,
+        broker: Broker,
+        coalesce_seconds: float,
+        snapshot_seconds: float,
+        max_subscribers: int,
+    ):
+        self.broker = broker
+        self.coalesce_seconds = coalesce_seconds
+        self.snapshot_seconds = snapshot_seconds
+        self.max_subscribers = max_subscribers
+        self.counts: dict[int, int] | None = None
+        self._subscribers: set[_Subscriber] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._broker_subscribed = False
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._subscribers) >= self.max_subscribers
+
+    def _on_message(self, message: dict) -> None:
+        if message.get("type") != APPLICATIONS_UPDATED:
+            return
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        deltas = {
+            int(university_id): delta
+            for university_id, delta in message.get("deltas", {}).items()
+        }
+        loop.call_soon_threadsafe(self._apply, deltas)
+
+    def _apply(self, deltas: dict[int, int]) -> None:
+        if self.counts is not None:
+            for university_id, delta in deltas.items():
+                self.counts[university_id] = self.counts.get(university_id, 0) + delta
+        for subscriber in self._subscribers:
+            for university_id, delta in deltas.items():
+                subscriber.pending[university_id] = (
+                    subscriber.pending.get(university_id, 0) + delta
+                )
+            subscriber.wakeup.set()
+
+    async def _refresh_loop(self) -> None:
+        # 발행이 유실되었거나 다른 경로로 바뀐 값을 주기적으로 DB 기준으로 맞춥니다.
+        while self._subscribers:
+            await asyncio.sleep(self.snapshot_seconds)
+            try:
+                self.counts = await _load_counts()
+            except Exception:
+                logger.exception("failed to refresh applicant counts")
+
+    def _start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if not self._broker_subscribed:
+            self.broker.subscribe(self._on_message)
+            self._broker_subscribed = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stream(self):
+        """
+        SSE 이벤트 문자열을 생성합니다.
+        처음과 snapshot_seconds마다 전체 값(snapshot)을, 그 사이에는 합쳐진 증감량(delta)을 보냅니다.
+        """
+        subscriber = _Subscriber()
+        self._subscribers.add(subscriber)
+        self._start()
+        try:
+            if self.counts is None:
+                self.counts = await _load_counts()
+            subscriber.pending.clear()
+            yield _sse("snapshot", self.counts)
+            last_snapshot = time.monotonic()
+
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        subscriber.wakeup.wait(), timeout=self.snapshot_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    # 짧은 시간 동안 몰린 변경을 하나의 delta로 합칩니다.
+                    await asyncio.sleep(self.coalesce_seconds)
+
+                subscriber.wakeup.clear()
+                pending, subscriber.pending = subscriber.pending, {}
+                if time.monotonic() - last_snapshot >= self.snapshot_seconds:
+                    yield _sse("snapshot", self.counts)
+                    last_snapshot = time.monotonic()
+                    continue
+                pending = {key: value for key, value in pending.items() if value}
+                if pending:
+                    yield _sse("delta", pending)
+        finally:
+            self._subscribers.discard(subscriber)
+
+
+applicant_count_hub = ApplicantCountHub(
+    broker=broker,
+    coalesce_seconds=settings.stream_coalesce_seconds,
+    snapshot_seconds=settings.stream_snapshot_seconds,
+    max_subscribers=settings.stream_max_subscribers,
+)
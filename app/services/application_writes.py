@@ -0,0 +1,47 @@
+"""
+PUT /users/me/applications 그룹 커밋 파이프라인입니다. (APPLICATION_WRITE_PIPELINE=true)
+
+마감 직전처럼 수정 요청이 몰릴 때 요청마다 트랜잭션을 커밋하면 fsync와 application/user 행 잠금이
+병목이 됩니다. 파이프라인을 켜면 엔드포인트는 요청 세션에서 검증만 하고(check_application_update),
+워커별 writer가 모인 요청을 apply_application_updates로 한 트랜잭션에 반영한 뒤 한 번 커밋합니다.
+
+- modify_count는 요청마다 DB에서 0보다 클 때만 차감합니다. 한 배치에 같은 사용자의 요청이 여러 개
+  있으면 들어온 순서대로 하나씩 반영합니다. (파이프라인을 끈 경우와 같은 결과)
+- submit은 배치가 커밋될 때까지 스레드풀 스레드를 잡고 기다립니다. AnyIO 기본 한도(워커당 40)를
+  다른 sync 엔드포인트와 함께 쓰므로 배치 크기와 큐 길이는 실제로 그 수를 넘지 못합니다.
+  더 크게 모으려면 DB_MODE=async(application_writes_async)로 실행합니다.
+- 커밋 이후의 캐시 무효화와 이벤트 발행은 지금처럼 각 요청이 결과를 받은 뒤 합니다.
+"""
+
+from app.core import database
+from app.core.config import settings
+from app.core.group_commit import GroupCommitQueue
+import app.services.user as user_service
+
+
+def _apply_batch(
+    updates: list[user_service.ApplicationUpdate],
+) -> list[user_service.ApplicationChanges | user_service.ApplicationConflictError]:
+    with database.SessionLocal() as db:
+        results = user_service.apply_application_updates(db, updates)
+        db.commit()
+    return results
+
+
+application_write_queue = GroupCommitQueue(
+    "applications",
+    _apply_batch,
+    max_batch=settings.application_write_batch_size,
+    max_wait_seconds=settings.application_write_batch_wait_ms / 1000,
+    max_depth=settings.application_write_queue_max,
+)
+
+
+def submit_application_update(
+    pending: user_service.ApplicationUpdate,
+) -> user_service.ApplicationChanges:
+    """
+    검증을 마친 수정 요청을 다음 배치로 반영하고 변경 내역을 반환합니다. (커밋까지 끝난 뒤 반환)
+    ApplicationConflictError, GroupCommitQueueFullError를 낼 수 있습니다.
+    """
+    return application_write_queue.submit(pending)
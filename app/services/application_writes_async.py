@@ -0,0 +1,36 @@
+"""
+app.services.application_writes 의 AsyncSession 버전입니다. (DB_MODE=async)
+"""
+
+from app.core import database
+from app.core.config import settings
+from app.core.group_commit import AsyncGroupCommitQueue
+import app.services.user as user_service
+import app.services.user_async as user_async_service
+
+
+async def _apply_batch(
+    updates: list[user_service.ApplicationUpdate],
+) -> list[user_service.ApplicationChanges | user_service.ApplicationConflictError]:
+    async with database.AsyncSessionLocal() as db:
+        results = await user_async_service.apply_application_updates(db, updates)
+        await db.commit()
+    return results
+
+
+application_write_queue = AsyncGroupCommitQueue(
+    "applications",
+    _apply_batch,
+    max_batch=settings.application_write_batch_size,
+    max_wait_seconds=settings.application_write_batch_wait_ms / 1000,
+    max_depth=settings.application_write_queue_max,
+)
+
+
+async def submit_application_update(
+    pending: user_service.ApplicationUpdate,
+) -> user_service.ApplicationChanges:
+    """
+    검증을 마친 수정 요청을 다음 배치로 반영하고 변경 내역을 반환합니다. (커밋까지 끝난 뒤 반환)
+    """
+    return await application_write_queue.submit(pending)
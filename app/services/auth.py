@@ -1,16 +1,30 @@
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta, UTC
 from fastapi.security.utils import get_authorization_scheme_param
 from jose import jwt
 from pydantic import BaseModel
 from fastapi.security import APIKeyHeader
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.cache import TTLCache
+from app.core.rate_limit import (
+    RateLimit,
+    create_rate_limit_store,
+    parse_trusted_proxies,
+)
+from app.core.database import get_async_db, get_db
+from app.core.events import APPLICATIONS_UPDATED, broker
+from app.core.metrics import REGISTRY
 from app.models.models import User
 from jose import JWTError, jwt
 
 from app.services.user import get_user_by_uuid
-from app.core.core import SECRET_KEY
+import app.services.user_async as user_async_service
+from app.core.config import settings
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 35  # 35일
@@ -23,7 +37,7 @@ def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -33,44 +47,187 @@ class TokenData(BaseModel):
 
 api_key_scheme = APIKeyHeader(name="Authorization", auto_error=False)
 
+# POST /auth/token 요청 제한 (클라이언트 IP별 토큰 버킷)
+auth_rate_limit = RateLimit(
+    store=create_rate_limit_store(
+        settings.rate_limit_store, settings.rate_limit_sqlite_path
+    ),
+    scope="auth-token",
+    capacity=settings.auth_rate_limit_capacity,
+    refill_per_second=settings.auth_rate_limit_refill_per_second,
+    trusted_proxies=parse_trusted_proxies(settings.trusted_proxies),
+)
 
-def get_current_user(
-    token: str = Depends(api_key_scheme), db: Session = Depends(get_db)
-) -> User:
+# 검증이 끝난 토큰 -> (uuid, 세대, 사용자 스냅샷)
+# 정상 상태에서는 인증에 DB 조회와 JWT 디코딩이 필요 없습니다.
+_token_cache = TTLCache(
+    maxsize=settings.auth_cache_maxsize, ttl=settings.auth_cache_ttl_seconds
+)
+# 사용자 정보가 바뀔 때마다 증가하는 세대 번호 (uuid -> 세대)
+_user_generations: dict[str, int] = {}
+_generation_lock = threading.Lock()
+# 다른 워커의 지원 내역 수정 이벤트를 구독했는지 여부
+_subscribed = False
+
+# reason: missing_token(헤더 없음/Bearer 아님) | invalid_token(서명/형식 오류) | unknown_user
+auth_failures = REGISTRY.counter(
+    "knu_auth_failures", "get_current_user 인증 실패 수", ("reason",)
+)
+token_cache_lookups = REGISTRY.counter(
+    "knu_auth_token_cache_lookups", "인증 토큰 캐시 조회 수", ("result",)
+)
+token_cache_size = REGISTRY.gauge("knu_auth_token_cache_size", "인증 토큰 캐시 항목 수")
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _snapshot_user(user: User) -> dict:
+    return {
+        attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+    }
+
+
+def _user_from_snapshot(snapshot: dict) -> User:
     """
-    JWT 토큰을 디코딩하고 검증하여 현재 사용자를 반환합니다.
-    이 함수를 Depends()로 사용하면 엔드포인트가 자동으로 보호됩니다.
+    스냅샷으로부터 요청마다 새로운 detached 상태의 User 객체를 만듭니다.
+    다른 워커의 수정을 모르는 오래된 값일 수 있으므로 읽기 전용으로만 사용합니다.
+    세션에 add하여 되돌려 쓰지 말고, modify_count 등은 조건부 UPDATE로 DB 값을 기준으로 바꿉니다.
+    """
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_cached_user(uuid: str) -> None:
     """
+    해당 사용자의 캐시된 인증 정보를 모두 무효화합니다.
+    (modify_count 등 사용자 정보가 바뀐 경우 호출)
+    """
+    with _generation_lock:
+        _user_generations[uuid] = _user_generations.get(uuid, 0) + 1
+
+
+def _on_message(message: dict) -> None:
+    # 다른 워커에서 지원 내역(modify_count)이 바뀐 사용자의 캐시를 버립니다.
+    if message.get("type") == APPLICATIONS_UPDATED and message.get("user_uuid"):
+        invalidate_cached_user(message["user_uuid"])
+
+
+def _subscribe_invalidations() -> None:
+    global _subscribed
+    if _subscribed:
+        return
+    with _generation_lock:
+        if _subscribed:
+            return
+        _subscribed = True
+    broker.subscribe(_on_message)
+
+
+def _collect_token_cache_metrics() -> None:
+    stats = _token_cache.stats()
+    token_cache_lookups.labels("hit").set(stats["hits"])
+    token_cache_lookups.labels("miss").set(stats["misses"])
+    token_cache_size.labels().set(stats["size"])
+
+
+REGISTRY.register_collector(_collect_token_cache_metrics)
+
+
+def _credentials_exception(reason: str) -> HTTPException:
+    auth_failures.labels(reason).inc()
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
+def _parse_bearer_token(token: str | None) -> str:
     scheme, param = get_authorization_scheme_param(token)
     if not token or scheme.lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception("missing_token")
+    return param
 
+
+def _get_cached_user(key: str) -> User | None:
+    cached = _token_cache.get(key)
+    if cached is None:
+        return None
+    uuid, generation, snapshot = cached
+    if generation != _user_generations.get(uuid, 0):
+        _token_cache.pop(key)
+        return None
+    return _user_from_snapshot(snapshot)
+
+
+def _decode_subject(token: str) -> tuple[str, float]:
+    """
+    JWT를 검증하고 (uuid, 만료 시각)을 반환합니다.
+    """
     try:
-        payload = jwt.decode(param, SECRET_KEY, algorithms=[ALGORITHM])
-        uuid: str | None = payload.get("sub")
-        if uuid is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Not authenticated",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception("invalid_token")
+
+    uuid: str | None = payload.get("sub")
+    if uuid is None:
+        raise _credentials_exception("invalid_token")
+    return uuid, payload.get("exp", 0)
+
 
+def _remember_user(key: str, uuid: str, generation: int, user: User, exp: float):
+    # 토큰 만료 시각을 넘겨서 캐시하지 않도록 합니다.
+    _token_cache.set(
+        key, (uuid, generation, _snapshot_user(user)), ttl=exp - time.time()
+    )
+
+
+def get_current_user(
+    token: str = Depends(api_key_scheme), db: Session = Depends(get_db)
+) -> User:
+    """
+    JWT 토큰을 디코딩하고 검증하여 현재 사용자를 반환합니다.
+    이 함수를 Depends()로 사용하면 엔드포인트가 자동으로 보호됩니다.
+    """
+    _subscribe_invalidations()
+    param = _parse_bearer_token(token)
+    key = _token_key(param)
+    user = _get_cached_user(key)
+    if user is not None:
+        return user
+
+    uuid, exp = _decode_subject(param)
+    generation = _user_generations.get(uuid, 0)
     user = get_user_by_uuid(db, uuid=uuid)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception("unknown_user")
+
+    _remember_user(key, uuid, generation, user, exp)
+    return user
+
+
+async def get_current_user_async(
+    token: str = Depends(api_key_scheme), db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    get_current_user의 async 버전입니다. (DB_MODE=async)
+    토큰 캐시는 sync 버전과 공유합니다.
+    """
+    _subscribe_invalidations()
+    param = _parse_bearer_token(token)
+    key = _token_key(param)
+    user = _get_cached_user(key)
+    if user is not None:
+        return user
+
+    uuid, exp = _decode_subject(param)
+    generation = _user_generations.get(uuid, 0)
+    user = await user_async_service.get_user_by_uuid(db, uuid=uuid)
+    if user is None:
+        raise _credentials_exception("unknown_user")
+
+    _remember_user(key, uuid, generation, user, exp)
     return user
@@ -0,0 +1,190 @@
+"""
+파트너 대학 일괄 등록과 지원 현황 내보내기입니다. (app.cli에서 사용)
+
+- 등록: CSV/JSONL을 한 줄씩 읽어 chunk_size 행씩 INSERT ... ON DUPLICATE KEY UPDATE(MySQL) /
+  ON CONFLICT DO UPDATE(SQLite)로 id 기준 upsert 합니다. applicant_count는 건드리지 않습니다.
+- 내보내기: 서버 측 커서(stream_results)로 chunk_size 행씩 읽어 CSV/JSONL 문자열 조각을 생성합니다.
+  전체 결과를 메모리에 올리지 않으므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import io
+import itertools
+from typing import IO, Iterable, Iterator
+
+import orjson
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.models import models
+
+FORMATS = ("csv", "jsonl")
+DEFAULT_CHUNK_SIZE = 1000
+
+UNIVERSITY_FIELDS = ("id", "name", "country", "slot", "duration")
+DURATIONS = ("1개학기", "2개학기")
+
+APPLICATION_EXPORT_FIELDS = (
+    "universityId",
+    "universityName",
+    "country",
+    "slot",
+    "choice",
+    "userId",
+    "email",
+    "nickname",
+    "grade",
+    "lang",
+)
+
+
+def _university_record(raw: dict, line: int) -> dict:
+    missing = [field for field in UNIVERSITY_FIELDS if raw.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"{line}행: {', '.join(missing)} 값이 없습니다.")
+    try:
+        record = {
+            "id": int(raw["id"]),
+            "name": str(raw["name"]).strip(),
+            "country": str(raw["country"]).strip(),
+            "slot": int(raw["slot"]),
+            "duration": str(raw["duration"]).strip(),
+        }
+    except (TypeError, ValueError):
+        raise ValueError(f"{line}행: id와 slot은 정수여야 합니다.")
+    if record["slot"] < 0:
+        raise ValueError(f"{line}행: slot은 0 이상이어야 합니다.")
+    if record["duration"] not in DURATIONS:
+        raise ValueError(f"{line}행: duration은 {' 또는 '.join(DURATIONS)}여야 합니다.")
+    return record
+
+
+def read_university_records(file: IO[str], fmt: str) -> Iterator[dict]:
+    """
+    CSV(헤더 포함) 또는 JSONL 파일에서 파트너 대학 레코드를 한 줄씩 읽고 검증합니다.
+    잘못된 행이 있으면 행 번호와 함께 ValueError를 던집니다.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(file)
+        # 헤더가 1행이므로 데이터는 2행부터입니다.
+        for line, raw in enumerate(reader, 2):
+            yield _university_record(raw, line)
+    elif fmt == "jsonl":
+        for line, text in enumerate(file, 1):
+            if not text.strip():
+                continue
+            try:
+                raw = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                raise ValueError(f"{line}행: JSON 형식이 아닙니다.")
+            if not isinstance(raw, dict):
+                raise ValueError(f"{line}행: JSON 객체가 아닙니다.")
+            yield _university_record(raw, line)
+    else:
+        raise ValueError(f"알 수 없는 형식입니다: {fmt}")
+
+
+def universities_upsert_statement(dialect: str):
+    """
+    id가 이미 있으면 이름/국가/모집 인원/기간만 갱신하는 INSERT 문입니다.
+    """
+    table = models.PartnerUniversity.__table__
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(
+            **{field: stmt.inserted[field] for field in UNIVERSITY_FIELDS[1:]},
+            updated_at=func.now(),
+        )
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                **{field: stmt.excluded[field] for field in UNIVERSITY_FIELDS[1:]},
+                "updated_at": func.now(),
+            },
+        )
+    raise ValueError(f"upsert를 지원하지 않는 DB입니다: {dialect}")
+
+
+def upsert_universities(
+    db: Session, records: Iterable[dict], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    레코드를 chunk_size개씩 묶어 upsert 하고 처리한 행 수를 반환합니다.
+    커밋은 호출한 쪽에서 합니다. (전체가 한 트랜잭션이므로 중간에 실패하면 모두 롤백됩니다.)
+    """
+    stmt = universities_upsert_statement(db.get_bind().dialect.name)
+    records = iter(records)
+    count = 0
+    while chunk := list(itertools.islice(records, chunk_size)):
+        db.execute(stmt, chunk)
+        count += len(chunk)
+    return count
+
+
+def applications_export_statement() -> Select:
+    """
+    지원 내역을 사용자 학점, 대학 정보와 함께 대학별·학점순(APPLICANT_ORDER와 같은 순서)으로 조회합니다.
+    """
+    return (
+        select(
+            models.PartnerUniversity.id,
+            models.PartnerUniversity.name,
+            models.PartnerUniversity.country,
+            models.PartnerUniversity.slot,
+            models.Application.choice,
+            models.User.id,
+            models.User.email,
+            models.User.nickname,
+            models.User.grade,
+            models.User.lang,
+        )
+        .join(models.Application.user)
+        .join(models.Application.university)
+        .order_by(
+            models.Application.partner_university_id,
+            models.User.grade.desc(),
+            models.User.id,
+        )
+    )
+
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def _jsonl_chunk(rows) -> str:
+    return b"".join(
+        orjson.dumps(dict(zip(APPLICATION_EXPORT_FIELDS, row)), option=orjson.OPT_APPEND_NEWLINE)
+        for row in rows
+    ).decode()
+
+
+def iter_applications_export(
+    db: Session, fmt: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    지원 현황을 CSV(헤더 포함) 또는 JSONL 문자열 조각으로 생성합니다.
+    조각 하나는 최대 chunk_size 행이며, DB에서도 chunk_size 행씩만 가져옵니다.
+    """
+    if fmt == "csv":
+        yield _csv_chunk([APPLICATION_EXPORT_FIELDS])
+        encode = _csv_chunk
+    elif fmt == "jsonl":
+        encode = _jsonl_chunk
+    else:
+        raise ValueError(f"알 수 없는 형식입니다: {fmt}")
+
+    # yield_per는 stream_results를 함께 켜므로 MySQL에서는 서버 측 커서(SSCursor)로 읽습니다.
+    result = db.execute(
+        applications_export_statement(), execution_options={"yield_per": chunk_size}
+    )
+    for rows in result.partitions():
+        yield encode(rows)
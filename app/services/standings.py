@@ -0,0 +1,336 @@
+"""
+대학별 합격 예측(커트라인, 순위, 지망 순 배정 결과)을 메모리에 유지하는 엔진입니다.
+
+- 배정 방식: 학점이 높은 사용자부터(동점이면 ID 순) 1지망부터 차례로 정원이 남은 학교에 배정합니다.
+- 처음 한 번(과 STANDINGS_MAX_AGE_SECONDS마다) DB에서 전체를 읽어 계산하고,
+  이후에는 브로커로 전달되는 지원 내역 변경 이벤트로 바뀐 부분만 다시 계산합니다.
+- 한 사용자의 변경은 그 사용자 순번 이후의 배정에만 영향을 주며,
+  남은 정원이 기존 결과와 같아지면 그 뒤는 다시 계산하지 않습니다.
+"""
+
+import bisect
+import threading
+import time
+from typing import NamedTuple
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.events import APPLICATIONS_UPDATED, Broker, broker
+from app.models import models
+from app.schemas.standings import ChoiceStanding, StandingsResponse
+import app.services.university as university_service
+
+# 정렬 키 (-학점, 사용자ID): 오름차순 정렬이 APPLICANT_ORDER(학점 내림차순, ID 오름차순)와 같습니다.
+Key = tuple[float, int]
+
+
+class UniversitySeat(NamedTuple):
+    name: str
+    slot: int
+
+
+def _remove(keys: list[Key], key: Key) -> None:
+    index = bisect.bisect_left(keys, key)
+    if index < len(keys) and keys[index] == key:
+        del keys[index]
+
+
+def _add_diff(diff: dict[int, int], university_id: int, delta: int) -> None:
+    value = diff.get(university_id, 0) + delta
+    if value:
+        diff[university_id] = value
+    else:
+        diff.pop(university_id, None)
+
+
+class Standings:
+    """
+    한 시점의 전체 배정 상태입니다.
+    스레드 안전하지 않으며, 잠금은 StandingsEngine이 관리합니다.
+    """
+
+    def __init__(self, universities: dict[int, UniversitySeat]):
+        self.universities = universities
+        self.grades: dict[int, float] = {}
+        self.choices: dict[int, tuple[int, ...]] = {}
+        # 지원 내역이 있는 전체 사용자 (정렬 키 순)
+        self.order: list[Key] = []
+        # 학교별 지원자 / 배정된 사용자 (정렬 키 순)
+        self.applicants: dict[int, list[Key]] = {id_: [] for id_ in universities}
+        self.admitted: dict[int, list[Key]] = {id_: [] for id_ in universities}
+        # 사용자ID -> 배정된 학교ID
+        self.assignment: dict[int, int] = {}
+
+    @classmethod
+    def build(cls, universities, rows) -> "Standings":
+        """
+        universities: (id, name, slot)
+        rows: (user_id, grade, partner_university_id)를 사용자ID, choice 순으로 정렬한 결과
+        """
+        standings = cls(
+            {id_: UniversitySeat(name, slot) for id_, name, slot in universities}
+        )
+        choices: dict[int, list[int]] = {}
+        for user_id, grade, university_id in rows:
+            if university_id not in standings.universities:
+                continue
+            if user_id not in choices:
+                choices[user_id] = []
+                standings.grades[user_id] = grade
+            choices[user_id].append(university_id)
+        standings.choices = {
+            user_id: tuple(university_ids) for user_id, university_ids in choices.items()
+        }
+        standings.order = sorted(
+            (-standings.grades[user_id], user_id) for user_id in standings.choices
+        )
+
+        # 정렬된 순서대로 append 하므로 학교별 목록도 정렬된 상태가 됩니다.
+        remaining = {id_: seat.slot for id_, seat in standings.universities.items()}
+        for key in standings.order:
+            assigned = None
+            for university_id in standings.choices[key[1]]:
+                standings.applicants[university_id].append(key)
+                if assigned is None and remaining[university_id] > 0:
+                    remaining[university_id] -= 1
+                    assigned = university_id
+            if assigned is not None:
+                standings.admitted[assigned].append(key)
+                standings.assignment[key[1]] = assigned
+        return standings
+
+    def set_user(self, user_id: int, grade: float, choices: list[int]) -> None:
+        """
+        한 사용자의 학점과 지원 내역(1지망부터의 학교ID)을 바꾸고 배정을 증분 갱신합니다.
+        같은 값으로 여러 번 호출해도 결과가 같습니다.
+        """
+        choices = tuple(id_ for id_ in choices if id_ in self.universities)
+        old_choices = self.choices.get(user_id, ())
+        old_key = (-self.grades[user_id], user_id) if old_choices else None
+        new_key = (-grade, user_id) if choices else None
+        if old_key == new_key and old_choices == choices:
+            return
+
+        if old_key is not None:
+            _remove(self.order, old_key)
+            for university_id in old_choices:
+                _remove(self.applicants[university_id], old_key)
+        old_assigned = self.assignment.pop(user_id, None)
+        if old_assigned is not None:
+            _remove(self.admitted[old_assigned], old_key)
+
+        if new_key is None:
+            self.grades.pop(user_id, None)
+            self.choices.pop(user_id, None)
+        else:
+            self.grades[user_id] = grade
+            self.choices[user_id] = choices
+            bisect.insort(self.order, new_key)
+            for university_id in choices:
+                bisect.insort(self.applicants[university_id], new_key)
+
+        start = min(key for key in (old_key, new_key) if key is not None)
+        self._cascade(start, old_key, old_assigned, new_key)
+
+    def _cascade(
+        self,
+        start: Key,
+        old_key: Key | None,
+        old_assigned: int | None,
+        new_key: Key | None,
+    ) -> None:
+        """
+        start 이후 사용자들의 배정을 다시 계산합니다.
+        diff는 (지금까지 새로 배정한 인원 - 기존 배정 인원)이며, 바뀐 사용자를 지난 뒤
+        diff가 비면 이후 사용자들이 보는 남은 정원이 기존과 같으므로 멈춥니다.
+        """
+        # start 앞의 사용자들은 배정이 바뀌지 않습니다.
+        remaining = {
+            id_: seat.slot - bisect.bisect_left(self.admitted[id_], start)
+            for id_, seat in self.universities.items()
+        }
+        diff: dict[int, int] = {}
+        passed_old = old_assigned is None
+        passed_new = new_key is None
+
+        for index in range(bisect.bisect_left(self.order, start), len(self.order)):
+            key = self.order[index]
+            if not passed_old and key > old_key:
+                passed_old = True
+                _add_diff(diff, old_assigned, -1)
+
+            user_id = key[1]
+            assigned = None
+            for university_id in self.choices[user_id]:
+                if remaining[university_id] > 0:
+                    remaining[university_id] -= 1
+                    assigned = university_id
+                    break
+
+            previous = None if key == new_key else self.assignment.get(user_id)
+            if key == new_key:
+                passed_new = True
+            if assigned != previous:
+                if previous is not None:
+                    _remove(self.admitted[previous], key)
+                    del self.assignment[user_id]
+                    _add_diff(diff, previous, -1)
+                if assigned is not None:
+                    bisect.insort(self.admitted[assigned], key)
+                    self.assignment[user_id] = assigned
+                    _add_diff(diff, assigned, 1)
+
+            if passed_old and passed_new and not diff:
+                break
+
+    def user_standings(self, user_id: int, grade: float) -> StandingsResponse:
+        grade = self.grades.get(user_id, grade)
+        key = (-grade, user_id)
+        assigned = self.assignment.get(user_id)
+        choices = []
+        for choice, university_id in enumerate(self.choices.get(user_id, ()), start=1):
+            seat = self.universities[university_id]
+            applicants = self.applicants[university_id]
+            admitted = self.admitted[university_id]
+            choices.append(
+                ChoiceStanding(
+                    choice=choice,
+                    universityId=university_id,
+                    universityName=seat.name,
+                    slot=seat.slot,
+                    applicants=len(applicants),
+                    rank=bisect.bisect_left(applicants, key) + 1,
+                    cutoffGrade=(
+                        -applicants[seat.slot - 1][0]
+                        if 0 < seat.slot < len(applicants)
+                        else None
+                    ),
+                    projectedCutoffGrade=(
+                        -admitted[-1][0] if 0 < seat.slot <= len(admitted) else None
+                    ),
+                    projectedAdmitted=assigned == university_id,
+                )
+            )
+        return StandingsResponse(
+            grade=grade, projectedUniversityId=assigned, choices=choices
+        )
+
+
+class _Rebuild:
+    __slots__ = ("started_at", "updates")
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        # 재계산용 DB 조회가 진행되는 동안 받은 변경 (user_id, grade, choices)
+        self.updates: list[tuple[int, float, list[int]]] = []
+
+
+class StandingsEngine:
+    """
+    워커마다 하나씩 두는 Standings 관리자입니다.
+    전체 재계산은 DB 조회를 잠금 밖에서 하고, 그동안 받은 변경을 다시 적용한 뒤 교체합니다.
+    """
+
+    def __init__(self, broker: Broker, max_age_seconds: float):
+        self.broker = broker
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._standings: Standings | None = None
+        self._built_at = 0.0
+        self._rebuilds: list[_Rebuild] = []
+        self._subscribed = False
+
+    def needs_rebuild(self) -> bool:
+        with self._lock:
+            if self._standings is None:
+                return True
+            # 오래된 결과는 이미 누가 재계산 중이면 그대로 씁니다.
+            stale = time.monotonic() - self._built_at >= self.max_age_seconds
+            return stale and not self._rebuilds
+
+    def begin_rebuild(self) -> _Rebuild:
+        """
+        DB 조회 전에 호출합니다. 이후에 발행된 변경은 finish_rebuild에서 다시 적용됩니다.
+        """
+        with self._lock:
+            if not self._subscribed:
+                self.broker.subscribe(self._on_message)
+                self._subscribed = True
+            rebuild = _Rebuild()
+            self._rebuilds.append(rebuild)
+            return rebuild
+
+    def finish_rebuild(self, rebuild: _Rebuild, universities, rows) -> None:
+        try:
+            standings = Standings.build(universities, rows)
+        except Exception:
+            self.abort_rebuild(rebuild)
+            raise
+        with self._lock:
+            self._rebuilds.remove(rebuild)
+            for user_id, grade, choices in rebuild.updates:
+                standings.set_user(user_id, grade, choices)
+            # 동시에 재계산한 경우 더 늦게 시작한(더 최신인) 결과를 남깁니다.
+            if self._standings is None or rebuild.started_at >= self._built_at:
+                self._standings = standings
+                self._built_at = rebuild.started_at
+
+    def abort_rebuild(self, rebuild: _Rebuild) -> None:
+        with self._lock:
+            self._rebuilds.remove(rebuild)
+
+    def apply_user_choices(self, user_id: int, grade: float, choices: list[int]) -> None:
+        with self._lock:
+            for rebuild in self._rebuilds:
+                rebuild.updates.append((user_id, grade, choices))
+            if self._standings is not None:
+                self._standings.set_user(user_id, grade, choices)
+
+    def _on_message(self, message: dict) -> None:
+        if message.get("type") != APPLICATIONS_UPDATED:
+            return
+        self.apply_user_choices(message["user_id"], message["grade"], message["choices"])
+
+    def user_standings(self, user_id: int, grade: float) -> StandingsResponse:
+        with self._lock:
+            return self._standings.user_standings(user_id, grade)
+
+
+standings_engine = StandingsEngine(
+    broker=broker, max_age_seconds=settings.standings_max_age_seconds
+)
+
+
+def standings_applications_statement() -> Select:
+    """
+    전체 지원 내역을 (user_id, grade, 대학ID)로, 사용자별 choice 순서대로 조회합니다.
+    """
+    return (
+        select(
+            models.Application.user_id,
+            models.User.grade,
+            models.Application.partner_university_id,
+        )
+        .join(models.User, models.User.id == models.Application.user_id)
+        .order_by(models.Application.user_id, models.Application.choice)
+    )
+
+
+def get_user_standings(db: Session, user: models.User) -> StandingsResponse:
+    """
+    사용자의 지망별 순위, 커트라인, 지망 순 배정 결과를 반환합니다.
+    엔진이 비어 있거나 오래된 경우에만 DB를 조회합니다.
+    """
+    if standings_engine.needs_rebuild():
+        rebuild = standings_engine.begin_rebuild()
+        try:
+            catalog = university_service.get_university_catalog(db)
+            universities = [(info.id, info.name, info.slot) for info in catalog]
+            rows = db.execute(standings_applications_statement()).all()
+        except Exception:
+            standings_engine.abort_rebuild(rebuild)
+            raise
+        standings_engine.finish_rebuild(rebuild, universities, rows)
+    return standings_engine.user_standings(user.id, user.grade)
@@ -0,0 +1,34 @@
+"""
+app.services.standings 의 AsyncSession 버전입니다. (DB_MODE=async)
+엔진(standings_engine)은 sync 버전과 공유합니다.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import models
+from app.schemas.standings import StandingsResponse
+from app.services.standings import (
+    standings_applications_statement,
+    standings_engine,
+)
+import app.services.university_async as university_service
+
+
+async def get_user_standings(
+    db: AsyncSession, user: models.User
+) -> StandingsResponse:
+    """
+    사용자의 지망별 순위, 커트라인, 지망 순 배정 결과를 반환합니다.
+    엔진이 비어 있거나 오래된 경우에만 DB를 조회합니다.
+    """
+    if standings_engine.needs_rebuild():
+        rebuild = standings_engine.begin_rebuild()
+        try:
+            catalog = await university_service.get_university_catalog(db)
+            universities = [(info.id, info.name, info.slot) for info in catalog]
+            rows = (await db.execute(standings_applications_statement())).all()
+        except Exception:
+            standings_engine.abort_rebuild(rebuild)
+            raise
+        standings_engine.finish_rebuild(rebuild, universities, rows)
+    return standings_engine.user_standings(user.id, user.grade)
@@ -1,61 +1,429 @@
+import itertools
+import logging
+from typing import Any, NamedTuple
+
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import Select, and_, case, func, insert, or_, select, update
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.responses import CachedPayload, make_cached_payload, validate_content
+from app.core.singleflight import SingleFlight
 from app.models import models
+from app.schemas.universities import PartnerUniversityInfo, UniversityDetailResponse
+from app.services.applicant_snapshot import applicant_snapshot
+from app.services.university_catalog import (
+    CATALOG_VERSION_ID,
+    UniversityCatalog,
+    UniversityInfo,
+    bump_catalog_version_statement,
+    catalog_holder,
+    catalog_statement,
+    catalog_version_statement,
+    existing_universities_statement,
+)
+
+logger = logging.getLogger(__name__)
+
+# GET /universities 응답 본문 캐시 (버전 -> CachedPayload)
+# 같은 워커의 쓰기는 버전 증가로 즉시 반영되고, 다른 워커의 쓰기는 TTL 안에 반영됩니다.
+_universities_payload_cache = TTLCache(
+    maxsize=2, ttl=settings.university_list_cache_ttl_seconds
+)
+_universities_versions = itertools.count(1)
+_universities_version = next(_universities_versions)
+# GET /universities/{id} 응답 본문 캐시 ((학교 ID, limit, offset, 버전) -> CachedPayload)
+# 인기 학교의 지원자 목록은 크므로 직렬화/압축을 요청마다 하지 않도록 같은 방식으로 캐시합니다.
+UNIVERSITY_DETAIL_CACHE_MAXSIZE = 256
+_university_detail_payload_cache = TTLCache(
+    maxsize=UNIVERSITY_DETAIL_CACHE_MAXSIZE,
+    ttl=settings.university_detail_cache_ttl_seconds,
+)
+# 캐시가 비었을 때 / 같은 학교를 동시에 조회할 때 DB 조회 하나를 함께 씁니다.
+_universities_payload_flight = SingleFlight()
+_university_detail_flight = SingleFlight()
 
 
 def get_universities_with_applicant_count(db: Session):
     """
     모든 파트너 대학교 목록을 각 학교의 지원자 수와 함께 조회합니다.
+    지원자 수는 집계하지 않고 applicant_count 카운터 컬럼을 읽습니다.
     """
-    result = (
-        db.query(
-            models.PartnerUniversity.id,
-            models.PartnerUniversity.name,
-            models.PartnerUniversity.country,
-            models.PartnerUniversity.slot,
-            func.count(models.Application.id).label("applicant_count"),
-        )
-        .outerjoin(
-            models.Application,
-            models.PartnerUniversity.id == models.Application.partner_university_id,
-        )
-        .group_by(models.PartnerUniversity.id)
-        .all()
-    )
+    result = db.query(
+        models.PartnerUniversity.id,
+        models.PartnerUniversity.name,
+        models.PartnerUniversity.country,
+        models.PartnerUniversity.slot,
+        models.PartnerUniversity.applicant_count,
+    ).all()
     return result
 
 
-def get_applicants_for_university(db: Session, university_id: int):
+def invalidate_universities_payload() -> None:
     """
-    특정 학교의 지원자 목록을 학점(grade) 내림차순으로 정렬하여 조회합니다.
+    지원 내역이 바뀐 뒤(커밋 이후) 호출하여 캐시된 대학 목록 응답을 버립니다.
     """
-    return (
-        db.query(
-            models.User.id,
+    global _universities_version
+    _universities_version = next(_universities_versions)
+
+
+def get_universities_version() -> int:
+    """
+    지원 내역이 바뀔 때마다(같은 워커 기준) 증가하는 버전입니다.
+    """
+    return _universities_version
+
+
+def get_cached_universities_payload() -> tuple[int, CachedPayload | None]:
+    """
+    (현재 버전, 캐시된 응답 또는 None)을 반환합니다.
+    버전은 조회 전에 읽어 두어야 조회 중에 일어난 무효화를 놓치지 않습니다.
+    """
+    version = _universities_version
+    return version, _universities_payload_cache.get(version)
+
+
+def store_universities_payload(version: int, universities_data) -> CachedPayload:
+    """
+    조회 결과를 PartnerUniversityInfo 목록 형태의 JSON으로 직렬화하여 캐시합니다.
+    universities_data는 (id, name, country, slot, applicant_count) 행입니다.
+    """
+    content = [
+        {
+            "id": id_,
+            "name": name,
+            "country": country,
+            "slot": slot,
+            "applicantCount": applicant_count,
+        }
+        for id_, name, country, slot, applicant_count in universities_data
+    ]
+    validate_content(content, list[PartnerUniversityInfo])
+    payload = make_cached_payload(orjson.dumps(content))
+    _universities_payload_cache.set(version, payload)
+    return payload
+
+
+def get_snapshot_universities_payload(
+    catalog: UniversityCatalog, generation: int, counts: dict[int, int]
+) -> CachedPayload | None:
+    """
+    카탈로그와 공유 스냅샷의 지원자 수로 만든 대학 목록 응답입니다. (모든 워커가 같은 값)
+    스냅샷 generation별로 한 번만 만들며, 스냅샷에 없는 대학이 있으면(새로 등록된 직후) None입니다.
+    """
+    key = ("snapshot", generation, catalog.version)
+    payload = _universities_payload_cache.get(key)
+    if payload is None:
+        try:
+            rows = [
+                (info.id, info.name, info.country, info.slot, counts[info.id])
+                for info in catalog
+            ]
+        except KeyError:
+            return None
+        payload = store_universities_payload(key, rows)
+    return payload
+
+
+def get_universities_payload(db: Session, user_id: int | None = None) -> CachedPayload:
+    """
+    대학 목록 응답 본문을 반환합니다. 공유 스냅샷이나 캐시가 유효하면 DB를 조회하지 않습니다.
+    user_id는 조회하는 사용자입니다. (방금 수정한 사용자에게는 그 뒤의 스냅샷만 사용)
+    """
+    snapshot = applicant_snapshot.get_counts(user_id)
+    if snapshot is not None:
+        payload = get_snapshot_universities_payload(get_university_catalog(db), *snapshot)
+        if payload is not None:
+            return payload
+
+    version, payload = get_cached_universities_payload()
+    if payload is None:
+        payload = _universities_payload_flight.do(
+            version,
+            lambda: store_universities_payload(
+                version, get_universities_with_applicant_count(db)
+            ),
+        )
+    return payload
+
+
+class UniversityApplicants(NamedTuple):
+    name: str
+    country: str
+    slot: int
+    total_applicants: int
+    applicants: list[Any]
+
+
+# 지원자 순위 기준: 학점 내림차순, 동점이면 사용자 ID 오름차순
+APPLICANT_ORDER = (models.User.grade.desc(), models.User.id.asc())
+
+
+def university_applicants_statement(
+    university_id: int, limit: int | None = None, offset: int = 0
+) -> Select:
+    """
+    학교의 지원자 목록 한 페이지(순위, 전체 지원자 수 포함)를 조회하는 쿼리입니다.
+    순위는 페이지와 무관하게 ROW_NUMBER()로 DB에서 계산합니다.
+    학교 정보는 대학 카탈로그에서 가져오므로 partner_university는 조인하지 않습니다.
+    """
+    statement = (
+        select(
+            models.User.id.label("user_id"),
             models.User.nickname,
             models.User.grade,
             models.User.lang,
             models.Application.choice,
+            func.row_number().over(order_by=APPLICANT_ORDER).label("rank"),
+            func.count(models.Application.id).over().label("total_applicants"),
         )
-        .join(models.Application, models.User.id == models.Application.user_id)
-        .filter(models.Application.partner_university_id == university_id)
-        .order_by(models.User.grade.desc())
-        .all()
+        .select_from(models.Application)
+        .join(models.User, models.User.id == models.Application.user_id)
+        .where(models.Application.partner_university_id == university_id)
+        .order_by(*APPLICANT_ORDER)
+    )
+    if offset:
+        statement = statement.offset(offset)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def build_university_applicants(
+    university: UniversityInfo, rows, total_applicants: int = 0
+) -> UniversityApplicants:
+    """
+    카탈로그의 학교 정보와 university_applicants_statement 결과를 합칩니다.
+    행이 없으면(지원자가 없거나 마지막 페이지를 넘은 경우) total_applicants를 사용합니다.
+    """
+    return UniversityApplicants(
+        name=university.name,
+        country=university.country,
+        slot=university.slot,
+        total_applicants=rows[0][-1] if rows else total_applicants,
+        applicants=rows,
     )
 
 
-def get_university(db: Session, university_id: int):
+def university_detail_content(university: UniversityApplicants) -> dict:
     """
-    ID로 특정 학교 정보를 조회합니다.
+    UniversityDetailResponse 형태의 dict를 Row에서 바로 만듭니다.
+    행마다 모델을 만들지 않고, Row 속성 접근보다 빠른 튜플 언패킹을 사용합니다.
+    (컬럼 순서는 university_applicants_statement와 같아야 합니다.)
     """
+    return {
+        "name": university.name,
+        "country": university.country,
+        "slot": university.slot,
+        "totalApplicants": university.total_applicants,
+        "applicants": [
+            {
+                "id": user_id,
+                "rank": rank,
+                "choice": choice,
+                "nickname": nickname,
+                "grade": grade,
+                "lang": lang,
+            }
+            for user_id, nickname, grade, lang, choice, rank, _ in university.applicants
+        ],
+    }
+
+
+def get_university_with_applicants(
+    db: Session, university_id: int, limit: int | None = None, offset: int = 0
+) -> UniversityApplicants | None:
+    """
+    학교 정보(카탈로그)와 지원자 목록 한 페이지(쿼리 한 번)를 조회합니다.
+    학교가 없으면 None을 반환합니다.
+    """
+    university = get_university(db, university_id)
+    if university is None:
+        return None
+    rows = db.execute(
+        university_applicants_statement(university_id, limit=limit, offset=offset)
+    ).all()
+    total_applicants = 0
+    if not rows and offset > 0:
+        # 마지막 페이지를 넘어선 경우: 전체 지원자 수는 카운터에서 읽습니다.
+        total_applicants = get_applicant_counts_for_universities(
+            db, [university_id]
+        ).get(university_id, 0)
+    return build_university_applicants(university, rows, total_applicants)
+
+
+def university_detail_cache_key(
+    university_id: int, limit: int | None, offset: int
+) -> tuple:
+    # 같은 워커에서 지원 내역이 바뀐 뒤에는 이전 캐시/진행 중인 조회를 쓰지 않습니다.
+    return (university_id, limit, offset, _universities_version)
+
+
+def get_cached_university_detail_payload(key: tuple) -> CachedPayload | None:
+    return _university_detail_payload_cache.get(key)
+
+
+def store_university_detail_payload(
+    key: tuple, university: UniversityApplicants | None
+) -> CachedPayload | None:
+    """
+    상세 조회 결과를 UniversityDetailResponse 형태의 JSON으로 직렬화(압축 포함)하여 캐시합니다.
+    학교가 없으면(None) 캐시하지 않습니다.
+    """
+    if university is None:
+        return None
+    content = university_detail_content(university)
+    validate_content(content, UniversityDetailResponse)
+    payload = make_cached_payload(orjson.dumps(content))
+    _university_detail_payload_cache.set(key, payload)
+    return payload
+
+
+def get_university_detail_payload(
+    db: Session, university_id: int, limit: int | None = None, offset: int = 0
+) -> CachedPayload | None:
+    """
+    학교 상세 응답 본문을 반환합니다. 학교가 없으면 None입니다.
+    캐시가 유효하면 DB를 조회하지 않고, 캐시가 없을 때 같은 학교/페이지를 동시에 조회하는 요청들은
+    조회와 직렬화/압축 하나를 함께 씁니다.
+    """
+    key = university_detail_cache_key(university_id, limit, offset)
+    payload = get_cached_university_detail_payload(key)
+    if payload is None:
+        payload = _university_detail_flight.do(
+            key,
+            lambda: store_university_detail_payload(
+                key,
+                get_university_with_applicants(
+                    db, university_id, limit=limit, offset=offset
+                ),
+            ),
+        )
+    return payload
+
+
+def user_rank_statement(university_id: int, user_id: int) -> Select:
+    """
+    특정 학교에서 사용자의 순위를 전체 목록 없이 계산하는 쿼리입니다.
+    (자신보다 앞선 지원자 수 + 1, 순위 기준은 APPLICANT_ORDER와 같습니다.)
+    """
+    other_application = models.Application.__table__.alias("other_application")
+    other_user = models.User.__table__.alias("other_user")
+    ahead_count = (
+        select(func.count())
+        .select_from(other_application)
+        .join(other_user, other_user.c.id == other_application.c.user_id)
+        .where(
+            other_application.c.partner_university_id == university_id,
+            or_(
+                other_user.c.grade > models.User.grade,
+                and_(
+                    other_user.c.grade == models.User.grade,
+                    other_user.c.id < models.User.id,
+                ),
+            ),
+        )
+        .scalar_subquery()
+    )
     return (
-        db.query(models.PartnerUniversity)
-        .filter(models.PartnerUniversity.id == university_id)
-        .first()
+        select(
+            models.Application.choice,
+            models.User.grade,
+            (ahead_count + 1).label("rank"),
+            models.PartnerUniversity.slot,
+            models.PartnerUniversity.applicant_count,
+        )
+        .join(models.User, models.User.id == models.Application.user_id)
+        .join(
+            models.PartnerUniversity,
+            models.PartnerUniversity.id == models.Application.partner_university_id,
+        )
+        .where(
+            models.Application.partner_university_id == university_id,
+            models.Application.user_id == user_id,
+        )
+        .limit(1)
     )
 
 
+class UserRank(NamedTuple):
+    choice: int
+    grade: float
+    rank: int
+    slot: int
+    applicant_count: int
+
+
+def snapshot_user_rank(
+    catalog: UniversityCatalog, university_id: int, user_id: int, grade: float
+) -> UserRank | None:
+    """
+    공유 스냅샷의 학점 정렬 배열로 계산한 순위입니다. 계산할 수 없으면 None입니다. (DB로 조회)
+    """
+    info = catalog.get(university_id)
+    if info is None:
+        return None
+    entry = applicant_snapshot.get_rank(university_id, user_id, grade)
+    if entry is None:
+        return None
+    return UserRank(entry.choice, grade, entry.rank, info.slot, entry.applicant_count)
+
+
+def get_user_rank_for_university(
+    db: Session, university_id: int, user_id: int, grade: float | None = None
+):
+    """
+    사용자가 특정 학교에 지원한 경우 (choice, grade, rank, slot, applicant_count)를,
+    지원하지 않은 경우 None을 반환합니다.
+    grade(사용자의 학점)를 주면 공유 스냅샷에 학점 정렬 배열이 있을 때 DB 대신 사용합니다.
+    """
+    if grade is not None and applicant_snapshot.grades:
+        rank = snapshot_user_rank(get_university_catalog(db), university_id, user_id, grade)
+        if rank is not None:
+            return rank
+    return db.execute(user_rank_statement(university_id, user_id)).first()
+
+
+def get_university_catalog(
+    db: Session, ensure_ids: list[int] | tuple[int, ...] = ()
+) -> UniversityCatalog:
+    """
+    워커의 대학 카탈로그를 반환합니다. 대부분의 호출은 쿼리가 없고,
+    확인 주기가 지났거나 ensure_ids 중 카탈로그에 없는 ID가 있으면 DB 버전을 확인합니다.
+    """
+    if catalog_holder.needs_check(ensure_ids):
+        version = db.execute(catalog_version_statement()).scalar() or 0
+        if not catalog_holder.is_current(version):
+            return catalog_holder.install(version, db.execute(catalog_statement()).all())
+        missing = catalog_holder.catalog.missing(ensure_ids)
+        if missing and db.execute(existing_universities_statement(missing)).first():
+            logger.warning(
+                "universities %s were added without bump_catalog_version; reloading", missing
+            )
+            return catalog_holder.install(version, db.execute(catalog_statement()).all())
+    return catalog_holder.catalog
+
+
+def bump_catalog_version(db: Session) -> None:
+    """
+    대학 정보를 바꾼 트랜잭션에서 호출하여 모든 워커가 카탈로그를 다시 읽게 합니다.
+    커밋은 호출한 쪽에서 합니다.
+    """
+    if db.execute(bump_catalog_version_statement()).rowcount == 0:
+        # 마이그레이션 대신 create_all로 만든 DB에는 버전 행이 없습니다.
+        db.execute(
+            insert(models.UniversityCatalogVersion).values(id=CATALOG_VERSION_ID, version=1)
+        )
+
+
+def get_university(db: Session, university_id: int) -> UniversityInfo | None:
+    """
+    ID로 특정 학교 정보를 카탈로그에서 찾습니다.
+    """
+    return get_university_catalog(db, (university_id,)).get(university_id)
+
+
 def get_applicant_counts_for_universities(
     db: Session, university_ids: list[int]
 ) -> dict[int, int]:
@@ -67,16 +435,90 @@ def get_applicant_counts_for_universities(
         return {}
 
     counts_query = (
+        db.query(
+            models.PartnerUniversity.id,
+            models.PartnerUniversity.applicant_count,
+        )
+        .filter(models.PartnerUniversity.id.in_(university_ids))
+        .all()
+    )
+
+    return {university_id: count for university_id, count in counts_query}
+
+
+def applicant_count_deltas_statement(deltas: dict[int, int]):
+    """
+    {대학ID: 증감량}을 UPDATE 하나로 반영합니다. 바뀌는 대학이 없으면 None입니다.
+    요청마다 잠금 순서가 달라 교착 상태가 생기지 않도록 대학 ID 오름차순으로 행을 잠급니다.
+    (InnoDB는 PK IN 목록을 정렬된 순서로 읽습니다.)
+    """
+    university_ids = sorted(
+        university_id for university_id, delta in deltas.items() if delta
+    )
+    if not university_ids:
+        return None
+    return (
+        update(models.PartnerUniversity)
+        .where(models.PartnerUniversity.id.in_(university_ids))
+        .values(
+            applicant_count=models.PartnerUniversity.applicant_count
+            + case(
+                {university_id: deltas[university_id] for university_id in university_ids},
+                value=models.PartnerUniversity.id,
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def apply_applicant_count_deltas(db: Session, deltas: dict[int, int]) -> None:
+    """
+    {대학ID: 증감량} 만큼 applicant_count 카운터를 조정합니다.
+    호출한 쪽의 트랜잭션 안에서 실행되며, 커밋은 호출한 쪽에서 합니다.
+    """
+    statement = applicant_count_deltas_statement(deltas)
+    if statement is not None:
+        db.execute(statement)
+
+
+def reconcile_applicant_counts(db: Session) -> dict[int, tuple[int, int]]:
+    """
+    application 테이블로부터 지원자 수를 처음부터 다시 집계하여
+    applicant_count 카운터와 비교하고, 어긋난 값을 바로잡습니다.
+    결과는 {대학ID: (저장된 값, 실제 값)} 형태로 어긋났던 대학만 반환합니다.
+    집계한 뒤에 들어온 지원 내역 수정의 증감을 덮어쓰지 않도록 실제 값이 아니라 차이만큼 더합니다.
+    커밋은 호출한 쪽에서 합니다.
+    """
+    actual = dict(
         db.query(
             models.Application.partner_university_id,
             func.count(models.Application.id),
         )
-        .filter(models.Application.partner_university_id.in_(university_ids))
         .group_by(models.Application.partner_university_id)
         .all()
     )
+    stored = db.query(
+        models.PartnerUniversity.id, models.PartnerUniversity.applicant_count
+    ).all()
 
-    return {university_id: count for university_id, count in counts_query}
+    drift = {}
+    for university_id, count in stored:
+        expected = actual.get(university_id, 0)
+        if count != expected:
+            drift[university_id] = (count, expected)
+
+    for university_id, (count, expected) in drift.items():
+        db.execute(
+            update(models.PartnerUniversity)
+            .where(models.PartnerUniversity.id == university_id)
+            .values(
+                applicant_count=models.PartnerUniversity.applicant_count
+                + (expected - count)
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    return drift
 
 
 def check_user_application_status(
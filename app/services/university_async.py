@@ -0,0 +1,218 @@
+"""
+app.services.university 의 AsyncSession 버전입니다. (DB_MODE=async)
+"""
+
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.responses import CachedPayload
+from app.core.singleflight import AsyncSingleFlight
+from app.models import models
+from app.services.applicant_snapshot import applicant_snapshot
+from app.services.university import (
+    UniversityApplicants,
+    applicant_count_deltas_statement,
+    build_university_applicants,
+    get_cached_university_detail_payload,
+    get_cached_universities_payload,
+    get_snapshot_universities_payload,
+    snapshot_user_rank,
+    store_university_detail_payload,
+    store_universities_payload,
+    university_detail_cache_key,
+    university_applicants_statement,
+    user_rank_statement,
+)
+from app.services.university_catalog import (
+    UniversityCatalog,
+    UniversityInfo,
+    catalog_holder,
+    catalog_statement,
+    catalog_version_statement,
+    existing_universities_statement,
+)
+
+logger = logging.getLogger(__name__)
+
+_universities_payload_flight = AsyncSingleFlight()
+_university_detail_flight = AsyncSingleFlight()
+
+
+def _flight_session(db: AsyncSession) -> AsyncSession:
+    """
+    single-flight 조회용 세션입니다. 먼저 들어온 요청이 끝나 그 세션이 닫혀도 다른 요청이 기다리는
+    조회는 계속되어야 하므로, 요청 세션과 같은 DB(primary 또는 복제본)에 세션을 따로 엽니다.
+    """
+    return AsyncSession(bind=db.bind, autoflush=False, expire_on_commit=False)
+
+
+async def get_universities_with_applicant_count(db: AsyncSession):
+    """
+    모든 파트너 대학교 목록을 각 학교의 지원자 수와 함께 조회합니다.
+    """
+    result = await db.execute(
+        select(
+            models.PartnerUniversity.id,
+            models.PartnerUniversity.name,
+            models.PartnerUniversity.country,
+            models.PartnerUniversity.slot,
+            models.PartnerUniversity.applicant_count,
+        )
+    )
+    return result.all()
+
+
+async def get_universities_payload(
+    db: AsyncSession, user_id: int | None = None
+) -> CachedPayload:
+    """
+    대학 목록 응답 본문을 반환합니다. 캐시는 sync 버전과 공유합니다.
+    """
+    snapshot = applicant_snapshot.get_counts(user_id)
+    if snapshot is not None:
+        payload = get_snapshot_universities_payload(
+            await get_university_catalog(db), *snapshot
+        )
+        if payload is not None:
+            return payload
+
+    version, payload = get_cached_universities_payload()
+    if payload is None:
+
+        async def load() -> CachedPayload:
+            async with _flight_session(db) as flight_db:
+                rows = await get_universities_with_applicant_count(flight_db)
+            return store_universities_payload(version, rows)
+
+        payload = await _universities_payload_flight.do(version, load)
+    return payload
+
+
+async def get_university_with_applicants(
+    db: AsyncSession, university_id: int, limit: int | None = None, offset: int = 0
+) -> UniversityApplicants | None:
+    """
+    학교 정보(카탈로그)와 지원자 목록 한 페이지(쿼리 한 번)를 조회합니다.
+    """
+    university = await get_university(db, university_id)
+    if university is None:
+        return None
+    result = await db.execute(
+        university_applicants_statement(university_id, limit=limit, offset=offset)
+    )
+    rows = result.all()
+    total_applicants = 0
+    if not rows and offset > 0:
+        total_applicants = (
+            await get_applicant_counts_for_universities(db, [university_id])
+        ).get(university_id, 0)
+    return build_university_applicants(university, rows, total_applicants)
+
+
+async def get_university_detail_payload(
+    db: AsyncSession, university_id: int, limit: int | None = None, offset: int = 0
+) -> CachedPayload | None:
+    """
+    학교 상세 응답 본문을 반환합니다. 캐시는 sync 버전과 공유합니다.
+    """
+    key = university_detail_cache_key(university_id, limit, offset)
+    payload = get_cached_university_detail_payload(key)
+    if payload is None:
+
+        async def load() -> CachedPayload | None:
+            async with _flight_session(db) as flight_db:
+                university = await get_university_with_applicants(
+                    flight_db, university_id, limit=limit, offset=offset
+                )
+            return store_university_detail_payload(key, university)
+
+        payload = await _university_detail_flight.do(key, load)
+    return payload
+
+
+async def get_user_rank_for_university(
+    db: AsyncSession, university_id: int, user_id: int, grade: float | None = None
+):
+    """
+    사용자가 특정 학교에 지원한 경우 순위 정보를, 아니면 None을 반환합니다.
+    """
+    if grade is not None and applicant_snapshot.grades:
+        rank = snapshot_user_rank(
+            await get_university_catalog(db), university_id, user_id, grade
+        )
+        if rank is not None:
+            return rank
+    result = await db.execute(user_rank_statement(university_id, user_id))
+    return result.first()
+
+
+async def get_university_catalog(
+    db: AsyncSession, ensure_ids: list[int] | tuple[int, ...] = ()
+) -> UniversityCatalog:
+    """
+    워커의 대학 카탈로그를 반환합니다. 카탈로그는 sync 버전과 공유합니다.
+    """
+    if catalog_holder.needs_check(ensure_ids):
+        version = (await db.execute(catalog_version_statement())).scalar() or 0
+        if not catalog_holder.is_current(version):
+            rows = (await db.execute(catalog_statement())).all()
+            return catalog_holder.install(version, rows)
+        missing = catalog_holder.catalog.missing(ensure_ids)
+        if missing and (await db.execute(existing_universities_statement(missing))).first():
+            logger.warning(
+                "universities %s were added without bump_catalog_version; reloading", missing
+            )
+            rows = (await db.execute(catalog_statement())).all()
+            return catalog_holder.install(version, rows)
+    return catalog_holder.catalog
+
+
+async def get_university(db: AsyncSession, university_id: int) -> UniversityInfo | None:
+    """
+    ID로 특정 학교 정보를 카탈로그에서 찾습니다.
+    """
+    return (await get_university_catalog(db, (university_id,))).get(university_id)
+
+
+async def get_applicant_counts_for_universities(
+    db: AsyncSession, university_ids: list[int]
+) -> dict[int, int]:
+    """
+    주어진 대학 ID 리스트에 대해, 각 대학별 총 지원자 수를 반환합니다.
+    """
+    if not university_ids:
+        return {}
+
+    result = await db.execute(
+        select(
+            models.PartnerUniversity.id,
+            models.PartnerUniversity.applicant_count,
+        ).where(models.PartnerUniversity.id.in_(university_ids))
+    )
+    return {university_id: count for university_id, count in result.all()}
+
+
+async def apply_applicant_count_deltas(db: AsyncSession, deltas: dict[int, int]):
+    """
+    {대학ID: 증감량} 만큼 applicant_count 카운터를 조정합니다.
+    """
+    statement = applicant_count_deltas_statement(deltas)
+    if statement is not None:
+        await db.execute(statement)
+
+
+async def check_user_application_status(
+    db: AsyncSession, user_id: int, university_id: int
+) -> bool:
+    """
+    사용자가 특정 대학에 지원했는지 확인합니다.
+    """
+    result = await db.execute(
+        select(func.count(models.Application.id)).where(
+            models.Application.user_id == user_id,
+            models.Application.partner_university_id == university_id,
+        )
+    )
+    return result.scalar_one() > 0
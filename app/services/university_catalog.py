@@ -0,0 +1,171 @@
+"""
+파트너 대학 정보(이름, 국가, 모집 인원, 기간)의 워커별 인메모리 카탈로그입니다.
+
+지원 기간 중에는 대학 정보가 거의 바뀌지 않으므로 한 번 읽어 두고, 서비스 코드는 대학 ID를
+SQL 대신 카탈로그에서 찾습니다. (자주 바뀌는 applicant_count는 넣지 않습니다.)
+
+- 카탈로그는 불변이며 바뀔 때는 통째로 교체하므로 읽을 때 잠금이 필요 없습니다.
+- university_catalog_version.version이 바뀌면 다시 읽습니다. 버전은
+  UNIVERSITY_CATALOG_CHECK_SECONDS마다, 또는 카탈로그에 없는 ID를 찾을 때 확인합니다. (PK 조회 1회)
+- 버전이 같은데도 찾는 ID가 없으면 그 ID를 DB에서 한 번 더 찾고(PK 조회 1회), 있으면 버전을 올리지 않고
+  SQL로 직접 추가한 대학이므로 카탈로그를 다시 읽습니다. (이름 등을 고친 경우는 알 수 없습니다.)
+- 대학 정보를 바꾸는 쪽(app.cli import-universities 등)은 같은 트랜잭션에서
+  bump_catalog_version_statement()를 실행해야 다른 워커에 반영됩니다.
+
+조회 함수는 app.services.university(_async).get_university_catalog 입니다.
+"""
+
+import threading
+import time
+from array import array
+from typing import Iterable, Iterator, NamedTuple
+
+from sqlalchemy import Select, select, update
+
+from app.core.config import settings
+from app.models import models
+
+CATALOG_VERSION_ID = 1
+
+
+class UniversityInfo(NamedTuple):
+    id: int
+    name: str
+    country: str
+    slot: int
+    duration: str
+
+
+class UniversityCatalog:
+    """
+    ID 순으로 정렬된 열(column) 배열과 ID -> 위치 인덱스로 이루어진 불변 카탈로그입니다.
+    """
+
+    __slots__ = ("version", "_positions", "_ids", "_names", "_countries", "_slots", "_durations")
+
+    def __init__(self, version: int, rows: Iterable[tuple[int, str, str, int, str]]):
+        rows = sorted(rows)
+        self.version = version
+        self._ids = array("q", (row[0] for row in rows))
+        self._names = tuple(row[1] for row in rows)
+        self._countries = tuple(row[2] for row in rows)
+        self._slots = array("q", (row[3] for row in rows))
+        self._durations = tuple(row[4] for row in rows)
+        self._positions = {university_id: i for i, university_id in enumerate(self._ids)}
+
+    def _info(self, position: int) -> UniversityInfo:
+        return UniversityInfo(
+            self._ids[position],
+            self._names[position],
+            self._countries[position],
+            self._slots[position],
+            self._durations[position],
+        )
+
+    def get(self, university_id: int) -> UniversityInfo | None:
+        position = self._positions.get(university_id)
+        return None if position is None else self._info(position)
+
+    def __contains__(self, university_id: int) -> bool:
+        return university_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[UniversityInfo]:
+        return (self._info(position) for position in range(len(self._ids)))
+
+    def missing(self, university_ids: Iterable[int]) -> list[int]:
+        positions = self._positions
+        return [university_id for university_id in university_ids if university_id not in positions]
+
+    def first_missing(self, university_ids: Iterable[int]) -> int | None:
+        """
+        카탈로그에 없는 첫 번째 ID를, 모두 있으면 None을 반환합니다.
+        """
+        positions = self._positions
+        for university_id in university_ids:
+            if university_id not in positions:
+                return university_id
+        return None
+
+
+class CatalogHolder:
+    """
+    워커마다 하나씩 두는 현재 카탈로그와 버전 확인 주기 관리자입니다.
+    """
+
+    def __init__(self, check_seconds: float):
+        self.check_seconds = check_seconds
+        self.catalog: UniversityCatalog | None = None
+        self.loads = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def needs_check(self, ensure_ids: Iterable[int] = ()) -> bool:
+        """
+        DB 버전을 확인해야 하면 True입니다. 주기에 따른 확인은 한 요청만 맡도록 바로 시각을 갱신합니다.
+        ensure_ids 중 카탈로그에 없는 ID가 있으면 주기와 관계없이 확인합니다.
+        """
+        catalog = self.catalog
+        if catalog is None:
+            return True
+        if ensure_ids and catalog.first_missing(ensure_ids) is not None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.check_seconds:
+                return False
+            self._checked_at = now
+            return True
+
+    def is_current(self, version: int) -> bool:
+        catalog = self.catalog
+        return catalog is not None and catalog.version == version
+
+    def install(self, version: int, rows) -> UniversityCatalog:
+        catalog = UniversityCatalog(version, rows)
+        with self._lock:
+            self.catalog = catalog
+            self._checked_at = time.monotonic()
+            self.loads += 1
+        return catalog
+
+
+catalog_holder = CatalogHolder(check_seconds=settings.university_catalog_check_seconds)
+
+
+def catalog_version_statement() -> Select:
+    return select(models.UniversityCatalogVersion.version).where(
+        models.UniversityCatalogVersion.id == CATALOG_VERSION_ID
+    )
+
+
+def catalog_statement() -> Select:
+    return select(
+        models.PartnerUniversity.id,
+        models.PartnerUniversity.name,
+        models.PartnerUniversity.country,
+        models.PartnerUniversity.slot,
+        models.PartnerUniversity.duration,
+    )
+
+
+def existing_universities_statement(university_ids: list[int]) -> Select:
+    """
+    카탈로그에 없는 ID 중 DB에는 있는 것이 하나라도 있는지 확인합니다.
+    """
+    return (
+        select(models.PartnerUniversity.id)
+        .where(models.PartnerUniversity.id.in_(university_ids))
+        .limit(1)
+    )
+
+
+def bump_catalog_version_statement():
+    return (
+        update(models.UniversityCatalogVersion)
+        .where(models.UniversityCatalogVersion.id == CATALOG_VERSION_ID)
+        .values(version=models.UniversityCatalogVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -1,7 +1,25 @@
-from sqlalchemy.orm import Session, joinedload
+import logging
+from collections import Counter
+from typing import NamedTuple
 
+from sqlalchemy import Select, delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import replica_router
+from app.core.events import APPLICATIONS_UPDATED, broker
+from app.core.metrics import REGISTRY
 from app.models import models
+from app.services.applicant_snapshot import applicant_snapshot
 import app.schemas.users as user_schemas
+import app.services.university as university_service
+
+logger = logging.getLogger(__name__)
+
+# PUT /users/me/applications 결과
+# (outcome: success | conflict | validation_error | rejected(그룹 커밋 큐 가득 참) | error)
+application_updates = REGISTRY.counter(
+    "knu_application_updates", "지원 내역 수정 요청 결과", ("outcome",)
+)
 
 
 def get_user_by_uuid(db: Session, *, uuid: str) -> models.User | None:
@@ -11,31 +29,215 @@ def get_user_by_uuid(db: Session, *, uuid: str) -> models.User | None:
     return db.query(models.User).filter(models.User.uuid == uuid).first()
 
 
-def get_user_with_applications(db: Session, user_id: int) -> models.User | None:
+class UserApplications(NamedTuple):
     """
-    ID로 단일 사용자를 조회합니다.
-    이때 사용자의 지원 정보(applications)와 각 지원 정보에 연결된
-    대학 정보(university)까지 JOIN을 통해 한 번에 불러옵니다.
+    사용자 정보와 지원 목록(대학 정보, 대학별 지원자 수 포함)입니다.
+    applications는 ApplicationDetail 형태의 dict 목록입니다.
+    """
+
+    id: int
+    email: str
+    nickname: str
+    grade: float
+    lang: str
+    modify_count: int
+    applications: list[dict]
+
+
+def user_applications_statement(user_ids: list[int]) -> Select:
+    """
+    사용자 + 지원 내역 + 대학 정보 + 지원자 수(카운터)를 한 번에 조회하는 쿼리입니다.
+    지원 내역이 없는 사용자도 application 컬럼이 NULL인 행 하나로 포함됩니다.
     """
     return (
-        db.query(models.User)
-        .options(
-            joinedload(models.User.applications).joinedload(
-                models.Application.university
-            )
+        select(
+            models.User.id,
+            models.User.email,
+            models.User.nickname,
+            models.User.grade,
+            models.User.lang,
+            models.User.modify_count,
+            models.Application.choice,
+            models.PartnerUniversity.id.label("university_id"),
+            models.PartnerUniversity.name.label("university_name"),
+            models.PartnerUniversity.country,
+            models.PartnerUniversity.slot,
+            models.PartnerUniversity.applicant_count,
         )
-        .filter(models.User.id == user_id)
-        .first()
+        .select_from(models.User)
+        .outerjoin(models.Application, models.Application.user_id == models.User.id)
+        .outerjoin(
+            models.PartnerUniversity,
+            models.PartnerUniversity.id == models.Application.partner_university_id,
+        )
+        .where(models.User.id.in_(user_ids))
+        .order_by(models.User.id, models.Application.choice)
     )
 
 
-def update_user_applications(
-    db: Session,
-    user: models.User,
+def user_choices_statement(user_ids: list[int]) -> Select:
+    """
+    user_applications_statement에서 대학 정보와 지원자 수를 뺀 쿼리입니다.
+    (대학 정보는 카탈로그에서, 지원자 수는 공유 스냅샷에서 채웁니다.)
+    """
+    return (
+        select(
+            models.User.id,
+            models.User.email,
+            models.User.nickname,
+            models.User.grade,
+            models.User.lang,
+            models.User.modify_count,
+            models.Application.choice,
+            models.Application.partner_university_id,
+        )
+        .select_from(models.User)
+        .outerjoin(models.Application, models.Application.user_id == models.User.id)
+        .where(models.User.id.in_(user_ids))
+        .order_by(models.User.id, models.Application.choice)
+    )
+
+
+def fill_university_columns(rows, catalog, counts: dict[int, int]) -> list[tuple] | None:
+    """
+    user_choices_statement 결과에 카탈로그의 대학 정보와 스냅샷의 지원자 수를 붙여
+    user_applications_statement와 같은 모양의 행으로 만듭니다.
+    카탈로그나 스냅샷에 없는 대학이 있으면 None입니다. (DB에서 다시 조회)
+    """
+    filled = []
+    for *user_columns, choice, university_id in rows:
+        if university_id is None:
+            filled.append((*user_columns, None, None, None, None, None, None))
+            continue
+        info = catalog.get(university_id)
+        count = counts.get(university_id)
+        if info is None or count is None:
+            return None
+        filled.append(
+            (*user_columns, choice, university_id, info.name, info.country, info.slot, count)
+        )
+    return filled
+
+
+def group_user_applications(rows) -> dict[int, UserApplications]:
+    """
+    user_applications_statement 결과를 {사용자ID: UserApplications}로 묶습니다.
+    Row 속성 접근 대신 튜플 언패킹을 사용하므로 컬럼 순서가 statement와 같아야 합니다.
+    """
+    users: dict[int, UserApplications] = {}
+    for (
+        user_id,
+        email,
+        nickname,
+        grade,
+        lang,
+        modify_count,
+        choice,
+        university_id,
+        university_name,
+        country,
+        slot,
+        applicant_count,
+    ) in rows:
+        user = users.get(user_id)
+        if user is None:
+            user = users[user_id] = UserApplications(
+                id=user_id,
+                email=email,
+                nickname=nickname,
+                grade=grade,
+                lang=lang,
+                modify_count=modify_count,
+                applications=[],
+            )
+        if university_id is not None:
+            user.applications.append(
+                {
+                    "choice": choice,
+                    "universityId": university_id,
+                    "universityName": university_name,
+                    "country": country,
+                    "slot": slot,
+                    "totalApplicants": applicant_count,
+                }
+            )
+    return users
+
+
+def user_content(user: UserApplications) -> dict:
+    """
+    UserResponse 형태의 dict입니다. (본인 조회용)
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "nickname": user.nickname,
+        "grade": user.grade,
+        "lang": user.lang,
+        "modifyCount": user.modify_count,
+        "applications": user.applications,
+    }
+
+
+def public_user_content(user: UserApplications) -> dict:
+    """
+    PublicUserResponse 형태의 dict입니다. (이메일, 수정횟수 등 민감 정보 제외)
+    """
+    return {
+        "id": user.id,
+        "nickname": user.nickname,
+        "grade": user.grade,
+        "lang": user.lang,
+        "applications": user.applications,
+    }
+
+
+def _user_application_rows(db: Session, user_ids: list[int], viewer_id: int | None):
+    """
+    공유 스냅샷이 유효하면 대학/지원자 수 JOIN 없이 조회하고 카탈로그와 스냅샷으로 채웁니다.
+    """
+    snapshot = applicant_snapshot.get_counts(viewer_id) if viewer_id is not None else None
+    if snapshot is not None:
+        rows = db.execute(user_choices_statement(user_ids)).all()
+        catalog = university_service.get_university_catalog(
+            db, [row[-1] for row in rows if row[-1] is not None]
+        )
+        filled = fill_university_columns(rows, catalog, snapshot[1])
+        if filled is not None:
+            return filled
+    return db.execute(user_applications_statement(user_ids)).all()
+
+
+def get_user_applications(
+    db: Session, user_id: int, viewer_id: int | None = None
+) -> UserApplications | None:
+    """
+    사용자 정보와 지원 목록(대학 정보, 지원자 수 포함)을 쿼리 한 번으로 조회합니다.
+    /users/me 와 /users/{user_id} 가 함께 사용합니다.
+    viewer_id(조회하는 사용자)를 주면 유효한 공유 스냅샷의 지원자 수를 사용합니다.
+    """
+    rows = _user_application_rows(db, [user_id], viewer_id)
+    return group_user_applications(rows).get(user_id)
+
+
+def get_users_applications(
+    db: Session, user_ids: list[int], viewer_id: int | None = None
+) -> dict[int, UserApplications]:
+    """
+    여러 사용자의 정보와 지원 목록을 사용자 수와 관계없이 쿼리 한 번으로 조회합니다.
+    존재하지 않는 ID는 결과에서 빠집니다.
+    """
+    if not user_ids:
+        return {}
+    rows = _user_application_rows(db, list(set(user_ids)), viewer_id)
+    return group_user_applications(rows)
+
+
+def validate_application_choices(
     new_applications: list[user_schemas.ApplicationChoice],
-) -> models.User:
+) -> None:
     """
-    사용자의 지원 대학 내역을 업데이트합니다.
+    DB 조회 없이 확인할 수 있는 지원 내역 검증입니다. (sync/async 공용)
     """
     # 1-1. 최대 5개 제한 검증
     if len(new_applications) > 5:
@@ -52,34 +254,284 @@ def update_user_applications(
                 "choice는 1부터 시작하여 순서대로 중간에 빠짐없이 입력해야 합니다."
             )
 
-    # 1-3. universityId 존재 여부 검증
-    from app.services import university as university_service
 
-    for app in new_applications:
-        university = university_service.get_university(db, app.universityId)
-        if university is None:
-            raise ValueError(f"존재하지 않는 대학입니다. (ID: {app.universityId})")
+class ApplicationChanges(NamedTuple):
+    """
+    지원 내역 수정 결과입니다. 각 항목은 choice 기준입니다.
+    """
+
+    inserted: list[tuple[int, int]]  # (choice, 대학ID)
+    updated: list[tuple[int, int, int]]  # (choice, 기존 대학ID, 새 대학ID)
+    deleted: list[tuple[int, int]]  # (choice, 대학ID)
+
+    def applicant_count_deltas(self) -> Counter:
+        """
+        {대학ID: 지원자 수 증감량}
+        """
+        deltas = Counter()
+        for _, university_id in self.inserted:
+            deltas[university_id] += 1
+        for _, old_university_id, new_university_id in self.updated:
+            deltas[old_university_id] -= 1
+            deltas[new_university_id] += 1
+        for _, university_id in self.deleted:
+            deltas[university_id] -= 1
+        return deltas
+
+
+def diff_applications(
+    existing: list[tuple[int, int, int]],
+    new_applications: list[user_schemas.ApplicationChoice],
+) -> tuple[ApplicationChanges, list[int], list[dict], list[dict]]:
+    """
+    기존 지원 내역 [(application ID, choice, 대학ID)]과 새 요청을 choice 기준으로 비교합니다.
+    (변경 내역, 삭제할 application ID, UPDATE 파라미터, INSERT 파라미터)를 반환합니다.
+    """
+    existing_by_choice = {choice: (id_, uid) for id_, choice, uid in existing}
+    requested = {app.choice: app.universityId for app in new_applications}
+
+    changes = ApplicationChanges(inserted=[], updated=[], deleted=[])
+    delete_ids, update_params, insert_params = [], [], []
+    for choice, (application_id, old_university_id) in existing_by_choice.items():
+        new_university_id = requested.get(choice)
+        if new_university_id is None:
+            changes.deleted.append((choice, old_university_id))
+            delete_ids.append(application_id)
+        elif new_university_id != old_university_id:
+            changes.updated.append((choice, old_university_id, new_university_id))
+            update_params.append(
+                {"id": application_id, "partner_university_id": new_university_id}
+            )
+    for choice, university_id in requested.items():
+        if choice not in existing_by_choice:
+            changes.inserted.append((choice, university_id))
+            insert_params.append({"choice": choice, "partner_university_id": university_id})
+
+    return changes, delete_ids, update_params, insert_params
+
 
-    # 2. 수정 횟수가 0 이하이면 ValueError 발생
+class ApplicationConflictError(Exception):
+    """
+    같은 사용자의 다른 수정 요청이 먼저 반영되어(남은 수정 횟수를 다 써서) 이번 수정이 적용되지 않은 경우입니다.
+    """
+
+
+def claim_modify_count_statement(user_id: int):
+    """
+    modify_count가 0보다 클 때만 1 차감하는 조건부 UPDATE입니다.
+    토큰 캐시의 modify_count는 다른 워커의 수정을 모를 수 있으므로 비교하지 않고 DB 값으로만 판단합니다.
+    차감한 사용자 행은 커밋할 때까지 잠기므로 같은 사용자의 수정은 차감한 순서대로 반영됩니다.
+    """
+    return (
+        update(models.User)
+        .where(models.User.id == user_id, models.User.modify_count > 0)
+        .values(modify_count=models.User.modify_count - 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class ApplicationUpdate(NamedTuple):
+    """
+    검증을 마친 지원 내역 수정 요청입니다.
+    """
+
+    user_id: int
+    applications: list[user_schemas.ApplicationChoice]
+
+
+def check_application_update(
+    db: Session,
+    user: models.User,
+    new_applications: list[user_schemas.ApplicationChoice],
+) -> ApplicationUpdate:
+    """
+    지원 내역 수정 요청을 검증합니다. 잘못된 요청이면 ValueError를 냅니다. (쓰기 없음)
+    """
+    validate_application_choices(new_applications)
+
+    # 1-3. universityId 존재 여부 검증 (대학 카탈로그, 보통 쿼리 없음)
+    university_ids = [app.universityId for app in new_applications]
+    catalog = university_service.get_university_catalog(db, university_ids)
+    missing_id = catalog.first_missing(university_ids)
+    if missing_id is not None:
+        raise ValueError(f"존재하지 않는 대학입니다. (ID: {missing_id})")
+
+    # 2. 수정 횟수가 0 이하이면 ValueError 발생 (캐시된 값, 실제 차감은 claim_modify_count_statement)
     if user.modify_count <= 0:
         raise ValueError("수정 횟수가 부족합니다.")
 
-    # 3. 이 사용자의 기존 지원 내역을 모두 삭제
-    db.query(models.Application).filter(models.Application.user_id == user.id).delete(
-        synchronize_session=False
+    return ApplicationUpdate(user.id, new_applications)
+
+
+def existing_applications_statement(user_ids: list[int]) -> Select:
+    """
+    modify_count를 차감한 사용자들의 기존 지원 내역입니다.
+    트랜잭션 시작 시점의 스냅샷이 아니라 마지막으로 커밋된 값과 비교해야 하므로 잠금 읽기로 조회합니다.
+    """
+    return (
+        select(
+            models.Application.user_id,
+            models.Application.id,
+            models.Application.choice,
+            models.Application.partner_university_id,
+        )
+        .where(models.Application.user_id.in_(user_ids))
+        .with_for_update()
     )
 
-    # 4. 요청받은 내역으로 새로운 지원 정보 생성
-    for app_choice in new_applications:
-        db_application = models.Application(
-            user_id=user.id,
-            partner_university_id=app_choice.universityId,
-            choice=app_choice.choice,
+
+class ApplicationWrites(NamedTuple):
+    """
+    여러 수정 요청의 변경을 합친 쓰기 목록입니다. (요청 수와 관계없이 SQL 몇 개로 실행)
+    """
+
+    changes: dict[int, ApplicationChanges]  # {요청 위치: 변경 내역}
+    delete_ids: list[int]
+    update_params: list[dict]
+    insert_params: list[dict]
+    applicant_count_deltas: Counter
+
+
+def plan_application_writes(
+    existing_rows, updates: list[ApplicationUpdate], claimed: dict[int, int]
+) -> ApplicationWrites:
+    """
+    modify_count 차감에 성공한 요청({사용자ID: 요청 위치})마다 기존 지원 내역
+    existing_applications_statement 결과와 비교한 변경을 합칩니다. (sync/async 공용)
+    """
+    existing: dict[int, list[tuple[int, int, int]]] = {user_id: [] for user_id in claimed}
+    for user_id, application_id, choice, university_id in existing_rows:
+        existing[user_id].append((application_id, choice, university_id))
+
+    writes = ApplicationWrites({}, [], [], [], Counter())
+    for user_id, index in claimed.items():
+        changes, delete_ids, update_params, insert_params = diff_applications(
+            existing[user_id], updates[index].applications
         )
-        db.add(db_application)
+        writes.changes[index] = changes
+        writes.delete_ids.extend(delete_ids)
+        writes.update_params.extend(update_params)
+        writes.insert_params.extend(
+            {"user_id": user_id, **params} for params in insert_params
+        )
+        writes.applicant_count_deltas.update(changes.applicant_count_deltas())
+    return writes
+
+
+def application_update_rounds(updates: list[ApplicationUpdate]) -> list[list[int]]:
+    """
+    요청 위치를 라운드로 나눕니다. 한 라운드에는 사용자마다 요청이 하나씩이고,
+    같은 사용자의 요청이 여러 개면 들어온 순서대로 다음 라운드에 넣습니다. (sync/async 공용)
+    """
+    rounds: list[list[int]] = []
+    seen: Counter = Counter()
+    for index, pending in enumerate(updates):
+        position = seen[pending.user_id]
+        seen[pending.user_id] += 1
+        if position == len(rounds):
+            rounds.append([])
+        rounds[position].append(index)
+    return rounds
+
+
+def apply_application_updates(
+    db: Session, updates: list[ApplicationUpdate]
+) -> list[ApplicationChanges | ApplicationConflictError]:
+    """
+    검증을 마친 수정 요청들을 현재 트랜잭션에 반영합니다. (커밋은 호출한 쪽에서 합니다.)
+    요청마다 modify_count를 조건부로 차감하고, 차감에 성공한 요청의 지원 내역 변경과
+    대학별 지원자 수 증감은 합쳐서 실행합니다.
+    한 배치에 같은 사용자의 요청이 여러 개면 라운드를 나눠 하나씩 들어온 순서대로 반영하므로
+    파이프라인을 끈 경우와 결과가 같습니다.
+    결과는 요청 순서대로 변경 내역 또는 ApplicationConflictError입니다.
+    """
+    results: list = [None] * len(updates)
+    applicant_count_deltas: Counter = Counter()
+    for indexes in application_update_rounds(updates):
+        claimed: dict[int, int] = {}
+        # 여러 워커의 배치가 같은 사용자 행을 서로 다른 순서로 잠그지 않도록 사용자ID 순으로 차감합니다.
+        for index in sorted(indexes, key=lambda index: updates[index].user_id):
+            pending = updates[index]
+            # 지원 내역을 건드리기 전에 수정 횟수를 먼저 차감 (다른 요청이 먼저 다 써 버렸다면 충돌)
+            if db.execute(claim_modify_count_statement(pending.user_id)).rowcount != 1:
+                results[index] = ApplicationConflictError()
+            else:
+                claimed[pending.user_id] = index
+        if not claimed:
+            continue
+
+        # 3. 기존 지원 내역(이전 라운드의 반영 포함)과 비교
+        rows = db.execute(existing_applications_statement(list(claimed))).all()
+        writes = plan_application_writes(rows, updates, claimed)
+
+        # 4. 바뀐 부분만 묶어서 반영
+        if writes.delete_ids:
+            db.execute(
+                delete(models.Application)
+                .where(models.Application.id.in_(writes.delete_ids))
+                .execution_options(synchronize_session=False)
+            )
+        if writes.update_params:
+            db.execute(update(models.Application), writes.update_params)
+        if writes.insert_params:
+            db.execute(insert(models.Application), writes.insert_params)
 
-    # 5. 사용자 수정 횟수 1 차감
-    user.modify_count -= 1
-    db.add(user)
+        applicant_count_deltas.update(writes.applicant_count_deltas)
+        for index, changes in writes.changes.items():
+            results[index] = changes
 
-    return user
+    # 4-1. 대학별 지원자 수 카운터를 같은 트랜잭션 안에서 한 번에 증감 (대학 ID 순으로 잠금)
+    university_service.apply_applicant_count_deltas(db, applicant_count_deltas)
+    return results
+
+
+def update_user_applications(
+    db: Session,
+    user: models.User,
+    new_applications: list[user_schemas.ApplicationChoice],
+) -> ApplicationChanges:
+    """
+    사용자의 지원 대학 내역을 업데이트합니다.
+    기존 내역과 비교하여 바뀐 choice만 INSERT/UPDATE/DELETE 하고 변경 내역을 반환합니다.
+    검증은 통과했지만 DB의 modify_count가 이미 0이면(다른 수정이 먼저 반영된 경우) ApplicationConflictError를 냅니다.
+    """
+    pending = check_application_update(db, user, new_applications)
+    (result,) = apply_application_updates(db, [pending])
+    if isinstance(result, ApplicationConflictError):
+        raise result
+    return result
+
+
+def publish_application_update(
+    user: models.User,
+    new_applications: list[user_schemas.ApplicationChoice],
+    changes: ApplicationChanges,
+) -> None:
+    """
+    커밋된 지원 내역 변경을 모든 워커에 알립니다.
+    (실시간 지원자 수 스트림, 합격 예측 엔진, 복제본 라우터가 구독합니다.)
+    """
+    # 이 워커에서는 이벤트 전달을 기다리지 않고 바로 primary(와 이후에 만든 스냅샷)에서 읽게 합니다.
+    replica_router.mark_written(user.id)
+    applicant_snapshot.mark_written(user.id)
+    deltas = changes.applicant_count_deltas()
+    try:
+        broker.publish(
+            {
+                "type": APPLICATIONS_UPDATED,
+                "user_id": user.id,
+                "user_uuid": user.uuid,
+                "grade": user.grade,
+                "choices": [
+                    app.universityId
+                    for app in sorted(new_applications, key=lambda app: app.choice)
+                ],
+                "deltas": {
+                    str(university_id): delta
+                    for university_id, delta in deltas.items()
+                    if delta
+                },
+            }
+        )
+    except OSError:
+        logger.exception("failed to publish application update")
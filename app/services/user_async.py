@@ -0,0 +1,160 @@
+"""
+app.services.user 의 AsyncSession 버전입니다. (DB_MODE=async)
+"""
+
+from collections import Counter
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import models
+from app.services.applicant_snapshot import applicant_snapshot
+import app.schemas.users as user_schemas
+import app.services.university_async as university_service
+from app.services.user import (
+    ApplicationChanges,
+    ApplicationConflictError,
+    ApplicationUpdate,
+    UserApplications,
+    application_update_rounds,
+    claim_modify_count_statement,
+    existing_applications_statement,
+    fill_university_columns,
+    group_user_applications,
+    plan_application_writes,
+    user_applications_statement,
+    user_choices_statement,
+    validate_application_choices,
+)
+
+
+async def get_user_by_uuid(db: AsyncSession, *, uuid: str) -> models.User | None:
+    """
+    UUID를 사용하여 사용자를 조회합니다.
+    """
+    result = await db.execute(select(models.User).where(models.User.uuid == uuid))
+    return result.scalars().first()
+
+
+async def _user_application_rows(
+    db: AsyncSession, user_ids: list[int], viewer_id: int | None
+):
+    snapshot = applicant_snapshot.get_counts(viewer_id) if viewer_id is not None else None
+    if snapshot is not None:
+        rows = (await db.execute(user_choices_statement(user_ids))).all()
+        catalog = await university_service.get_university_catalog(
+            db, [row[-1] for row in rows if row[-1] is not None]
+        )
+        filled = fill_university_columns(rows, catalog, snapshot[1])
+        if filled is not None:
+            return filled
+    return (await db.execute(user_applications_statement(user_ids))).all()
+
+
+async def get_user_applications(
+    db: AsyncSession, user_id: int, viewer_id: int | None = None
+) -> UserApplications | None:
+    """
+    사용자 정보와 지원 목록(대학 정보, 지원자 수 포함)을 쿼리 한 번으로 조회합니다.
+    """
+    rows = await _user_application_rows(db, [user_id], viewer_id)
+    return group_user_applications(rows).get(user_id)
+
+
+async def get_users_applications(
+    db: AsyncSession, user_ids: list[int], viewer_id: int | None = None
+) -> dict[int, UserApplications]:
+    """
+    여러 사용자의 정보와 지원 목록을 쿼리 한 번으로 조회합니다.
+    """
+    if not user_ids:
+        return {}
+    rows = await _user_application_rows(db, list(set(user_ids)), viewer_id)
+    return group_user_applications(rows)
+
+
+async def check_application_update(
+    db: AsyncSession,
+    user: models.User,
+    new_applications: list[user_schemas.ApplicationChoice],
+) -> ApplicationUpdate:
+    """
+    지원 내역 수정 요청을 검증합니다. 잘못된 요청이면 ValueError를 냅니다. (쓰기 없음)
+    """
+    validate_application_choices(new_applications)
+
+    # 1-3. universityId 존재 여부 검증 (대학 카탈로그, 보통 쿼리 없음)
+    university_ids = [app.universityId for app in new_applications]
+    catalog = await university_service.get_university_catalog(db, university_ids)
+    missing_id = catalog.first_missing(university_ids)
+    if missing_id is not None:
+        raise ValueError(f"존재하지 않는 대학입니다. (ID: {missing_id})")
+
+    # 2. 수정 횟수가 0 이하이면 ValueError 발생
+    if user.modify_count <= 0:
+        raise ValueError("수정 횟수가 부족합니다.")
+
+    return ApplicationUpdate(user.id, new_applications)
+
+
+async def apply_application_updates(
+    db: AsyncSession, updates: list[ApplicationUpdate]
+) -> list[ApplicationChanges | ApplicationConflictError]:
+    """
+    검증을 마친 수정 요청들을 현재 트랜잭션에 반영하고 요청 순서대로 결과를 반환합니다.
+    같은 사용자의 요청은 라운드를 나눠 들어온 순서대로 반영합니다.
+    """
+    results: list = [None] * len(updates)
+    applicant_count_deltas: Counter = Counter()
+    for indexes in application_update_rounds(updates):
+        claimed: dict[int, int] = {}
+        for index in sorted(indexes, key=lambda index: updates[index].user_id):
+            pending = updates[index]
+            # 2-1. 수정 횟수를 먼저 차감 (다른 요청이 먼저 다 써 버렸다면 충돌)
+            if (
+                await db.execute(claim_modify_count_statement(pending.user_id))
+            ).rowcount != 1:
+                results[index] = ApplicationConflictError()
+            else:
+                claimed[pending.user_id] = index
+        if not claimed:
+            continue
+
+        # 3. 기존 지원 내역(이전 라운드의 반영 포함)과 비교
+        result = await db.execute(existing_applications_statement(list(claimed)))
+        writes = plan_application_writes(result.all(), updates, claimed)
+
+        # 4. 바뀐 부분만 묶어서 반영
+        if writes.delete_ids:
+            await db.execute(
+                delete(models.Application)
+                .where(models.Application.id.in_(writes.delete_ids))
+                .execution_options(synchronize_session=False)
+            )
+        if writes.update_params:
+            await db.execute(update(models.Application), writes.update_params)
+        if writes.insert_params:
+            await db.execute(insert(models.Application), writes.insert_params)
+
+        applicant_count_deltas.update(writes.applicant_count_deltas)
+        for index, changes in writes.changes.items():
+            results[index] = changes
+
+    # 4-1. 대학별 지원자 수 카운터를 같은 트랜잭션 안에서 한 번에 증감
+    await university_service.apply_applicant_count_deltas(db, applicant_count_deltas)
+    return results
+
+
+async def update_user_applications(
+    db: AsyncSession,
+    user: models.User,
+    new_applications: list[user_schemas.ApplicationChoice],
+) -> ApplicationChanges:
+    """
+    사용자의 지원 대학 내역을 업데이트하고 변경 내역을 반환합니다.
+    """
+    pending = await check_application_update(db, user, new_applications)
+    (result,) = await apply_application_updates(db, [pending])
+    if isinstance(result, ApplicationConflictError):
+        raise result
+    return result
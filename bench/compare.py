@@ -0,0 +1,32 @@
+"""
+두 벤치마크 결과(JSON)를 시나리오별로 비교합니다.
+
+    uv run python bench/compare.py bench/results/before.json bench/results/after.json
+"""
+
+import json
+import sys
+from pathlib import Path
+
+METRICS = ["throughput_rps", "p50_ms", "p95_ms", "p99_ms", "queries_per_request"]
+
+
+def main(argv: list[str]) -> None:
+    if len(argv) != 2:
+        raise SystemExit(__doc__)
+    before, after = (json.loads(Path(path).read_text()) for path in argv)
+    print(f"{before['commit']} -> {after['commit']}")
+    for scenario, new in after["scenarios"].items():
+        old = before["scenarios"].get(scenario)
+        if old is None:
+            continue
+        print(scenario)
+        for metric in METRICS:
+            if metric not in old or metric not in new:
+                continue
+            change = (new[metric] - old[metric]) / old[metric] * 100 if old[metric] else 0.0
+            print(f"  {metric:<20} {old[metric]:>10.2f} -> {new[metric]:>10.2f} ({change:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
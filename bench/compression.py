@@ -0,0 +1,124 @@
+"""
+응답 압축의 인코딩별 전송 크기와 CPU 비용을 측정합니다. (DB 조회 시간 제외)
+
+    uv run python bench/compression.py --rows 100 500 2000 --mbps 5
+
+- 본문: 지원자 --rows 명인 GET /universities/{id} 응답, 대학 --universities 개의 GET /universities 응답
+- request: CompressionMiddleware가 요청마다 압축하는 수준의 압축 시간 (캐시되지 않는 응답)
+- cached: CachedPayload를 만들 때 한 번 압축하는 수준의 압축 시간과 크기 (캐시 적중 시 압축 비용 0)
+- decode: 클라이언트의 압축 해제 시간
+- wire ms: --mbps 대역폭에서 본문 전송에 걸리는 시간
+br/zstd는 brotli/zstandard 패키지가 있을 때만 측정합니다. (uv sync --extra compression)
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+# 사용할 수 있는 모든 인코딩을 측정합니다.
+os.environ.setdefault("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+
+import orjson  # noqa: E402
+
+from app.core.compression import available_encodings, compress  # noqa: E402
+import app.services.university as university_service  # noqa: E402
+from bench.serialization import load_applicants  # noqa: E402
+
+
+def _decoder(encoding: str):
+    if encoding == "gzip":
+        return gzip.decompress
+    if encoding == "br":
+        import brotli
+
+        return brotli.decompress
+    import zstandard
+
+    return lambda body: zstandard.ZstdDecompressor().decompress(body)
+
+
+def measure(func, repeat: int) -> float:
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def university_list_body(universities: int) -> bytes:
+    return orjson.dumps(
+        [
+            {
+                "id": i,
+                "name": f"Partner University {i}",
+                "country": "미국",
+                "slot": 1 + i % 5,
+                "applicantCount": i * 7 % 400,
+            }
+            for i in range(1, universities + 1)
+        ]
+    )
+
+
+def report(name: str, body: bytes, encodings, repeat: int, mbps: float) -> None:
+    wire_ms = lambda size: size * 8 / (mbps * 1e6) * 1000  # noqa: E731
+    print(f"\n{name}: {len(body)} bytes")
+    print(
+        f"  {'encoding':<9} {'request':>8} {'ms':>7} {'cached':>8} {'ms':>7}"
+        f" {'ratio':>6} {'decode ms':>9} {'wire ms':>8}"
+    )
+    print(
+        f"  {'identity':<9} {len(body):>8} {0:>7.2f} {len(body):>8} {0:>7.2f}"
+        f" {1:>6.2f} {0:>9.2f} {wire_ms(len(body)):>8.1f}"
+    )
+    for encoding in encodings:
+        request_body = compress(body, encoding)
+        cached_body = compress(body, encoding, precompressed=True)
+        request_ms = measure(lambda: compress(body, encoding), repeat) * 1000
+        cached_ms = measure(lambda: compress(body, encoding, precompressed=True), repeat) * 1000
+        decode = _decoder(encoding)
+        assert decode(cached_body) == body
+        decode_ms = measure(lambda: decode(cached_body), repeat) * 1000
+        print(
+            f"  {encoding:<9} {len(request_body):>8} {request_ms:>7.2f}"
+            f" {len(cached_body):>8} {cached_ms:>7.2f}"
+            f" {len(body) / len(cached_body):>6.2f} {decode_ms:>9.2f}"
+            f" {wire_ms(len(cached_body)):>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--universities", type=int, default=300)
+    parser.add_argument("--mbps", type=float, default=5, help="전송 시간 계산에 쓸 대역폭 (모바일 기준)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    encodings = available_encodings(("zstd", "br", "gzip"))
+    missing = sorted({"zstd", "br"} - set(encodings))
+    if missing:
+        print(f"skipped (package not installed): {', '.join(missing)}")
+
+    report(
+        f"GET /universities ({args.universities} universities)",
+        university_list_body(args.universities),
+        encodings,
+        args.repeat,
+        args.mbps,
+    )
+    for rows in args.rows:
+        university = load_applicants(rows)
+        body = orjson.dumps(university_service.university_detail_content(university))
+        report(f"GET /universities/{{id}} ({rows} applicants)", body, encodings, args.repeat, args.mbps)
+
+
+if __name__ == "__main__":
+    main()
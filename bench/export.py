@@ -0,0 +1,122 @@
+"""
+지원 현황 내보내기와 파트너 대학 upsert의 처리량 벤치마크입니다. bench/seed.py로 채운 DB를 대상으로 합니다.
+(약 10만 건의 지원 내역은 --users 31000 정도로 만들어집니다.)
+
+    DATABASE_URL=sqlite:///bench.db uv run python bench/export.py
+
+- stream-csv / stream-jsonl: app.services.bulk의 서버 측 커서 + 청크 단위 생성
+- orm: ORM으로 Application을 user/university와 함께 모두 불러온 뒤 한 행씩 쓰는 방식 (비교 기준)
+- upsert: 파트너 대학 --import-rows 행 upsert (측정 후 롤백하므로 DB는 바뀌지 않습니다)
+
+각 방식의 최대 메모리는 tracemalloc으로 따로 한 번 더 실행하여 잽니다.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from app.core.database import SessionLocal, init_engines  # noqa: E402
+from app.models import models  # noqa: E402
+import app.services.bulk as bulk_service  # noqa: E402
+
+
+def export_stream(fmt: str, chunk_size: int) -> int:
+    rows = 0
+    with SessionLocal() as db, open(os.devnull, "w") as output:
+        for chunk in bulk_service.iter_applications_export(db, fmt, chunk_size):
+            output.write(chunk)
+            rows += chunk.count("\n")
+    # CSV는 헤더 한 줄이 포함됩니다.
+    return rows - 1 if fmt == "csv" else rows
+
+
+def export_orm(fmt: str, chunk_size: int) -> int:
+    with SessionLocal() as db, open(os.devnull, "w", newline="") as output:
+        applications = (
+            db.query(models.Application)
+            .options(joinedload(models.Application.user), joinedload(models.Application.university))
+            .all()
+        )
+        writer = csv.writer(output)
+        writer.writerow(bulk_service.APPLICATION_EXPORT_FIELDS)
+        for application in applications:
+            writer.writerow(
+                [
+                    application.university.id,
+                    application.university.name,
+                    application.university.country,
+                    application.university.slot,
+                    application.choice,
+                    application.user.id,
+                    application.user.email,
+                    application.user.nickname,
+                    application.user.grade,
+                    application.user.lang,
+                ]
+            )
+        return len(applications)
+
+
+def upsert(rows: int, chunk_size: int) -> int:
+    records = (
+        {
+            "id": i,
+            "name": f"Imported University {i}",
+            "country": "미국",
+            "slot": 1 + i % 5,
+            "duration": bulk_service.DURATIONS[i % 2],
+        }
+        for i in range(1, rows + 1)
+    )
+    with SessionLocal() as db:
+        count = bulk_service.upsert_universities(db, records, chunk_size)
+        db.rollback()
+    return count
+
+
+def measure(fn, *args) -> tuple[int, float, float]:
+    started = time.perf_counter()
+    rows = fn(*args)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="bulk export/import benchmark")
+    parser.add_argument("--chunk-size", type=int, default=bulk_service.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--import-rows", type=int, default=100_000)
+    parser.add_argument("--skip-orm", action="store_true", help="비교 기준(ORM) 측정 생략")
+    args = parser.parse_args()
+
+    init_engines()
+    cases = [
+        ("stream-csv", export_stream, "csv", args.chunk_size),
+        ("stream-jsonl", export_stream, "jsonl", args.chunk_size),
+    ]
+    if not args.skip_orm:
+        cases.append(("orm", export_orm, "csv", args.chunk_size))
+    cases.append(("upsert", upsert, args.import_rows, args.chunk_size))
+
+    for name, fn, *fn_args in cases:
+        rows, elapsed, peak_mb = measure(fn, *fn_args)
+        print(
+            f"{name:<13} {rows:>8} rows  {elapsed:>6.2f}s  "
+            f"{rows / elapsed:>9.0f} rows/s  peak {peak_mb:>7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
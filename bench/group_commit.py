@@ -0,0 +1,160 @@
+"""
+서로 다른 사용자들의 PUT /users/me/applications를 동시에 보내 그룹 커밋 파이프라인을
+끄고 켰을 때의 처리량, 지연 시간, 커밋 수를 비교합니다. (bench/seed.py로 채운 DB 대상)
+
+    DATABASE_URL=sqlite:///bench.db uv run python bench/group_commit.py --users 200 --requests 2000
+    DB_MODE=async ... uv run python bench/group_commit.py --batch-size 50 --batch-wait-ms 5
+
+- 대상 사용자들의 지원 내역과 modify_count를 바꿉니다.
+- 설정은 import할 때 읽으므로 모드마다 앱을 새 프로세스에서 실행합니다.
+- 사용자마다 요청을 하나씩 차례로 보내므로 409는 나오지 않아야 합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def child(args: argparse.Namespace) -> None:
+    sys.path.insert(0, str(ROOT))
+    import httpx
+    from sqlalchemy import event, update
+
+    from app.core import database
+    from app.models import models
+    from app.services.auth import create_access_token
+    from bench.seed import bench_user_uuid
+
+    database.init_engines()
+    uuids = [bench_user_uuid(index) for index in range(1, args.users + 1)]
+    with database.SessionLocal() as db:
+        db.execute(
+            update(models.User)
+            .where(models.User.uuid.in_(uuids))
+            .values(modify_count=args.requests)
+        )
+        db.commit()
+
+    commits = 0
+
+    def count_commit(conn):
+        nonlocal commits
+        commits += 1
+
+    engine = database.get_engine()
+    if database.async_engine is not None:
+        engine = database.async_engine.sync_engine
+    event.listen(engine, "commit", count_commit)
+
+    rng = random.Random(args.seed)
+    headers = [{"Authorization": f"Bearer {create_access_token({'sub': uuid})}"} for uuid in uuids]
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    def body() -> dict:
+        university_ids = rng.sample(range(1, args.universities + 1), rng.randint(1, 5))
+        return {
+            "applications": [
+                {"universityId": university_id, "choice": choice}
+                for choice, university_id in enumerate(university_ids, 1)
+            ]
+        }
+
+    async def user_loop(client, index: int, count: int) -> None:
+        for _ in range(count):
+            started = time.perf_counter()
+            response = await client.put(
+                "/users/me/applications", headers=headers[index], json=body()
+            )
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    async def run() -> float:
+        nonlocal commits
+        from app.main import app
+
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+            ) as client:
+                # 토큰 캐시를 채워 두어 인증 조회가 측정에 섞이지 않게 합니다.
+                for header in headers:
+                    await client.get("/users/me", headers=header)
+                commits = 0
+                started = time.perf_counter()
+                per_user, extra = divmod(args.requests, args.users)
+                await asyncio.gather(
+                    *(
+                        user_loop(client, index, per_user + (index < extra))
+                        for index in range(args.users)
+                    )
+                )
+                return time.perf_counter() - started
+
+    elapsed = asyncio.run(run())
+    latencies.sort()
+    print(
+        json.dumps(
+            {
+                "elapsed": elapsed,
+                "statuses": statuses,
+                "commits": commits,
+                "p50": statistics.median(latencies),
+                "p99": latencies[int(len(latencies) * 0.99) - 1],
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="group commit pipeline benchmark")
+    parser.add_argument("--users", type=int, default=200, help="동시에 요청하는 사용자 수")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--universities", type=int, default=300, help="seed.py의 --universities 값")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--batch-wait-ms", type=float, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    print(f"{os.environ.get('DB_MODE', 'sync')}: {args.users} users, {args.requests} requests")
+    print(f"{'pipeline':<9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'commits':>8}  statuses")
+    for pipeline in ("false", "true"):
+        env = {
+            **os.environ,
+            "APPLICATION_WRITE_PIPELINE": pipeline,
+            "APPLICATION_WRITE_BATCH_SIZE": str(args.batch_size),
+            "APPLICATION_WRITE_BATCH_WAIT_MS": str(args.batch_wait_ms),
+            "AUTH_RATE_LIMIT_CAPACITY": "0",
+        }
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", *sys.argv[1:]],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.splitlines()[-1])
+        print(
+            f"{'on' if pipeline == 'true' else 'off':<9}"
+            f" {args.requests / result['elapsed']:>8.0f}"
+            f" {result['p50'] * 1000:>8.1f} {result['p99'] * 1000:>8.1f}"
+            f" {result['commits']:>8}  {result['statuses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+메트릭 기록 비용(요청 1건당)과 GET /metrics 생성 시간을 측정합니다.
+
+    uv run python bench/metrics.py --requests 200000 --workers 4
+
+- record: RouteMetricsMiddleware가 요청마다 하는 일 (처리 중 +1/-1, 처리 시간 히스토그램, 상태별 요청 수)
+- empty: 아무 기록도 하지 않는 같은 ASGI 앱 호출 (비교 기준)
+- render: --workers 개 워커 파일을 합쳐 Prometheus 텍스트를 만드는 시간
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def child(requests: int) -> None:
+    sys.path.insert(0, str(ROOT))
+    from starlette.routing import Route
+
+    from app.core import metrics
+
+    async def endpoint_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def noop_send(message):
+        pass
+
+    # 라우팅이 끝난 뒤의 scope처럼 route를 넣어 둡니다.
+    route = Route("/universities/{university_id}", lambda request: None)
+    scope = {"type": "http", "method": "GET", "path": "/universities/1", "route": route}
+
+    async def run(app) -> float:
+        await app(scope, None, noop_send)
+        started = time.perf_counter()
+        for _ in range(requests):
+            await app(scope, None, noop_send)
+        return time.perf_counter() - started
+
+    # 응답만 보내는 ASGI 앱을 감싸 라우팅/엔드포인트 비용을 빼고 잽니다.
+    baseline = asyncio.run(run(endpoint_app))
+    recorded = asyncio.run(run(metrics.RouteMetricsMiddleware(endpoint_app)))
+    print(f"{baseline / requests * 1e6:.3f} {recorded / requests * 1e6:.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="metrics overhead benchmark")
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.requests)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = {**os.environ, "METRICS_DIR": directory}
+        env.setdefault("DATABASE_URL", "sqlite://")
+        # 워커마다 자기 파일에 기록합니다. (동시에 실행)
+        processes = [
+            subprocess.Popen(
+                [sys.executable, __file__, "--child", "--requests", str(args.requests)],
+                env=env,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(args.workers)
+        ]
+        results = []
+        for process in processes:
+            output, _ = process.communicate()
+            if process.returncode != 0:
+                raise SystemExit(f"worker exited with {process.returncode}")
+            results.append([float(value) for value in output.split()])
+
+        os.environ["METRICS_DIR"] = directory
+        sys.path.insert(0, str(ROOT))
+        from app.core.metrics import REGISTRY
+
+        started = time.perf_counter()
+        text = REGISTRY.render()
+        render_ms = (time.perf_counter() - started) * 1000
+
+    baseline = sum(result[0] for result in results) / len(results)
+    recorded = sum(result[1] for result in results) / len(results)
+    total = next(
+        line
+        for line in text.splitlines()
+        if line.startswith("knu_http_requests_total{")
+    )
+    print(f"{args.workers} workers x {args.requests} requests")
+    print(f"empty   {baseline:>7.2f} us/request")
+    print(f"record  {recorded:>7.2f} us/request  (+{recorded - baseline:.2f} us)")
+    print(f"render  {render_ms:>7.2f} ms  {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+엔드포인트별 지연 시간/처리량 벤치마크입니다. bench/seed.py로 채운 DB를 대상으로 합니다.
+
+    # 앱을 같은 프로세스에서 실행
+    DATABASE_URL=sqlite:///bench.db uv run python bench/run.py
+    # 실행 중인 서버를 대상으로 측정 (서버는 AUTH_RATE_LIMIT_CAPACITY=0으로 실행)
+    uv run python bench/run.py --url http://localhost:8000
+
+요청당 쿼리 수는 응답의 Server-Timing 헤더에서 읽습니다.
+
+결과는 bench/results/<시각>-<커밋>.json 으로 저장되며 bench/compare.py로 비교합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# 같은 프로세스에서 실행하면 모든 요청이 같은 클라이언트로 보이므로 로그인 요청 제한을 끕니다.
+# (설정은 app을 처음 import 할 때 읽으므로 import 전에 지정합니다.)
+os.environ.setdefault("AUTH_RATE_LIMIT_CAPACITY", "0")
+
+from bench.seed import bench_user_uuid  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SCENARIOS = ["auth_token", "universities", "university_detail", "users_me", "update_applications"]
+
+
+SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+
+def queries_from_server_timing(response: httpx.Response) -> int | None:
+    """
+    QueryStatsMiddleware가 붙인 Server-Timing 헤더에서 요청당 SQL 문 수를 읽습니다.
+    """
+    match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+    return int(match.group(1)) if match else None
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def build_request(scenario: str, rng: random.Random, args, tokens: list[str]):
+    """
+    (method, path, headers, json) 를 반환합니다.
+    """
+    if scenario == "auth_token":
+        user_index = rng.randint(1, args.users)
+        return "POST", "/auth/token", {}, {"uuid": bench_user_uuid(user_index)}
+
+    headers = {"Authorization": f"Bearer {rng.choice(tokens)}"}
+    if scenario == "universities":
+        return "GET", "/universities", headers, None
+    if scenario == "university_detail":
+        university_id = rng.randint(1, args.universities)
+        return "GET", f"/universities/{university_id}", headers, None
+    if scenario == "users_me":
+        return "GET", "/users/me", headers, None
+    if scenario == "update_applications":
+        count = rng.randint(1, 5)
+        university_ids = rng.sample(range(1, args.universities + 1), count)
+        body = {
+            "applications": [
+                {"universityId": university_id, "choice": choice}
+                for choice, university_id in enumerate(university_ids, 1)
+            ]
+        }
+        return "PUT", "/users/me/applications", headers, body
+    raise ValueError(scenario)
+
+
+async def login(client: httpx.AsyncClient, count: int, users: int) -> list[str]:
+    tokens = []
+    for user_index in random.Random(0).sample(range(1, users + 1), count):
+        response = await client.post(
+            "/auth/token", json={"uuid": bench_user_uuid(user_index)}
+        )
+        response.raise_for_status()
+        tokens.append(response.json()["accessToken"])
+    return tokens
+
+
+async def run_scenario(client, scenario, args, tokens) -> dict:
+    rng = random.Random(f"{args.seed}-{scenario}")
+    requests = [build_request(scenario, rng, args, tokens) for _ in range(args.requests)]
+    latencies: list[float] = []
+    query_counts: list[int] = []
+    errors = 0
+    queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            method, path, headers, body = queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.request(method, path, headers=headers, json=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            queries = queries_from_server_timing(response)
+            if queries is not None:
+                query_counts.append(queries)
+            if response.status_code >= 400:
+                errors += 1
+
+    # 워밍업 (캐시, 커넥션 풀)
+    for method, path, headers, body in requests[: args.warmup]:
+        await client.request(method, path, headers=headers, json=body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": args.concurrency,
+        "throughput_rps": len(latencies) / elapsed,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1],
+    }
+    if query_counts:
+        result["queries_per_request"] = statistics.fmean(query_counts)
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def main_async(args) -> dict:
+    if args.url:
+        return await run_all(args, None, args.url)
+
+    from app.main import app
+
+    # ASGITransport는 lifespan을 실행하지 않으므로 직접 실행합니다.
+    async with app.router.lifespan_context(app):
+        return await run_all(args, httpx.ASGITransport(app=app), "http://bench")
+
+
+async def run_all(args, transport, base_url: str) -> dict:
+    from app.core.config import settings
+
+    results = {}
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=60
+    ) as client:
+        tokens = await login(client, args.logged_in_users, args.users)
+        for scenario in args.scenarios:
+            results[scenario] = await run_scenario(client, scenario, args, tokens)
+            summary = results[scenario]
+            print(
+                f"{scenario:<22} {summary['throughput_rps']:>8.1f} rps  "
+                f"p50 {summary['p50_ms']:>7.2f}ms  p95 {summary['p95_ms']:>7.2f}ms  "
+                f"p99 {summary['p99_ms']:>7.2f}ms"
+                + (
+                    f"  {summary['queries_per_request']:.2f} q/req"
+                    if "queries_per_request" in summary
+                    else ""
+                )
+                + (f"  errors {summary['errors']}" if summary["errors"] else "")
+            )
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "target": args.url or f"in-process ({settings.db_mode})",
+        "config": {
+            key: getattr(args, key)
+            for key in ("requests", "concurrency", "warmup", "users", "universities", "seed")
+        },
+        "scenarios": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="knu-grade endpoint benchmark")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (생략 시 앱을 같은 프로세스에서 실행)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--users", type=int, default=50_000, help="seed.py의 --users 값")
+    parser.add_argument("--universities", type=int, default=300, help="seed.py의 --universities 값")
+    parser.add_argument("--logged-in-users", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now(UTC):%Y%m%dT%H%M%S}-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
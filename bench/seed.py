@@ -0,0 +1,111 @@
+"""
+벤치마크용 데이터를 로컬 DB에 생성합니다.
+
+    DATABASE_URL=sqlite:///bench.db uv run python bench/seed.py --users 50000 --universities 300
+
+대상 DB는 비어 있어야 하며, 스키마가 없으면 생성합니다.
+사용자 UUID는 bench_user_uuid(i)로 결정적으로 만들어지므로 bench/run.py가 DB 조회 없이 로그인할 수 있습니다.
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import Base, SessionLocal, get_engine  # noqa: E402
+from app.models import models  # noqa: E402
+import app.services.university as university_service  # noqa: E402
+
+BENCH_NAMESPACE = uuid.UUID("6f1d7a52-8a0e-4f0c-9a4e-2b7d1f3c9e10")
+COUNTRIES = ["미국", "캐나다", "영국", "독일", "프랑스", "일본", "중국", "호주", "네덜란드", "스웨덴"]
+LANGS = ["TOEFL 100", "TOEFL 90", "IELTS 7.0", "IELTS 6.5", "JLPT N1", "HSK 5급"]
+CHUNK_SIZE = 5000
+
+
+def bench_user_uuid(index: int) -> str:
+    return str(uuid.uuid5(BENCH_NAMESPACE, str(index)))
+
+
+def insert_chunks(db, model, rows):
+    for start in range(0, len(rows), CHUNK_SIZE):
+        db.execute(insert(model), rows[start : start + CHUNK_SIZE])
+
+
+def seed(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    Base.metadata.create_all(bind=get_engine())
+
+    universities = [
+        {
+            "id": i,
+            "name": f"Partner University {i}",
+            "country": rng.choice(COUNTRIES),
+            # 실제 모집인원처럼 대부분 1~3명, 일부만 많게
+            "slot": rng.choice([1, 1, 2, 2, 2, 3, 3, 4, 5, 10]),
+            "duration": rng.choice(["1개학기", "2개학기"]),
+        }
+        for i in range(1, args.universities + 1)
+    ]
+    # 인기 학교에 지원이 몰리도록 가중치를 줍니다.
+    weights = [1 / (rank**0.8) for rank in range(1, args.universities + 1)]
+    university_ids = [uni["id"] for uni in universities]
+
+    users, applications = [], []
+    for i in range(1, args.users + 1):
+        users.append(
+            {
+                "id": i,
+                "email": f"bench{i}@knu.ac.kr",
+                "uuid": bench_user_uuid(i),
+                "nickname": f"bench{i}",
+                "grade": round(min(4.5, max(2.0, rng.gauss(3.7, 0.4))), 2),
+                "lang": rng.choice(LANGS),
+                "modify_count": args.modify_count,
+            }
+        )
+        count = rng.choices([0, 1, 2, 3, 4, 5], weights=[5, 10, 15, 20, 20, 30])[0]
+        chosen = []
+        while len(chosen) < count:
+            university_id = rng.choices(university_ids, weights=weights)[0]
+            if university_id not in chosen:
+                chosen.append(university_id)
+        applications.extend(
+            {"user_id": i, "partner_university_id": university_id, "choice": choice}
+            for choice, university_id in enumerate(chosen, 1)
+        )
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        insert_chunks(db, models.PartnerUniversity, universities)
+        insert_chunks(db, models.User, users)
+        insert_chunks(db, models.Application, applications)
+        university_service.reconcile_applicant_counts(db)
+        db.commit()
+    print(
+        f"seeded {len(universities)} universities, {len(users)} users, "
+        f"{len(applications)} applications in {time.perf_counter() - started:.1f}s"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--universities", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--modify-count",
+        type=int,
+        default=1_000_000,
+        help="PUT 시나리오가 수정 횟수 제한에 걸리지 않도록 넉넉하게 설정",
+    )
+    seed(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+GET /universities/{id} 응답 직렬화의 지원자 1명당 비용을 측정합니다. (DB 조회 시간 제외)
+
+    uv run python bench/serialization.py --rows 100 1000 5000
+
+- pydantic: 행마다 ApplicantDetail을 만들고 FastAPI response_model로 다시 검증/직렬화 (이전 방식)
+- fast: Row에서 dict를 바로 만들어 orjson으로 직렬화 (현재 방식)
+- fast+validate: fast에 VALIDATE_RESPONSES 검증을 더한 경우
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.core.responses import _adapter  # noqa: E402
+from app.models import models  # noqa: E402
+from app.schemas.universities import ApplicantDetail, UniversityDetailResponse  # noqa: E402
+import app.services.university as university_service  # noqa: E402
+
+
+def load_applicants(rows: int) -> university_service.UniversityApplicants:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.execute(
+            insert(models.PartnerUniversity),
+            [{"id": 1, "name": "Partner University 1", "country": "미국", "slot": 3, "duration": "1개학기"}],
+        )
+        db.execute(
+            insert(models.User),
+            [
+                {
+                    "id": i,
+                    "email": f"user{i}@example.com",
+                    "uuid": f"uuid-{i}",
+                    "nickname": f"user{i}",
+                    "grade": 2.5 + (i * 7919 % 200) / 100,
+                    "lang": "TOEFL 100",
+                }
+                for i in range(1, rows + 1)
+            ],
+        )
+        db.execute(
+            insert(models.Application),
+            [
+                {"user_id": i, "partner_university_id": 1, "choice": 1}
+                for i in range(1, rows + 1)
+            ],
+        )
+        db.commit()
+        return university_service.get_university_with_applicants(db, 1)
+
+
+def pydantic_path(university, field) -> bytes:
+    applicant_list = [
+        ApplicantDetail(
+            id=applicant.user_id,
+            rank=applicant.rank,
+            choice=applicant.choice,
+            nickname=applicant.nickname,
+            grade=applicant.grade,
+            lang=applicant.lang,
+        )
+        for applicant in university.applicants
+    ]
+    content = UniversityDetailResponse(
+        name=university.name,
+        country=university.country,
+        slot=university.slot,
+        totalApplicants=university.total_applicants,
+        applicants=applicant_list,
+    )
+    serialized = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(serialized).body
+
+
+def fast_path(university) -> bytes:
+    return ORJSONResponse(university_service.university_detail_content(university)).body
+
+
+def fast_validated_path(university) -> bytes:
+    content = university_service.university_detail_content(university)
+    _adapter(UniversityDetailResponse).validate_python(content)
+    return ORJSONResponse(content).body
+
+
+def measure(func, repeat: int) -> float:
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    field = create_model_field(
+        name="Response_read_university_details",
+        type_=UniversityDetailResponse,
+        mode="serialization",
+    )
+    print(f"{'rows':>6} {'pydantic us/row':>16} {'fast us/row':>12} {'fast+validate':>14} {'speedup':>8}")
+    for rows in args.rows:
+        university = load_applicants(rows)
+        before = measure(lambda: pydantic_path(university, field), args.repeat)
+        after = measure(lambda: fast_path(university), args.repeat)
+        validated = measure(lambda: fast_validated_path(university), args.repeat)
+        print(
+            f"{rows:>6} {before / rows * 1e6:>16.2f} {after / rows * 1e6:>12.2f}"
+            f" {validated / rows * 1e6:>14.2f} {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+워커 간 공유 스냅샷(app.services.applicant_snapshot)의 갱신/조회 비용을 측정합니다. (DB 조회 시간 제외)
+
+    uv run python bench/shared_snapshot.py --universities 300 --applicants 150000 --workers 4
+
+- write: 행을 본문으로 만들어 mmap 파일에 쓰는 시간 (쓰는 워커가 갱신마다 하는 일)
+- counts: 대학별 지원자 수 조회 (같은 generation이면 워커 안의 dict를 그대로 사용)
+- rank: 학점 정렬 배열에서 내 순위 이진 탐색
+- workers: 쓰는 프로세스가 계속 갱신하는 동안 --workers 개 프로세스가 읽은 횟수와 본문 불일치 수
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.services.applicant_snapshot import (  # noqa: E402
+    ApplicantSnapshot,
+    parse_counts,
+)
+
+
+def make_rows(universities: int, applicants: int, seed: int = 0):
+    """
+    counts_statement()/grades_statement()와 같은 모양의 행을 만듭니다.
+    """
+    rng = random.Random(seed)
+    grade_rows = sorted(
+        (
+            (rng.randint(1, universities), round(rng.uniform(2.0, 4.5), 2), user_id, rng.randint(1, 5))
+            for user_id in range(1, applicants + 1)
+        ),
+        key=lambda row: (row[0], -row[1], row[2]),
+    )
+    counts = dict.fromkeys(range(1, universities + 1), 0)
+    for university_id, *_ in grade_rows:
+        counts[university_id] += 1
+    return sorted(counts.items()), grade_rows
+
+
+def reader(path: str, seconds: float) -> None:
+    snapshot = ApplicantSnapshot(path, max_age_seconds=60, grades=False)
+    reads = mismatches = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        result = snapshot.snapshot.read(parse_counts)
+        if result is None:
+            continue
+        reads += 1
+        # 쓰는 쪽은 모든 대학에 같은 값을 쓰므로 값이 섞여 있으면 찢어진 읽기입니다.
+        if len(set(result[1].values())) != 1:
+            mismatches += 1
+    print(reads, mismatches)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="shared snapshot benchmark")
+    parser.add_argument("--universities", type=int, default=300)
+    parser.add_argument("--applicants", type=int, default=150_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--reader", metavar="PATH", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.reader:
+        reader(args.reader, args.seconds)
+        return
+
+    count_rows, grade_rows = make_rows(args.universities, args.applicants)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "applicants.bin")
+        snapshot = ApplicantSnapshot(path, max_age_seconds=60, grades=True)
+        snapshot.snapshot.try_acquire_writer()
+
+        started = time.perf_counter()
+        snapshot.write(count_rows, grade_rows, time.time())
+        write_ms = (time.perf_counter() - started) * 1000
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        for _ in range(args.lookups):
+            snapshot.get_counts(None)
+        counts_us = (time.perf_counter() - started) / args.lookups * 1e6
+
+        rng = random.Random(1)
+        samples = [rng.choice(grade_rows) for _ in range(args.lookups)]
+        started = time.perf_counter()
+        for university_id, grade, user_id, _ in samples:
+            snapshot.get_rank(university_id, user_id, grade)
+        rank_us = (time.perf_counter() - started) / args.lookups * 1e6
+
+        # 모든 대학에 같은 값을 쓰면서 다른 프로세스들이 읽게 합니다.
+        writes = 0
+        snapshot.write([(university_id, 0) for university_id, _ in count_rows], None, time.time())
+        processes = [
+            subprocess.Popen(
+                [sys.executable, __file__, "--reader", path, "--seconds", str(args.seconds)],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(args.workers)
+        ]
+        deadline = time.perf_counter() + args.seconds
+        while time.perf_counter() < deadline:
+            writes += 1
+            snapshot.write(
+                [(university_id, writes) for university_id, _ in count_rows], None, time.time()
+            )
+        results = []
+        for process in processes:
+            output, _ = process.communicate()
+            if process.returncode != 0:
+                raise SystemExit(f"reader exited with {process.returncode}")
+            results.append([int(value) for value in output.split()])
+
+    print(f"{args.universities} universities, {args.applicants} applicants, {size / 1024:.0f} KiB file")
+    print(f"write    {write_ms:>8.2f} ms")
+    print(f"counts   {counts_us:>8.2f} us/lookup")
+    print(f"rank     {rank_us:>8.2f} us/lookup")
+    print(
+        f"workers  {args.workers} x {sum(r[0] for r in results) / len(results):.0f} reads "
+        f"during {writes} writes, torn reads: {sum(r[1] for r in results)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
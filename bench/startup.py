@@ -0,0 +1,110 @@
+"""
+워커 시작 시간 벤치마크입니다. uvicorn --workers N 처럼 새 인터프리터 N개를 동시에 띄워
+워커마다 다음 시간을 잽니다. bench/seed.py로 채운 DB를 대상으로 합니다.
+
+- import: app.main import (라우터, 모델, 설정 로드)
+- startup: lifespan 시작 (엔진 생성)
+- first_login / first_read: 첫 POST /auth/token, 첫 GET /universities (커넥션 연결, 캐시 채우기 포함)
+- warm_read: 두 번째 GET /universities
+- total: 프로세스 생성부터 첫 조회 응답까지
+
+    DATABASE_URL=sqlite:///bench.db uv run python bench/startup.py --workers 4 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+METRICS = ["import", "startup", "first_login", "first_read", "warm_read", "total"]
+
+
+def child() -> None:
+    started = time.perf_counter()
+    sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("AUTH_RATE_LIMIT_CAPACITY", "0")
+
+    from app.main import app
+
+    timings = {"import": time.perf_counter() - started}
+
+    import httpx
+
+    from bench.seed import bench_user_uuid
+
+    async def run() -> None:
+        t = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            timings["startup"] = time.perf_counter() - t
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench"
+            ) as client:
+                t = time.perf_counter()
+                response = await client.post("/auth/token", json={"uuid": bench_user_uuid(1)})
+                response.raise_for_status()
+                timings["first_login"] = time.perf_counter() - t
+                headers = {"Authorization": f"Bearer {response.json()['accessToken']}"}
+
+                for name in ("first_read", "warm_read"):
+                    t = time.perf_counter()
+                    (await client.get("/universities", headers=headers)).raise_for_status()
+                    timings[name] = time.perf_counter() - t
+
+    asyncio.run(run())
+    print(json.dumps({name: seconds * 1000 for name, seconds in timings.items()}))
+
+
+def spawn_workers(count: int) -> list[dict]:
+    started = time.perf_counter()
+    processes = [
+        subprocess.Popen(
+            [sys.executable, __file__, "--child"], stdout=subprocess.PIPE, text=True
+        )
+        for _ in range(count)
+    ]
+    results = []
+    for process in processes:
+        output, _ = process.communicate()
+        if process.returncode != 0:
+            raise SystemExit(f"worker exited with {process.returncode}")
+        result = json.loads(output.strip().splitlines()[-1])
+        # 워커들이 동시에 시작하므로 마지막으로 끝난 워커까지의 시간이 곧 전체 준비 시간입니다.
+        result["total"] = (time.perf_counter() - started) * 1000
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="worker startup benchmark")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 시작할 워커 수")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    samples: dict[str, list[float]] = {name: [] for name in METRICS}
+    for _ in range(args.runs):
+        for result in spawn_workers(args.workers):
+            for name in METRICS:
+                samples[name].append(result[name])
+
+    print(f"{args.workers} workers x {args.runs} runs (ms)")
+    for name in METRICS:
+        values = sorted(samples[name])
+        print(
+            f"{name:<12} median {statistics.median(values):>8.1f}  "
+            f"max {values[-1]:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
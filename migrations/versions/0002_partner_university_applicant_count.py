@@ -0,0 +1,37 @@
+"""partner_university.applicant_count counter
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "partner_university",
+        sa.Column("applicant_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # 기존 지원 내역으로 카운터 채우기
+    op.execute(
+        "UPDATE partner_university SET applicant_count = ("
+        "SELECT COUNT(*) FROM application"
+        " WHERE application.partner_university_id = partner_university.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("partner_university", "applicant_count")
@@ -0,0 +1,88 @@
+"""application / user hot-path indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _check_duplicate_choices() -> None:
+    """
+    같은 사용자의 같은 choice가 두 행 이상이면 unique 제약을 만들 수 없으므로 먼저 알립니다.
+    어느 행을 남길지는 운영자가 정해야 하므로 자동으로 지우지 않습니다.
+    (지운 뒤에는 python -m app.cli reconcile-counts로 applicant_count를 맞춥니다.)
+    """
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT user_id, choice, COUNT(*) FROM application"
+            " GROUP BY user_id, choice HAVING COUNT(*) > 1"
+            " ORDER BY user_id, choice"
+        )
+    ).all()
+    if duplicates:
+        sample = ", ".join(
+            f"(user_id={user_id}, choice={choice}) x{count}"
+            for user_id, choice, count in duplicates[:20]
+        )
+        raise RuntimeError(
+            f"application has {len(duplicates)} duplicated (user_id, choice) pairs; "
+            f"remove them before adding uq_application_user_choice: {sample}"
+        )
+
+
+# MySQL은 외래 키마다 인덱스가 필요합니다. 0001에서 자동으로 만든 user_id/partner_university_id 인덱스는
+# 아래 인덱스가 생기면 MySQL이 지우므로, downgrade에서는 이 이름으로 외래 키 인덱스를 먼저 다시 만듭니다.
+FOREIGN_KEY_INDEXES = {
+    "ix_application_user_id": ["user_id"],
+    "ix_application_partner_university_id": ["partner_university_id"],
+}
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name == "mysql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _check_duplicate_choices()
+    with op.batch_alter_table("application") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_application_user_choice", ["user_id", "choice"]
+        )
+    op.create_index(
+        "ix_application_university_user",
+        "application",
+        ["partner_university_id", "user_id"],
+    )
+    op.create_index("ix_user_grade", "user", ["grade"])
+    if _is_mysql():
+        # 이전 downgrade가 남긴 외래 키 인덱스는 위 인덱스와 겹치므로 지웁니다.
+        existing = {
+            index["name"] for index in sa.inspect(op.get_bind()).get_indexes("application")
+        }
+        for name in FOREIGN_KEY_INDEXES:
+            if name in existing:
+                op.drop_index(name, table_name="application")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_grade", table_name="user")
+    if _is_mysql():
+        for name, columns in FOREIGN_KEY_INDEXES.items():
+            op.create_index(name, "application", columns)
+    op.drop_index("ix_application_university_user", table_name="application")
+    with op.batch_alter_table("application") as batch_op:
+        batch_op.drop_constraint("uq_application_user_choice", type_="unique")
@@ -0,0 +1,33 @@
+"""university_catalog_version stamp
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "university_catalog_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.execute("INSERT INTO university_catalog_version (id, version) VALUES (1, 1)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("university_catalog_version")
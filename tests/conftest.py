@@ -0,0 +1,95 @@
+"""
+테스트는 임시 디렉터리의 SQLite DB를 사용합니다.
+설정은 import 시점에 한 번 읽으므로 app을 import 하기 전에 환경 변수를 정해 둡니다.
+"""
+
+import os
+import tempfile
+import uuid
+
+_tmp_dir = tempfile.mkdtemp(prefix="knu-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/test.db"
+os.environ["DB_MODE"] = "sync"
+os.environ["METRICS_DIR"] = ""
+os.environ["METRICS_TOKEN"] = "test-metrics-token"
+os.environ["SHARED_SNAPSHOT_PATH"] = ""
+os.environ["RATE_LIMIT_STORE"] = "memory"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+# 모든 요청이 같은 클라이언트 IP로 보이므로 로그인 요청 제한을 끕니다.
+os.environ["AUTH_RATE_LIMIT_CAPACITY"] = "0"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import Base, SessionLocal, get_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import models  # noqa: E402
+
+UNIVERSITY_COUNT = 10
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    Base.metadata.create_all(bind=get_engine())
+    with SessionLocal() as db:
+        db.execute(
+            insert(models.PartnerUniversity),
+            [
+                {
+                    "id": i,
+                    "name": f"Partner University {i}",
+                    "country": "미국",
+                    "slot": 2,
+                    "duration": "1개학기",
+                }
+                for i in range(1, UNIVERSITY_COUNT + 1)
+            ],
+        )
+        db.commit()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_user():
+    """
+    테스트마다 새 사용자를 만듭니다. (uuid가 달라 토큰 캐시를 공유하지 않습니다.)
+    """
+
+    def make(modify_count: int = 4, grade: float = 4.0) -> models.User:
+        user_uuid = str(uuid.uuid4())
+        with SessionLocal() as db:
+            user = models.User(
+                email=f"{user_uuid}@knu.ac.kr",
+                uuid=user_uuid,
+                nickname=user_uuid[:8],
+                grade=grade,
+                lang="TOEFL 100",
+                modify_count=modify_count,
+            )
+            db.add(user)
+            db.commit()
+            db.refresh(user)
+            db.expunge(user)
+        return user
+
+    return make
+
+
+@pytest.fixture
+def auth_headers(client):
+    """
+    POST /auth/token으로 로그인하고 Authorization 헤더를 반환합니다.
+    """
+
+    def login(user_uuid: str) -> dict:
+        response = client.post("/auth/token", json={"uuid": user_uuid})
+        assert response.status_code == 200
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+
+    return login
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models import models
+import app.services.university as university_service
+
+
+def stored_counts(university_ids: list[int]) -> dict[int, int]:
+    with SessionLocal() as db:
+        return dict(
+            db.execute(
+                select(
+                    models.PartnerUniversity.id, models.PartnerUniversity.applicant_count
+                ).where(models.PartnerUniversity.id.in_(university_ids))
+            ).all()
+        )
+
+
+def test_deltas_lock_rows_in_id_order():
+    statement = university_service.applicant_count_deltas_statement({7: -1, 3: 1, 5: 0})
+    compiled = statement.compile()
+
+    # 요청의 dict 순서와 관계없이 ID 오름차순, 증감이 0인 대학은 제외
+    assert [
+        value for key, value in compiled.params.items() if key.startswith("id_")
+    ] == [[3, 7]]
+    assert university_service.applicant_count_deltas_statement({4: 0}) is None
+
+
+def test_opposing_deltas_in_parallel():
+    university_ids = [3, 7]
+    before = stored_counts(university_ids)
+
+    def apply(deltas: dict[int, int]) -> None:
+        for _ in range(20):
+            with SessionLocal() as db:
+                university_service.apply_applicant_count_deltas(db, deltas)
+                db.commit()
+
+    # A는 3에 +1/7에 -1, B는 반대로 (각자 다른 dict 순서)
+    with ThreadPoolExecutor(4) as pool:
+        futures = [
+            pool.submit(apply, {3: 1, 7: -1}),
+            pool.submit(apply, {7: 1, 3: -1}),
+            pool.submit(apply, {7: -1, 3: 1}),
+            pool.submit(apply, {3: -1, 7: 1}),
+        ]
+        for future in futures:
+            future.result()
+
+    assert stored_counts(university_ids) == before
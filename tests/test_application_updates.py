@@ -0,0 +1,163 @@
+"""
+PUT /users/me/applications의 modify_count 차감과 동시성 검사입니다.
+"""
+
+import asyncio
+import random
+
+import httpx
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.main import app
+from app.models import models
+from app.schemas.users import ApplicationChoice
+import app.services.university as university_service
+import app.services.user as user_service
+from tests.conftest import UNIVERSITY_COUNT
+
+
+def stored_state(user_id: int) -> tuple[int, list[int]]:
+    """
+    DB의 (modify_count, choice 순 대학 ID 목록)입니다.
+    """
+    with SessionLocal() as db:
+        modify_count = db.execute(
+            select(models.User.modify_count).where(models.User.id == user_id)
+        ).scalar_one()
+        university_ids = db.execute(
+            select(models.Application.partner_university_id)
+            .where(models.Application.user_id == user_id)
+            .order_by(models.Application.choice)
+        ).scalars().all()
+    return modify_count, list(university_ids)
+
+
+def applicant_count_drift() -> dict:
+    with SessionLocal() as db:
+        drift = university_service.reconcile_applicant_counts(db)
+        db.rollback()
+    return drift
+
+
+def application_body(university_ids: list[int]) -> dict:
+    return {
+        "applications": [
+            {"universityId": university_id, "choice": choice}
+            for choice, university_id in enumerate(university_ids, 1)
+        ]
+    }
+
+
+def test_update_after_update_on_another_worker(client, make_user, auth_headers):
+    user = make_user(modify_count=3)
+    headers = auth_headers(user.uuid)
+    # 이 워커가 modify_count=3인 사용자를 토큰 캐시에 담아 둡니다.
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    # 다른 워커가 수정을 반영합니다. (memory 브로커는 이 워커의 캐시를 무효화하지 않습니다.)
+    with SessionLocal() as db:
+        db_user = db.get(models.User, user.id)
+        user_service.update_user_applications(
+            db, db_user, [ApplicationChoice(universityId=1, choice=1)]
+        )
+        db.commit()
+
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([2, 3])
+    )
+
+    assert response.status_code == 200
+    assert stored_state(user.id) == (1, [2, 3])
+    assert applicant_count_drift() == {}
+
+
+def test_update_fails_when_modify_count_is_used_up(client, make_user, auth_headers):
+    user = make_user(modify_count=1)
+    headers = auth_headers(user.uuid)
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    with SessionLocal() as db:
+        db_user = db.get(models.User, user.id)
+        user_service.update_user_applications(
+            db, db_user, [ApplicationChoice(universityId=1, choice=1)]
+        )
+        db.commit()
+
+    # 캐시된 modify_count(1)로는 검증을 통과하지만 DB에서 차감할 수 없습니다.
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([2])
+    )
+
+    assert response.status_code == 409
+    assert stored_state(user.id) == (0, [1])
+    # 충돌 후에는 캐시를 버리고 DB 값으로 다시 검증합니다.
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([2])
+    )
+    assert response.status_code == 400
+
+
+def test_parallel_updates(make_user, auth_headers):
+    modify_count = 3
+    user = make_user(modify_count=modify_count)
+    rng = random.Random(7)
+    bodies = [
+        application_body(
+            rng.sample(range(1, UNIVERSITY_COUNT + 1), rng.randint(1, 5))
+        )
+        for _ in range(12)
+    ]
+    headers = auth_headers(user.uuid)
+
+    async def fire() -> list[int]:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as async_client:
+                responses = await asyncio.gather(
+                    *(
+                        async_client.put(
+                            "/users/me/applications", headers=headers, json=body
+                        )
+                        for body in bodies
+                    )
+                )
+        return [response.status_code for response in responses]
+
+    codes = asyncio.run(fire())
+
+    assert set(codes) <= {200, 400, 409}
+    succeeded = [body for body, code in zip(bodies, codes) if code == 200]
+    assert len(succeeded) == modify_count
+    stored_count, stored_ids = stored_state(user.id)
+    assert stored_count == 0
+    outcomes = [
+        [app["universityId"] for app in body["applications"]] for body in succeeded
+    ]
+    assert stored_ids in outcomes
+    assert applicant_count_drift() == {}
+
+
+def test_post_commit_failure_keeps_success_response(
+    client, make_user, auth_headers, monkeypatch
+):
+    user = make_user(modify_count=2)
+    headers = auth_headers(user.uuid)
+
+    def broken_publish(*args, **kwargs):
+        raise RuntimeError("broker is down")
+
+    monkeypatch.setattr(user_service, "publish_application_update", broken_publish)
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([4])
+    )
+
+    # 커밋된 수정은 200이고, 캐시는 무효화되어 다음 수정도 DB 값으로 처리됩니다.
+    assert response.status_code == 200
+    assert stored_state(user.id) == (1, [4])
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([5])
+    )
+    assert response.status_code == 200
+    assert stored_state(user.id) == (0, [5])
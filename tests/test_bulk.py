@@ -0,0 +1,170 @@
+import csv
+
+import orjson
+import pytest
+from sqlalchemy import delete, select
+
+from app import cli
+from app.core.database import SessionLocal
+from app.models import models
+import app.services.university as university_service
+from app.services.university_catalog import (
+    catalog_holder,
+    catalog_statement,
+    catalog_version_statement,
+)
+from tests.test_application_updates import application_body
+
+# 다른 테스트의 대학과 겹치지 않는 ID
+UNIVERSITY_IDS = (3001, 3002)
+
+
+def stored_universities() -> dict[int, tuple]:
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(
+                models.PartnerUniversity.id,
+                models.PartnerUniversity.name,
+                models.PartnerUniversity.country,
+                models.PartnerUniversity.slot,
+                models.PartnerUniversity.duration,
+                models.PartnerUniversity.applicant_count,
+            ).where(models.PartnerUniversity.id.in_(UNIVERSITY_IDS))
+        ).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+@pytest.fixture
+def cleanup():
+    yield
+    with SessionLocal() as db:
+        db.execute(
+            delete(models.Application).where(
+                models.Application.partner_university_id.in_(UNIVERSITY_IDS)
+            )
+        )
+        db.execute(
+            delete(models.PartnerUniversity).where(
+                models.PartnerUniversity.id.in_(UNIVERSITY_IDS)
+            )
+        )
+        university_service.bump_catalog_version(db)
+        db.commit()
+        # 지운 대학이 이 워커의 카탈로그에 남아 다음 테스트에 보이지 않도록 바로 다시 읽습니다.
+        catalog_holder.install(
+            db.execute(catalog_version_statement()).scalar(),
+            db.execute(catalog_statement()).all(),
+        )
+
+
+def test_import_upserts_and_rejects_bad_rows(tmp_path, cleanup):
+    path = tmp_path / "universities.csv"
+    path.write_text(
+        "id,name,country,slot,duration\n"
+        "3001,Alpha University,캐나다,2,1개학기\n"
+        "3002,Beta University,독일,1,2개학기\n",
+        encoding="utf-8",
+    )
+    assert cli.main(["import-universities", str(path), "--chunk-size", "1"]) == 0
+    assert stored_universities() == {
+        3001: ("Alpha University", "캐나다", 2, "1개학기", 0),
+        3002: ("Beta University", "독일", 1, "2개학기", 0),
+    }
+
+    # JSONL로 같은 ID를 다시 등록하면 갱신합니다.
+    path = tmp_path / "universities.jsonl"
+    path.write_bytes(
+        orjson.dumps(
+            {
+                "id": 3001,
+                "name": "Alpha University",
+                "country": "캐나다",
+                "slot": 3,
+                "duration": "2개학기",
+            }
+        )
+        + b"\n"
+    )
+    assert cli.main(["import-universities", str(path)]) == 0
+    assert stored_universities()[3001] == ("Alpha University", "캐나다", 3, "2개학기", 0)
+
+    # 잘못된 행이 있거나 --dry-run이면 아무것도 바뀌지 않습니다.
+    path = tmp_path / "bad.csv"
+    path.write_text(
+        "id,name,country,slot,duration\n"
+        "3002,Beta University,독일,5,2개학기\n"
+        "3003,Gamma University,일본,x,1개학기\n",
+        encoding="utf-8",
+    )
+    before = stored_universities()
+    assert cli.main(["import-universities", str(path)]) == 1
+    path = tmp_path / "dry.csv"
+    path.write_text(
+        "id,name,country,slot,duration\n3002,Beta University,독일,5,2개학기\n",
+        encoding="utf-8",
+    )
+    assert cli.main(["import-universities", str(path), "--dry-run"]) == 0
+    assert stored_universities() == before
+
+
+def test_export_csv_and_jsonl_round_trip(
+    tmp_path, client, make_user, auth_headers, cleanup
+):
+    path = tmp_path / "universities.jsonl"
+    path.write_bytes(
+        b"".join(
+            orjson.dumps(
+                {
+                    "id": id_,
+                    "name": f"Export {id_}",
+                    "country": "미국",
+                    "slot": 1,
+                    "duration": "1개학기",
+                },
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+            for id_ in UNIVERSITY_IDS
+        )
+    )
+    assert cli.main(["import-universities", str(path)]) == 0
+    users = [make_user(grade=3.5), make_user(grade=4.1)]
+    for user in users:
+        headers = auth_headers(user.uuid)
+        response = client.put(
+            "/users/me/applications",
+            headers=headers,
+            json=application_body(list(UNIVERSITY_IDS)),
+        )
+        assert response.status_code == 200
+
+    csv_path, jsonl_path = tmp_path / "export.csv", tmp_path / "export.jsonl"
+    for path, chunk_size in ((csv_path, "2"), (jsonl_path, "3")):
+        argv = ["export-applications", "--output", str(path), "--chunk-size", chunk_size]
+        assert cli.main(argv) == 0
+
+    with open(csv_path, newline="", encoding="utf-8") as file:
+        csv_rows = list(csv.DictReader(file))
+    jsonl_rows = [orjson.loads(line) for line in jsonl_path.read_bytes().splitlines()]
+    # 같은 내용이며, CSV는 모든 값이 문자열입니다.
+    assert csv_rows == [
+        {key: str(value) for key, value in row.items()} for row in jsonl_rows
+    ]
+
+    exported = [
+        (
+            row["universityId"],
+            row["universityName"],
+            row["choice"],
+            row["userId"],
+            row["grade"],
+        )
+        for row in jsonl_rows
+        if row["universityId"] in UNIVERSITY_IDS
+    ]
+    # 대학별, 학점 내림차순
+    assert exported == [
+        (3001, "Export 3001", 1, users[1].id, 4.1),
+        (3001, "Export 3001", 1, users[0].id, 3.5),
+        (3002, "Export 3002", 2, users[1].id, 4.1),
+        (3002, "Export 3002", 2, users[0].id, 3.5),
+    ]
@@ -0,0 +1,55 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+import app.core.compression as compression
+
+BODY = b'{"applicants": "' + b"x" * 4000 + b'"}'
+
+
+def make_client(thread_size: int) -> TestClient:
+    async def endpoint(request):
+        size = int(request.query_params["size"])
+        return Response(BODY[:size], media_type="application/json")
+
+    app = Starlette(routes=[Route("/", endpoint)])
+    return TestClient(
+        compression.CompressionMiddleware(
+            app, minimum_size=100, thread_size=thread_size, encodings=("gzip",)
+        )
+    )
+
+
+@pytest.fixture
+def threaded(monkeypatch):
+    sizes = []
+    run_in_threadpool = compression.run_in_threadpool
+
+    async def recording(func, body, *args):
+        sizes.append(len(body))
+        return await run_in_threadpool(func, body, *args)
+
+    monkeypatch.setattr(compression, "run_in_threadpool", recording)
+    return sizes
+
+
+@pytest.mark.parametrize("size", [50, 500, len(BODY)])
+def test_compresses_above_minimum_size(threaded, size):
+    response = make_client(thread_size=1000).get(
+        f"/?size={size}", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.content == BODY[:size]
+    assert response.headers["Vary"] == "Accept-Encoding"
+    if size < 100:
+        assert "content-encoding" not in response.headers
+    else:
+        assert response.headers["Content-Encoding"] == "gzip"
+        raw = gzip.compress(BODY[:size], compresslevel=6, mtime=0)
+        assert int(response.headers["Content-Length"]) == len(raw)
+    # thread_size 이상인 본문만 스레드풀에서 압축합니다.
+    assert threaded == ([size] if size >= 1000 else [])
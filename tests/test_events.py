@@ -0,0 +1,35 @@
+import queue
+
+from app.core.events import InMemoryBroker, LocalSocketBroker
+
+
+def failing_callback(message: dict) -> None:
+    raise RuntimeError("subscriber bug")
+
+
+def test_memory_broker_isolates_failing_callback():
+    broker = InMemoryBroker()
+    received = []
+    broker.subscribe(failing_callback)
+    broker.subscribe(received.append)
+
+    # 발행한 쪽으로 예외가 올라오지 않고 다음 콜백도 호출됩니다.
+    broker.publish({"type": "test"})
+
+    assert received == [{"type": "test"}]
+
+
+def test_local_socket_broker_keeps_receiving_after_callback_error(tmp_path):
+    broker = LocalSocketBroker(str(tmp_path))
+    received = queue.Queue()
+    broker.subscribe(failing_callback)
+    broker.subscribe(received.put)
+    try:
+        broker.publish({"n": 1})
+        broker.publish({"n": 2})
+
+        assert received.get(timeout=5) == {"n": 1}
+        # 첫 메시지의 콜백 예외로 수신 스레드가 끝나지 않았습니다.
+        assert received.get(timeout=5) == {"n": 2}
+    finally:
+        broker.close()
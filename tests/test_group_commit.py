@@ -0,0 +1,236 @@
+import asyncio
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app.api.users as users_api
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.group_commit import (
+    AsyncGroupCommitQueue,
+    GroupCommitQueue,
+    GroupCommitQueueFullError,
+)
+from app.schemas.users import ApplicationChoice
+import app.services.application_writes as application_writes
+import app.services.user as user_service
+from tests.test_application_updates import application_body, stored_state
+
+
+class Rejected(Exception):
+    pass
+
+
+def apply_items(items: list) -> list:
+    """
+    음수는 그 항목만 실패, 0은 배치 전체 실패입니다.
+    """
+    if 0 in items and len(items) > 1:
+        raise RuntimeError("batch failed")
+    if items == [0]:
+        raise Rejected(0)
+    return [Rejected(item) if item < 0 else item * 10 for item in items]
+
+
+def test_sync_queue_batches_and_delivers_per_request():
+    batches = []
+    release = threading.Event()
+
+    def apply_batch(items):
+        batches.append(list(items))
+        # 첫 배치를 반영하는 동안 나머지 요청이 쌓이게 합니다.
+        release.wait(5)
+        return apply_items(items)
+
+    queue = GroupCommitQueue(
+        "test-sync", apply_batch, max_batch=10, max_wait_seconds=0, max_depth=100
+    )
+
+    def submit(item):
+        try:
+            return queue.submit(item)
+        except Rejected as error:
+            return error
+
+    with ThreadPoolExecutor(6) as pool:
+        first = pool.submit(submit, 1)
+        while not batches:
+            time.sleep(0.001)
+        rest = [pool.submit(submit, item) for item in (2, -3, 4, 5)]
+        while queue.depth < 4:
+            time.sleep(0.001)
+        release.set()
+        results = [first.result()] + [future.result() for future in rest]
+
+    assert batches == [[1], [2, -3, 4, 5]]
+    assert results[:2] == [10, 20]
+    assert isinstance(results[2], Rejected)
+    assert results[3:] == [40, 50]
+    asyncio.run(queue.close())
+
+
+def test_sync_queue_retries_one_by_one_after_batch_failure():
+    batches = []
+
+    def apply_batch(items):
+        batches.append(list(items))
+        return apply_items(items)
+
+    queue = GroupCommitQueue(
+        "test-sync-retry", apply_batch, max_batch=10, max_wait_seconds=0.2, max_depth=100
+    )
+
+    def submit(item):
+        try:
+            return queue.submit(item)
+        except Rejected as error:
+            return error
+
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(submit, item) for item in (1, 0, 2)]
+        results = [future.result() for future in futures]
+
+    # 배치가 실패하면 하나씩 다시 반영해 문제가 된 요청만 실패합니다.
+    assert len(batches[0]) == 3
+    assert sorted(map(len, batches[1:])) == [1, 1, 1]
+    assert results[0] == 10 and results[2] == 20
+    assert isinstance(results[1], Rejected)
+    asyncio.run(queue.close())
+
+
+def test_sync_queue_rejects_when_full_and_drains_on_close():
+    release = threading.Event()
+    started = threading.Event()
+
+    def apply_batch(items):
+        started.set()
+        release.wait(5)
+        return apply_items(items)
+
+    queue = GroupCommitQueue(
+        "test-sync-full", apply_batch, max_batch=1, max_wait_seconds=0, max_depth=1
+    )
+    with ThreadPoolExecutor(2) as pool:
+        first = pool.submit(queue.submit, 1)
+        started.wait(5)
+        second = pool.submit(queue.submit, 2)
+        while queue.depth < 1:
+            time.sleep(0.001)
+        with pytest.raises(GroupCommitQueueFullError):
+            queue.submit(3)
+        release.set()
+        # close는 남은 항목을 반영한 뒤 writer를 멈춥니다.
+        asyncio.run(queue.close())
+        assert first.result() == 10
+        assert second.result() == 20
+    with pytest.raises(RuntimeError):
+        queue.submit(4)
+
+
+def test_async_queue():
+    async def run():
+        batches = []
+        gate = asyncio.Event()
+
+        async def apply_batch(items):
+            batches.append(list(items))
+            await gate.wait()
+            return apply_items(items)
+
+        queue = AsyncGroupCommitQueue(
+            "test-async", apply_batch, max_batch=10, max_wait_seconds=0, max_depth=5
+        )
+        first = asyncio.ensure_future(queue.submit(1))
+        await asyncio.sleep(0.01)
+        rest = [asyncio.ensure_future(queue.submit(item)) for item in (2, -3, 0, 4, 5)]
+        await asyncio.sleep(0.01)
+        with pytest.raises(GroupCommitQueueFullError):
+            await queue.submit(6)
+        gate.set()
+        results = await asyncio.gather(first, *rest, return_exceptions=True)
+
+        # [1], 이어서 [2, -3, 0, 4, 5]가 실패하여 하나씩 다시 반영
+        assert batches[:2] == [[1], [2, -3, 0, 4, 5]]
+        assert [len(batch) for batch in batches[2:]] == [1] * 5
+        assert results[0] == 10 and results[1] == 20
+        assert isinstance(results[2], Rejected) and isinstance(results[3], Rejected)
+        assert results[4:] == [40, 50]
+
+        pending = asyncio.ensure_future(queue.submit(7))
+        await asyncio.sleep(0)
+        await queue.close()
+        assert pending.done() and pending.result() == 70
+
+    asyncio.run(run())
+
+
+def test_same_user_requests_in_one_batch_apply_in_order(make_user):
+    user = make_user(modify_count=2)
+    updates = [
+        user_service.ApplicationUpdate(user.id, [ApplicationChoice(universityId=1, choice=1)]),
+        user_service.ApplicationUpdate(
+            user.id,
+            [
+                ApplicationChoice(universityId=2, choice=1),
+                ApplicationChoice(universityId=3, choice=2),
+            ],
+        ),
+    ]
+    with SessionLocal() as db:
+        results = user_service.apply_application_updates(db, updates)
+        db.commit()
+
+    # 파이프라인을 끈 경우처럼 두 요청 모두 차례로 반영됩니다.
+    assert all(isinstance(result, user_service.ApplicationChanges) for result in results)
+    assert results[1].updated == [(1, 1, 2)]
+    assert results[1].inserted == [(2, 3)]
+    assert stored_state(user.id) == (0, [2, 3])
+
+
+def test_pipeline_queue_full_returns_503(client, make_user, auth_headers, monkeypatch):
+    user = make_user()
+    headers = auth_headers(user.uuid)
+
+    def full(pending):
+        raise GroupCommitQueueFullError()
+
+    monkeypatch.setattr(
+        users_api, "settings", dataclasses.replace(settings, application_write_pipeline=True)
+    )
+    monkeypatch.setattr(application_writes, "submit_application_update", full)
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([1])
+    )
+
+    assert response.status_code == 503
+    assert stored_state(user.id) == (4, [])
+
+
+def test_pipeline_applies_update(client, make_user, auth_headers, monkeypatch):
+    user = make_user(modify_count=1)
+    headers = auth_headers(user.uuid)
+    monkeypatch.setattr(
+        users_api, "settings", dataclasses.replace(settings, application_write_pipeline=True)
+    )
+    # 앞선 테스트 클라이언트의 lifespan 종료에서 닫힌 큐 대신 새 큐를 씁니다.
+    monkeypatch.setattr(
+        application_writes,
+        "application_write_queue",
+        GroupCommitQueue(
+            "applications",
+            application_writes._apply_batch,
+            max_batch=10,
+            max_wait_seconds=0.001,
+            max_depth=10,
+        ),
+    )
+
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([6, 7])
+    )
+
+    assert response.status_code == 200
+    assert stored_state(user.id) == (0, [6, 7])
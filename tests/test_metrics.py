@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from app.core.metrics import _ValueFile, route_template
+
+METRICS_HEADERS = {"Authorization": "Bearer test-metrics-token"}
+
+
+def test_metrics_requires_token(client):
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+    assert client.get("/metrics", headers=METRICS_HEADERS).status_code == 200
+
+
+def test_requests_are_recorded_by_route_template(client, make_user, auth_headers):
+    user = make_user()
+    headers = auth_headers(user.uuid)
+    assert client.get(f"/users/{user.id}", headers=headers).status_code == 200
+
+    text = client.get("/metrics", headers=METRICS_HEADERS).text
+
+    assert 'knu_http_requests_total{method="GET",route="/users/{user_id}",status="200"}' in text
+    assert 'knu_http_request_duration_seconds_count{method="GET",route="/users/{user_id}"}' in text
+
+
+@pytest.mark.parametrize(
+    "path, route_path, expected",
+    [
+        # fastapi 0.137 전에는 prefix가 포함된 전체 경로, 이후에는 include_router 안의 경로입니다.
+        ("/users/5", "/users/{user_id}", "/users/{user_id}"),
+        ("/users/5", "/{user_id}", "/users/{user_id}"),
+        ("/universities/3/me", "/{university_id}/me", "/universities/{university_id}/me"),
+        ("/universities", "", "/universities"),
+        ("/metrics", "/metrics", "/metrics"),
+    ],
+)
+def test_route_template_restores_router_prefix(path, route_path, expected):
+    assert route_template(path, route_path) == expected
+
+
+def test_observe_while_growing():
+    values = _ValueFile(None)
+    offsets = [values.offset(f"bucket{i}") for i in range(3)]
+    stop = threading.Event()
+    errors = []
+
+    def observe():
+        try:
+            while not stop.is_set():
+                values.observe(*offsets, 0.1)
+        except Exception as error:
+            errors.append(error)
+            raise
+
+    thread = threading.Thread(target=observe)
+    thread.start()
+    # 새 키가 늘어날 때마다 mmap을 키우고 이전 mmap을 닫습니다.
+    for i in range(20000):
+        values.offset(f"key-{i}-" + "x" * 32)
+    stop.set()
+    thread.join()
+
+    assert errors == []
@@ -0,0 +1,96 @@
+"""
+핫 쿼리의 실행 계획을 EXPLAIN으로 확인하여, application/user 테이블을 풀 스캔하면 실패합니다.
+
+기본은 conftest의 SQLite DB를 대상으로 합니다. MySQL에서도 확인하려면 데이터가 채워진 DB(bench/seed.py 등)를
+QUERY_PLAN_DATABASE_URL로 지정합니다. (MySQL 옵티마이저는 행이 거의 없는 테이블에서 풀 스캔을 고를 수 있습니다.)
+
+    QUERY_PLAN_DATABASE_URL=mysql+pymysql://...@localhost/knu uv run pytest tests/test_query_plans.py
+"""
+
+import os
+import re
+
+import pytest
+from sqlalchemy import create_engine, delete, func, select, text
+
+from app.core.database import get_engine
+from app.models import models
+from app.services.university import (
+    university_applicants_statement,
+    user_rank_statement,
+)
+from app.services.user import (
+    existing_applications_statement,
+    user_applications_statement,
+    user_choices_statement,
+)
+
+# 풀 스캔이 허용되지 않는 테이블 (별칭 포함)
+WATCHED_TABLES = {"application", "other_application", "user", "other_user"}
+
+HOT_QUERIES = {
+    "university detail": university_applicants_statement(1),
+    "university detail page": university_applicants_statement(1, limit=50, offset=100),
+    "university applicant count": select(func.count(models.Application.id)).where(
+        models.Application.partner_university_id == 1
+    ),
+    "my rank": user_rank_statement(1, 1),
+    "user profile": user_applications_statement([1]),
+    "user choices": user_choices_statement([1]),
+    "existing applications": existing_applications_statement([1]),
+    "delete user applications": delete(models.Application).where(
+        models.Application.user_id == 1
+    ),
+    "user application status": select(models.Application.id).where(
+        models.Application.user_id == 1,
+        models.Application.partner_university_id == 1,
+    ),
+    "grade order": select(models.User.id).order_by(models.User.grade.desc()).limit(50),
+}
+
+
+def full_scans(connection, statement) -> list[str]:
+    sql = str(
+        statement.compile(
+            dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+    if connection.dialect.name == "mysql":
+        rows = connection.execute(text(f"EXPLAIN {sql}")).mappings().all()
+        return [
+            row["table"]
+            for row in rows
+            if row["type"] == "ALL" and row["table"] in WATCHED_TABLES
+        ]
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    scans = []
+    for row in rows:
+        match = re.match(r"SCAN (\w+)", row[-1])
+        if match and "INDEX" not in row[-1] and match.group(1) in WATCHED_TABLES:
+            scans.append(match.group(1))
+    return scans
+
+
+@pytest.fixture(scope="module")
+def plan_engine():
+    url = os.environ.get("QUERY_PLAN_DATABASE_URL")
+    if not url:
+        yield get_engine()
+        return
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_index(plan_engine, name):
+    with plan_engine.connect() as connection:
+        assert full_scans(connection, HOT_QUERIES[name]) == []
+
+
+def test_full_scan_is_detected():
+    with get_engine().connect() as connection:
+        statement = select(models.Application.id).where(
+            models.Application.created_at > func.now()
+        )
+        assert full_scans(connection, statement) == ["application"]
@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core import query_stats
+from app.core.database import get_engine
+
+
+def test_failed_statement_does_not_leak_start_time():
+    stats = query_stats.RequestQueryStats()
+    token = query_stats._current_stats.set(stats)
+    try:
+        with get_engine().connect() as connection:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    connection.execute(text("SELECT * FROM no_such_table"))
+            connection.execute(text("SELECT 1"))
+            # 실패한 SQL 문의 시작 시각이 연결에 남아 다음 SQL 문의 시간이 되지 않습니다.
+            assert "query_start_time" not in connection.info
+    finally:
+        query_stats._current_stats.reset(token)
+
+    assert stats.count == 1
+    assert stats.slowest_statement == "SELECT 1"
+
+
+def test_server_timing_counts_request_queries(client, make_user, auth_headers):
+    headers = auth_headers(make_user().uuid)
+    response = client.get("/users/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="0 queries"' not in response.headers["Server-Timing"]
@@ -0,0 +1,60 @@
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimit,
+    client_ip,
+    parse_trusted_proxies,
+)
+
+PROXIES = parse_trusted_proxies(["10.0.0.0/8", "127.0.0.1"])
+
+
+def make_request(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = []
+    if forwarded_for is not None:
+        headers.append((b"x-forwarded-for", forwarded_for.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/auth/token",
+            "headers": headers,
+            "client": (peer, 50000),
+        }
+    )
+
+
+def test_client_ip_ignores_forwarded_for_from_untrusted_peer():
+    request = make_request("203.0.113.7", "198.51.100.1")
+    assert client_ip(request, PROXIES) == "203.0.113.7"
+
+
+def test_client_ip_uses_nearest_untrusted_forwarded_address():
+    # 클라이언트가 보낸 198.51.100.1은 위조일 수 있으므로 프록시가 붙인 주소를 사용합니다.
+    request = make_request("10.0.0.2", "198.51.100.1, 203.0.113.9, 10.0.0.1")
+    assert client_ip(request, PROXIES) == "203.0.113.9"
+
+
+def test_client_ip_without_trusted_proxies():
+    request = make_request("10.0.0.2", "203.0.113.9")
+    assert client_ip(request) == "10.0.0.2"
+
+
+def test_rate_limit_is_per_forwarded_client():
+    limit = RateLimit(
+        store=InMemoryRateLimitStore(),
+        scope="test",
+        capacity=2,
+        refill_per_second=0.001,
+        trusted_proxies=PROXIES,
+    )
+    for _ in range(2):
+        limit(make_request("10.0.0.2", "203.0.113.1"))
+    with pytest.raises(HTTPException) as error:
+        limit(make_request("10.0.0.2", "203.0.113.1"))
+    assert error.value.status_code == 429
+    # 같은 프록시를 거쳐도 다른 클라이언트는 따로 제한합니다.
+    limit(make_request("10.0.0.2", "203.0.113.2"))
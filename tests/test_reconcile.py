@@ -0,0 +1,56 @@
+from sqlalchemy import event, select, update
+
+from app.core.database import SessionLocal
+from app.models import models
+import app.services.university as university_service
+
+UNIVERSITY_ID = 10
+
+
+def stored_count(db) -> int:
+    return db.execute(
+        select(models.PartnerUniversity.applicant_count).where(
+            models.PartnerUniversity.id == UNIVERSITY_ID
+        )
+    ).scalar_one()
+
+
+def test_reconcile_keeps_updates_made_after_counting():
+    with SessionLocal() as db:
+        actual = db.execute(
+            select(models.Application.id).where(
+                models.Application.partner_university_id == UNIVERSITY_ID
+            )
+        ).all()
+        db.execute(
+            update(models.PartnerUniversity)
+            .where(models.PartnerUniversity.id == UNIVERSITY_ID)
+            .values(applicant_count=len(actual) + 2)
+        )
+        db.commit()
+
+        connection = db.connection()
+        applied = []
+
+        # 집계를 마친 뒤 보정 UPDATE 직전에 다른 요청이 지원자를 한 명 더한 경우
+        def concurrent_apply(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE partner_university") and not applied:
+                applied.append(True)
+                cursor.execute(
+                    "UPDATE partner_university SET applicant_count = applicant_count + 1 "
+                    "WHERE id = ?",
+                    (UNIVERSITY_ID,),
+                )
+
+        event.listen(connection, "before_cursor_execute", concurrent_apply)
+        try:
+            drift = university_service.reconcile_applicant_counts(db)
+        finally:
+            event.remove(connection, "before_cursor_execute", concurrent_apply)
+
+        assert drift[UNIVERSITY_ID] == (len(actual) + 2, len(actual))
+        assert stored_count(db) == len(actual) + 1
+        db.rollback()
+
+        university_service.reconcile_applicant_counts(db)
+        db.commit()
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.events import broker
+from app.core.replicas import ReplicaRouter
+from tests.test_application_updates import application_body
+
+
+@pytest.fixture
+def replicas(tmp_path, monkeypatch):
+    """
+    (정상 복제본, 연결할 수 없는 복제본) 엔진을 등록한 라우터로 바꿉니다.
+    """
+    database.init_engines()
+    engines = [
+        create_engine(f"sqlite:///{tmp_path}/replica.db"),
+        create_engine(f"sqlite:///{tmp_path}/missing/replica.db"),
+    ]
+    router = ReplicaRouter(broker, sticky_seconds=60, retry_seconds=60)
+    router.attach(engines)
+    monkeypatch.setattr(database, "replica_router", router)
+    monkeypatch.setattr(database, "replica_engines", engines)
+    monkeypatch.setattr(
+        database, "ReplicaSessionLocals", [sessionmaker(bind=engine) for engine in engines]
+    )
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def read_bind(user_id: int | None):
+    with database.open_read_session(user_id) as db:
+        return db.get_bind()
+
+
+def test_unavailable_replica_falls_back_to_primary(replicas):
+    good, _ = replicas
+
+    # 라운드 로빈: 정상 복제본, 연결 확인에 실패한 복제본(이번 요청은 primary)
+    assert read_bind(None) is good
+    assert read_bind(None) is database.engine
+    # 실패한 복제본은 retry_seconds 동안 건너뜁니다.
+    assert [read_bind(None) for _ in range(4)] == [good] * 4
+    assert database.replica_router.stats()["down"] == [1]
+
+
+def test_all_replicas_down_reads_primary(replicas):
+    for index in range(len(replicas)):
+        database.replica_router.mark_down(index)
+
+    assert read_bind(None) is database.engine
+
+
+def test_writer_sticks_to_primary(client, make_user, auth_headers, replicas):
+    good, _ = replicas
+    database.replica_router.mark_down(1)
+    writer = make_user()
+    reader = make_user()
+    headers = auth_headers(writer.uuid)
+    assert read_bind(writer.id) is good
+
+    response = client.put(
+        "/users/me/applications", headers=headers, json=application_body([10])
+    )
+    assert response.status_code == 200
+
+    # 수정한 사용자는 sticky_seconds 동안 primary에서 읽고, 다른 사용자는 계속 복제본에서 읽습니다.
+    assert read_bind(writer.id) is database.engine
+    assert read_bind(reader.id) is good
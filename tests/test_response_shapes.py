@@ -0,0 +1,55 @@
+"""
+orjson으로 바로 직렬화하는 응답이 response_model(pydantic)로 직렬화한 결과와 같은지 확인합니다.
+"""
+
+import dataclasses
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.core import responses
+from app.core.config import settings
+from app.schemas.universities import (
+    MyRankResponse,
+    PartnerUniversityInfo,
+    UniversityDetailResponse,
+)
+from app.schemas.users import PublicUserResponse, UserResponse
+import app.services.university as university_service
+from tests.test_application_updates import application_body
+
+
+@pytest.fixture
+def validate_responses(monkeypatch):
+    monkeypatch.setattr(
+        responses, "settings", dataclasses.replace(settings, validate_responses=True)
+    )
+    # 검증 없이 만들어 둔 캐시 응답을 쓰지 않도록 버전을 올립니다.
+    university_service.invalidate_universities_payload()
+
+
+def test_fast_responses_match_response_models(
+    client, make_user, auth_headers, validate_responses
+):
+    user = make_user(grade=3.7)
+    headers = auth_headers(user.uuid)
+    assert (
+        client.put("/users/me/applications", headers=headers, json=application_body([5, 6]))
+    ).status_code == 200
+
+    cases = [
+        ("GET", "/universities", None, list[PartnerUniversityInfo]),
+        ("GET", "/universities/5", None, UniversityDetailResponse),
+        ("GET", "/universities/5?limit=1&offset=0", None, UniversityDetailResponse),
+        ("GET", "/universities/5/me", None, MyRankResponse),
+        ("GET", "/users/me", None, UserResponse),
+        ("GET", f"/users/{user.id}", None, PublicUserResponse),
+        ("POST", "/users/batch", {"userIds": [user.id]}, list[PublicUserResponse]),
+    ]
+    for method, path, body, schema in cases:
+        # VALIDATE_RESPONSES=true이면 스키마와 다른 응답은 검증 오류로 실패합니다.
+        response = client.request(method, path, headers=headers, json=body)
+        assert response.status_code == 200, path
+        content = response.json()
+        adapter = TypeAdapter(schema)
+        assert adapter.dump_python(adapter.validate_python(content), mode="json") == content, path
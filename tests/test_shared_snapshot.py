@@ -0,0 +1,167 @@
+import mmap
+import os
+import time
+
+import pytest
+from sqlalchemy import select
+
+from app.core import shared_snapshot
+from app.core.database import SessionLocal
+from app.core.shared_snapshot import SharedSnapshot
+from app.models import models
+from app.services.applicant_snapshot import (
+    ApplicantSnapshot,
+    RankEntry,
+    encode_snapshot,
+    parse_counts,
+    parse_rank,
+)
+import app.services.university as university_service
+
+COUNT_ROWS = [(1, 3), (2, 1), (5, 0)]
+# grades_statement() 순서: 대학ID, 학점 내림차순, 사용자 ID
+GRADE_ROWS = [
+    (1, 4.0, 7, 1),
+    (1, 3.5, 2, 2),
+    (1, 3.5, 9, 1),
+    (2, 3.0, 4, 3),
+]
+
+
+def set_seq(path: str, seq: int) -> None:
+    """
+    쓰는 중인 것처럼 헤더의 seq만 바꿉니다.
+    """
+    fd = os.open(path, os.O_RDWR)
+    try:
+        with mmap.mmap(fd, shared_snapshot.HEADER_SIZE) as data:
+            shared_snapshot._SEQ.pack_into(data, shared_snapshot._SEQ_OFFSET, seq)
+    finally:
+        os.close(fd)
+
+
+def get_seq(path: str) -> int:
+    with open(path, "rb") as file:
+        header = file.read(shared_snapshot.HEADER_SIZE)
+    return shared_snapshot._SEQ.unpack_from(header, shared_snapshot._SEQ_OFFSET)[0]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    snapshot = SharedSnapshot(str(tmp_path / "snapshot"))
+    assert snapshot.try_acquire_writer()
+    yield snapshot
+    snapshot.release_writer()
+
+
+def test_write_then_read(snapshot):
+    taken_at = time.time()
+    generation = snapshot.write(encode_snapshot(COUNT_ROWS, GRADE_ROWS), taken_at)
+    reader = SharedSnapshot(snapshot.path)
+
+    header, counts = reader.read(parse_counts)
+    assert (header.generation, header.taken_at) == (generation, taken_at)
+    assert counts == {1: 3, 2: 1, 5: 0}
+    assert reader.read(lambda body: parse_rank(body, 1, 9, 3.5))[1] == RankEntry(1, 3, 3)
+    assert reader.read(lambda body: parse_rank(body, 1, 2, 3.5))[1] == RankEntry(2, 2, 3)
+    # 정렬 배열에 없는 사용자/대학, 학점이 바뀐 사용자
+    assert reader.read(lambda body: parse_rank(body, 5, 9, 3.5))[1] is None
+    assert reader.read(lambda body: parse_rank(body, 3, 9, 3.5))[1] is None
+    assert reader.read(lambda body: parse_rank(body, 1, 9, 3.9))[1] is None
+
+    # 본문이 같으면 generation을 유지하고, 바뀌면 올립니다.
+    assert snapshot.write(encode_snapshot(COUNT_ROWS, GRADE_ROWS), taken_at + 1) == generation
+    assert reader.header().taken_at == taken_at + 1
+    assert snapshot.write(encode_snapshot(COUNT_ROWS), taken_at + 2) == generation + 1
+    assert reader.read(parse_counts)[1] == {1: 3, 2: 1, 5: 0}
+    assert reader.read(lambda body: parse_rank(body, 1, 9, 3.5))[1] is None
+    assert get_seq(snapshot.path) % 2 == 0
+
+
+def test_reader_gives_up_while_sequence_is_odd(snapshot):
+    snapshot.write(encode_snapshot(COUNT_ROWS), time.time())
+    seq = get_seq(snapshot.path)
+    reader = SharedSnapshot(snapshot.path)
+
+    set_seq(snapshot.path, seq + 1)
+    assert reader.header() is None
+    assert reader.read(parse_counts) is None
+    # 쓰는 중인 스냅샷은 쓰지 않으므로 DB로 조회합니다.
+    applicant_snapshot = ApplicantSnapshot(snapshot.path, 60, grades=False)
+    assert applicant_snapshot.get_counts(None) is None
+
+    set_seq(snapshot.path, seq + 2)
+    assert reader.read(parse_counts)[1] == {1: 3, 2: 1, 5: 0}
+
+
+def test_reader_retries_when_written_during_parse(snapshot):
+    snapshot.write(encode_snapshot(COUNT_ROWS), time.time())
+    seq = get_seq(snapshot.path)
+    calls = []
+
+    def torn_parse(body):
+        calls.append(len(calls))
+        if len(calls) == 1:
+            # 본문을 읽는 사이에 다른 프로세스의 쓰기가 끝났습니다.
+            set_seq(snapshot.path, seq + 2)
+            raise ValueError("torn body")
+        return parse_counts(body)
+
+    assert SharedSnapshot(snapshot.path).read(torn_parse)[1] == {1: 3, 2: 1, 5: 0}
+    assert calls == [0, 1]
+
+    # seq가 그대로인데 parse가 실패하면 재시도하지 않고 예외를 올립니다.
+    def broken_parse(body):
+        raise ValueError("bug")
+
+    with pytest.raises(ValueError):
+        SharedSnapshot(snapshot.path).read(broken_parse)
+
+
+def db_applicant_count(university_id: int) -> int:
+    with SessionLocal() as db:
+        return db.execute(
+            select(models.PartnerUniversity.applicant_count).where(
+                models.PartnerUniversity.id == university_id
+            )
+        ).scalar_one()
+
+
+def test_endpoints_fall_back_to_db_when_user_wrote_after_snapshot(
+    client, make_user, auth_headers, tmp_path, monkeypatch
+):
+    applicant_snapshot = ApplicantSnapshot(str(tmp_path / "snapshot"), 60, grades=True)
+    monkeypatch.setattr(university_service, "applicant_snapshot", applicant_snapshot)
+    user = make_user(grade=3.0)
+    other = make_user(grade=3.0)
+    headers = auth_headers(user.uuid)
+    count_rows = [(i, 100 + i) for i in range(1, 11)]
+    grade_rows = [(1, 3.0, user.id, 1)]
+    snapshot = applicant_snapshot.snapshot
+    assert snapshot.try_acquire_writer()
+    try:
+        applicant_snapshot.write(count_rows, grade_rows, time.time() - 1)
+
+        # 스냅샷의 값 (DB에는 이 사용자의 지원 내역이 없습니다.)
+        universities = client.get("/universities", headers=headers).json()
+        assert universities[0]["applicantCount"] == 101
+        rank = client.get("/universities/1/me", headers=headers)
+        assert rank.status_code == 200
+        assert rank.json()["totalApplicants"] == 101
+
+        # 스냅샷을 만든 뒤에 수정한 사용자에게는 DB 결과를 보여 줍니다.
+        applicant_snapshot.mark_written(user.id)
+        universities = client.get("/universities", headers=headers).json()
+        assert universities[0]["applicantCount"] == db_applicant_count(1)
+        assert client.get("/universities/1/me", headers=headers).status_code == 404
+        # 다른 사용자는 계속 스냅샷을 봅니다.
+        other_headers = auth_headers(other.uuid)
+        universities = client.get("/universities", headers=other_headers).json()
+        assert universities[0]["applicantCount"] == 101
+
+        # 오래된 스냅샷은 누구에게도 쓰지 않습니다.
+        applicant_snapshot.write(count_rows, grade_rows, time.time() - 120)
+        universities = client.get("/universities", headers=other_headers).json()
+        assert universities[0]["applicantCount"] == db_applicant_count(1)
+    finally:
+        snapshot.release_writer()
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import AsyncSingleFlight
+
+
+def test_followers_get_result_when_leader_is_cancelled():
+    async def run():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "payload"
+
+        leader = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+
+        # 먼저 들어온 요청의 클라이언트가 연결을 끊은 경우
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == "payload"
+        assert calls == 1
+        assert flight.shared == 1
+
+    asyncio.run(run())
@@ -0,0 +1,123 @@
+import random
+
+from app.core.events import InMemoryBroker
+from app.services.standings import Standings, StandingsEngine
+
+UNIVERSITIES = [(1, "A", 2), (2, "B", 1), (3, "C", 3), (4, "D", 0), (5, "E", 1)]
+
+
+def rows_for(users: dict[int, tuple[float, list[int]]]) -> list[tuple[int, float, int]]:
+    """
+    standings_applications_statement()와 같은 (user_id, grade, 대학ID) 행 (사용자ID, choice 순)
+    """
+    return [
+        (user_id, grade, university_id)
+        for user_id, (grade, choices) in sorted(users.items())
+        for university_id in choices
+    ]
+
+
+def state(standings: Standings) -> tuple:
+    return (
+        standings.order,
+        standings.grades,
+        standings.choices,
+        standings.applicants,
+        standings.admitted,
+        standings.assignment,
+    )
+
+
+def random_choices(rng: random.Random) -> list[int]:
+    ids = [id_ for id_, _, _ in UNIVERSITIES]
+    return rng.sample(ids, rng.randint(0, 3))
+
+
+def test_incremental_updates_match_rebuild():
+    rng = random.Random(14)
+    # 동점이 자주 나오도록 학점 후보를 적게 둡니다.
+    grades = [3.0, 3.5, 4.0, 4.3]
+    users = {
+        user_id: (rng.choice(grades), random_choices(rng)) for user_id in range(1, 30)
+    }
+    users = {user_id: value for user_id, value in users.items() if value[1]}
+    standings = Standings.build(UNIVERSITIES, rows_for(users))
+
+    for _ in range(500):
+        user_id = rng.randint(1, 35)
+        grade = rng.choice(grades)
+        choices = random_choices(rng)
+        standings.set_user(user_id, grade, choices)
+        if choices:
+            users[user_id] = (grade, choices)
+        else:
+            users.pop(user_id, None)
+
+        assert state(standings) == state(Standings.build(UNIVERSITIES, rows_for(users)))
+
+
+def test_set_user_is_idempotent():
+    standings = Standings.build(UNIVERSITIES, rows_for({1: (4.0, [1, 2]), 2: (3.0, [1])}))
+    standings.set_user(3, 3.5, [1, 3])
+    before = state(standings)
+    standings.set_user(3, 3.5, [1, 3])
+    assert state(standings) == before
+
+
+def test_cutoff_and_rank_at_slot_boundary_with_ties():
+    # A(정원 2)에 4.0, 3.5(ID 2), 3.5(ID 3), 3.0이 1지망, 동점은 ID가 작은 쪽이 앞섭니다.
+    users = {
+        1: (4.0, [1]),
+        2: (3.5, [1, 3]),
+        3: (3.5, [1, 3]),
+        4: (3.0, [1, 3]),
+    }
+    standings = Standings.build(UNIVERSITIES, rows_for(users))
+
+    third = standings.user_standings(3, 3.5)
+    assert third.projectedUniversityId == 3
+    first_choice = third.choices[0]
+    assert (first_choice.rank, first_choice.applicants) == (3, 4)
+    assert first_choice.cutoffGrade == 3.5
+    assert first_choice.projectedCutoffGrade == 3.5
+    assert first_choice.projectedAdmitted is False
+    assert third.choices[1].projectedAdmitted is True
+    assert standings.user_standings(2, 3.5).projectedUniversityId == 1
+
+    # ID 3의 학점이 오르면 ID 2가 정원 밖으로 밀려 2지망(C)으로 갑니다.
+    standings.set_user(3, 3.6, [1, 3])
+    assert standings.user_standings(3, 3.6).projectedUniversityId == 1
+    assert standings.user_standings(2, 3.5).projectedUniversityId == 3
+    assert standings.user_standings(1, 4.0).choices[0].cutoffGrade == 3.6
+
+    # 지원자가 정원과 같으면 커트라인이 없습니다.
+    standings.set_user(4, 3.0, [])
+    standings.set_user(2, 3.5, [3])
+    first_choice = standings.user_standings(1, 4.0).choices[0]
+    assert first_choice.applicants == 2
+    assert first_choice.cutoffGrade is None
+    assert first_choice.projectedCutoffGrade == 3.6
+
+
+def test_zero_slot_university_admits_nobody():
+    standings = Standings.build(UNIVERSITIES, rows_for({1: (4.5, [4, 5])}))
+    result = standings.user_standings(1, 4.5)
+    assert result.projectedUniversityId == 5
+    assert result.choices[0].projectedCutoffGrade is None
+    assert result.choices[0].projectedAdmitted is False
+
+
+def test_engine_replays_updates_received_during_rebuild():
+    engine = StandingsEngine(InMemoryBroker(), max_age_seconds=60)
+    users = {1: (4.0, [2]), 2: (3.0, [2, 3])}
+    rebuild = engine.begin_rebuild()
+    # DB를 읽은 뒤, 교체하기 전에 도착한 변경
+    rows = rows_for(users)
+    engine.broker.publish(
+        {"type": "applications_updated", "user_id": 1, "grade": 4.0, "choices": [3]}
+    )
+    engine.finish_rebuild(rebuild, UNIVERSITIES, rows)
+
+    assert engine.user_standings(1, 4.0).projectedUniversityId == 3
+    assert engine.user_standings(2, 3.0).projectedUniversityId == 2
+    assert not engine.needs_rebuild()
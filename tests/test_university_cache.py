@@ -0,0 +1,79 @@
+import gzip
+
+from starlette.requests import Request
+
+from app.core.responses import cached_json_response, make_cached_payload
+from tests.test_application_updates import application_body
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def make_request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        }
+    )
+
+
+def test_universities_etag_and_304(client, make_user, auth_headers):
+    headers = {**auth_headers(make_user().uuid), **IDENTITY}
+    first = client.get("/universities", headers=headers)
+    etag = first.headers["ETag"]
+
+    cached = client.get("/universities", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    other = client.get("/universities", headers={**headers, "If-None-Match": '"other"'})
+    assert other.status_code == 200
+    assert other.content == first.content
+
+    # 지원 내역이 바뀌면 (같은 워커에서는 즉시) 새 본문과 ETag를 보냅니다.
+    assert (
+        client.put("/users/me/applications", headers=headers, json=application_body([1]))
+    ).status_code == 200
+    updated = client.get("/universities", headers={**headers, "If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] != etag
+    before = {row["id"]: row["applicantCount"] for row in first.json()}
+    after = {row["id"]: row["applicantCount"] for row in updated.json()}
+    assert after[1] == before[1] + 1
+
+
+def test_university_detail_etag_and_304(client, make_user, auth_headers):
+    headers = {**auth_headers(make_user().uuid), **IDENTITY}
+    first = client.get("/universities/2?limit=5", headers=headers)
+    etag = first.headers["ETag"]
+
+    cached = client.get("/universities/2?limit=5", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    # 페이지가 다르면 다른 본문입니다.
+    other_page = client.get(
+        "/universities/2?limit=5&offset=5", headers={**headers, "If-None-Match": etag}
+    )
+    assert other_page.status_code == 200
+
+
+def test_precompressed_representation_has_own_etag():
+    body = b"[" + b"1," * 1000 + b"1]"
+    payload = make_cached_payload(body)
+
+    response = cached_json_response(make_request({"Accept-Encoding": "gzip"}), payload)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == f'{payload.etag[:-1]}-gzip"'
+    assert gzip.decompress(response.body) == body
+
+    etag = response.headers["ETag"]
+    cached = cached_json_response(
+        make_request({"Accept-Encoding": "gzip", "If-None-Match": etag}), payload
+    )
+    assert cached.status_code == 304
+    # 압축하지 않은 표현에는 압축본의 ETag가 맞지 않습니다.
+    plain = cached_json_response(make_request({"If-None-Match": etag}), payload)
+    assert plain.status_code == 200
+    assert plain.body == body
+    assert plain.headers["ETag"] == payload.etag
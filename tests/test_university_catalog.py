@@ -0,0 +1,58 @@
+from sqlalchemy import delete, insert
+
+from app.core.database import SessionLocal
+from app.models import models
+import app.services.university as university_service
+from app.services.university_catalog import catalog_holder
+
+# 다른 테스트의 대학(1..UNIVERSITY_COUNT)과 겹치지 않는 ID
+UNIVERSITY_ID = 1001
+
+
+def test_university_added_without_version_bump(client, make_user, auth_headers):
+    headers = auth_headers(make_user().uuid)
+    # 카탈로그를 먼저 읽어 둡니다.
+    assert client.get("/universities/1", headers=headers).status_code == 200
+    loads = catalog_holder.loads
+
+    # README의 수동 등록처럼 버전을 올리지 않고 추가
+    with SessionLocal() as db:
+        db.execute(
+            insert(models.PartnerUniversity).values(
+                id=UNIVERSITY_ID,
+                name="Manually Added University",
+                country="캐나다",
+                slot=1,
+                duration="1개학기",
+            )
+        )
+        db.commit()
+    try:
+        response = client.get(f"/universities/{UNIVERSITY_ID}", headers=headers)
+        assert response.status_code == 200
+        assert catalog_holder.loads == loads + 1
+
+        response = client.put(
+            "/users/me/applications",
+            headers=headers,
+            json={"applications": [{"universityId": UNIVERSITY_ID, "choice": 1}]},
+        )
+        assert response.status_code == 200
+
+        # 없는 ID는 카탈로그를 다시 읽지 않습니다.
+        assert client.get("/universities/999999", headers=headers).status_code == 404
+        assert catalog_holder.loads == loads + 1
+    finally:
+        with SessionLocal() as db:
+            db.execute(
+                delete(models.Application).where(
+                    models.Application.partner_university_id == UNIVERSITY_ID
+                )
+            )
+            db.execute(
+                delete(models.PartnerUniversity).where(
+                    models.PartnerUniversity.id == UNIVERSITY_ID
+                )
+            )
+            university_service.bump_catalog_version(db)
+            db.commit()
@@ -0,0 +1,84 @@
+import pytest
+
+from app.api.universities import MAX_APPLICANTS_PAGE_SIZE
+from tests.test_application_updates import application_body
+
+UNIVERSITY_ID = 9
+
+
+@pytest.fixture
+def applicants(client, make_user, auth_headers):
+    """
+    UNIVERSITY_ID에 지원한 사용자 셋의 헤더입니다. (학점 동점 포함)
+    """
+    headers = []
+    for grade, university_ids in (
+        (4.2, [UNIVERSITY_ID]),
+        (3.9, [3, UNIVERSITY_ID]),
+        (3.9, [UNIVERSITY_ID]),
+    ):
+        user_headers = auth_headers(make_user(grade=grade).uuid)
+        response = client.put(
+            "/users/me/applications",
+            headers=user_headers,
+            json=application_body(university_ids),
+        )
+        assert response.status_code == 200
+        headers.append(user_headers)
+    return headers
+
+
+@pytest.mark.parametrize(
+    "query", ["limit=0", f"limit={MAX_APPLICANTS_PAGE_SIZE + 1}", "offset=-1"]
+)
+def test_page_limits(client, make_user, auth_headers, query):
+    headers = auth_headers(make_user().uuid)
+    response = client.get(f"/universities/{UNIVERSITY_ID}?{query}", headers=headers)
+
+    assert response.status_code == 422
+
+
+def test_pages_match_full_list(client, applicants):
+    full = client.get(f"/universities/{UNIVERSITY_ID}", headers=applicants[0]).json()
+    total = full["totalApplicants"]
+    assert total == len(full["applicants"]) >= 3
+    assert [row["rank"] for row in full["applicants"]] == list(range(1, total + 1))
+
+    for offset in range(total):
+        page = client.get(
+            f"/universities/{UNIVERSITY_ID}?limit=2&offset={offset}", headers=applicants[0]
+        ).json()
+        assert page["totalApplicants"] == total
+        assert page["applicants"] == full["applicants"][offset : offset + 2]
+
+    # 마지막 페이지를 넘어서도 전체 지원자 수는 그대로입니다.
+    past_end = client.get(
+        f"/universities/{UNIVERSITY_ID}?limit=2&offset={total}", headers=applicants[0]
+    ).json()
+    assert past_end["applicants"] == []
+    assert past_end["totalApplicants"] == total
+
+
+def test_my_rank_matches_full_list(client, make_user, auth_headers, applicants):
+    full = client.get(f"/universities/{UNIVERSITY_ID}", headers=applicants[0]).json()
+    ranks = {row["id"]: row for row in full["applicants"]}
+
+    for headers in applicants:
+        me = client.get("/users/me", headers=headers).json()
+        response = client.get(f"/universities/{UNIVERSITY_ID}/me", headers=headers)
+        assert response.status_code == 200
+        my_rank = response.json()
+        assert my_rank["rank"] == ranks[me["id"]]["rank"]
+        assert my_rank["choice"] == ranks[me["id"]]["choice"]
+        assert my_rank["totalApplicants"] == full["totalApplicants"]
+        assert my_rank["slot"] == full["slot"]
+
+    # 학점이 같으면 ID가 작은 사용자가 앞섭니다.
+    second, third = (
+        client.get(f"/universities/{UNIVERSITY_ID}/me", headers=headers).json()["rank"]
+        for headers in applicants[1:]
+    )
+    assert second < third
+
+    headers = auth_headers(make_user().uuid)
+    assert client.get(f"/universities/{UNIVERSITY_ID}/me", headers=headers).status_code == 404
@@ -0,0 +1,90 @@
+from sqlalchemy import select
+
+from app.core import query_stats
+from app.core.database import SessionLocal
+from app.models import models
+import app.services.user as user_service
+from tests.test_application_updates import application_body
+
+
+def counted(function, *args):
+    """
+    (반환값, 실행한 SQL 문 수)
+    """
+    stats = query_stats.RequestQueryStats()
+    token = query_stats._current_stats.set(stats)
+    try:
+        return function(*args), stats.count
+    finally:
+        query_stats._current_stats.reset(token)
+
+
+def stored_universities(university_ids: list[int]) -> dict[int, tuple]:
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(
+                models.PartnerUniversity.id,
+                models.PartnerUniversity.name,
+                models.PartnerUniversity.country,
+                models.PartnerUniversity.slot,
+                models.PartnerUniversity.applicant_count,
+            ).where(models.PartnerUniversity.id.in_(university_ids))
+        ).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def test_profile_is_one_query(make_user):
+    user = make_user()
+    with SessionLocal() as db:
+        profile, queries = counted(user_service.get_user_applications, db, user.id)
+        assert queries == 1
+        assert profile.applications == []
+        assert (profile.id, profile.email) == (user.id, user.email)
+        missing, queries = counted(user_service.get_user_applications, db, -1)
+        assert (missing, queries) == (None, 1)
+
+
+def test_me_and_public_profile(client, make_user, auth_headers):
+    user = make_user(modify_count=2)
+    headers = auth_headers(user.uuid)
+    university_ids = [4, 2, 8]
+    assert (
+        client.put(
+            "/users/me/applications", headers=headers, json=application_body(university_ids)
+        )
+    ).status_code == 200
+    universities = stored_universities(university_ids)
+    expected = [
+        {
+            "choice": choice,
+            "universityId": university_id,
+            "universityName": universities[university_id][0],
+            "country": universities[university_id][1],
+            "slot": universities[university_id][2],
+            "totalApplicants": universities[university_id][3],
+        }
+        for choice, university_id in enumerate(university_ids, 1)
+    ]
+
+    me = client.get("/users/me", headers=headers).json()
+    assert me == {
+        "id": user.id,
+        "email": user.email,
+        "nickname": user.nickname,
+        "grade": user.grade,
+        "lang": user.lang,
+        "modifyCount": 1,
+        "applications": expected,
+    }
+
+    # 다른 사용자가 보는 프로필에는 이메일과 수정 횟수가 없습니다.
+    other_headers = auth_headers(make_user().uuid)
+    public = client.get(f"/users/{user.id}", headers=other_headers).json()
+    assert public == {
+        "id": user.id,
+        "nickname": user.nickname,
+        "grade": user.grade,
+        "lang": user.lang,
+        "applications": expected,
+    }
+    assert client.get("/users/999999", headers=other_headers).status_code == 404
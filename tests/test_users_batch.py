@@ -0,0 +1,37 @@
+import pytest
+
+from app.schemas.users import MAX_USER_BATCH_SIZE
+
+
+@pytest.mark.parametrize(
+    "size, status_code", [(0, 422), (MAX_USER_BATCH_SIZE, 200), (MAX_USER_BATCH_SIZE + 1, 422)]
+)
+def test_batch_size_limit(client, make_user, auth_headers, size, status_code):
+    headers = auth_headers(make_user().uuid)
+    response = client.post(
+        "/users/batch", headers=headers, json={"userIds": list(range(1, size + 1))}
+    )
+
+    assert response.status_code == status_code
+
+
+def test_batch_keeps_order_and_skips_unknown_ids(client, make_user, auth_headers):
+    users = [make_user() for _ in range(3)]
+    headers = auth_headers(users[0].uuid)
+    user_ids = [users[2].id, 999999, users[0].id, users[2].id, users[1].id]
+
+    response = client.post("/users/batch", headers=headers, json={"userIds": user_ids})
+
+    assert response.status_code == 200
+    body = response.json()
+    # 요청 순서대로, 중복 없이, 없는 사용자는 빠집니다.
+    assert [user["id"] for user in body] == [users[2].id, users[0].id, users[1].id]
+    # /users/{id}와 같은 공개 프로필입니다.
+    assert body[0] == client.get(f"/users/{users[2].id}", headers=headers).json()
+    assert "email" not in body[0]
+
+    response = client.post(
+        "/users/batch", headers=headers, json={"userIds": [MAX_USER_BATCH_SIZE * 10**6]}
+    )
+    assert response.status_code == 200
+    assert response.json() == []